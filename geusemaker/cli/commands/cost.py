@@ -101,8 +101,10 @@ def cost(
     report_service = CostReportService()
 
     try:
+        selection = spot_selector.select_instance_type(config)
         estimate = estimator.estimate_deployment_cost(
             config=config,
+            selection=selection,
             storage_gb=storage_gb,
             data_transfer_gb=data_transfer_gb,
             cloudfront_requests=cloudfront_requests,
@@ -120,13 +122,13 @@ def cost(
             emit_result(error_payload, output_format)
         raise SystemExit(1)
 
-    selection = spot_selector.select_instance_type(config)
-    analysis = spot_selector.analyze_spot_prices(config.instance_type, config.region)
     budget_status = budget_service.check_budget(estimate, Decimal(str(budget))) if budget else None
     history = []
     report = report_service.build_report(estimate, runtime_hours=0.0, budget_status=budget_status, cost_history=history)
 
     if output_format == OutputFormat.TEXT:
+        # The spot market panel is text-only and meaningless for on-demand estimates.
+        analysis = spot_selector.analyze_spot_prices(config.instance_type, config.region) if config.use_spot else None
         render_pricing_summary(selection, analysis)
         render_cost_estimate(estimate)
         render_budget_status(budget_status)
@@ -144,7 +146,7 @@ def cost(
         data={
             "estimate": estimate.model_dump(mode="json"),
             "budget_status": budget_status.model_dump(mode="json") if budget_status else None,
-            "report": report.model_dump(mode="json"),
+            "report": report,
         },
     )
     emit_result(payload, output_format)
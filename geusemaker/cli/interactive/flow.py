@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -97,6 +98,13 @@ class DiscoveryFacade:
     def list_security_groups(self, vpc_id: str) -> list[SecurityGroupInfo]:
         return self._safe(lambda: self._sg_service.list_security_groups(vpc_id))
 
+    def list_vpc_resources(self, vpc_id: str) -> tuple[list[SubnetInfo], list[SecurityGroupInfo]]:
+        """Return the subnets and security groups of ``vpc_id``, discovering both at once."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            security_groups = pool.submit(self.list_security_groups, vpc_id)
+            subnets = self.list_subnets(vpc_id)
+            return subnets, security_groups.result()
+
     def list_key_pairs(self) -> list[KeyPairInfo]:
         return self._safe(self._kp_service.list_key_pairs)
 
@@ -461,8 +469,7 @@ class InteractiveFlow:
         if selected_vpc:
             self.state["vpc_id"] = selected_vpc.vpc_id
             with spinner("Discovering subnets and security groups"):
-                subnets = self._discovery.list_subnets(selected_vpc.vpc_id)
-                security_groups = self._discovery.list_security_groups(selected_vpc.vpc_id)
+                subnets, security_groups = self._discovery.list_vpc_resources(selected_vpc.vpc_id)
             tables.resource_table(subnets=subnets, security_groups=security_groups)
             public_subnets = [s for s in subnets if s.is_public]
             private_subnets = [s for s in subnets if not s.is_public]
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any
 
 from boto3 import Session  # type: ignore[import-untyped]
+from botocore.config import Config  # type: ignore[import-untyped]
 from botocore.exceptions import (  # type: ignore[import-untyped]
     BotoCoreError,
     NoCredentialsError,
@@ -13,6 +15,16 @@ from botocore.exceptions import (  # type: ignore[import-untyped]
 
 LOGGER = logging.getLogger(__name__)
 
+# Retries live in botocore (adaptive mode adds client-side rate limiting on
+# throttling); BaseService._safe_call only translates errors and never sleeps.
+# The pool covers the concurrent lookups and deletes, and keepalive keeps its idle
+# connections usable across long waits (CloudFront, EFS) instead of reconnecting.
+CLIENT_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    max_pool_connections=32,
+    tcp_keepalive=True,
+)
+
 
 class AWSClientFactory:
     """Factory for creating authenticated AWS clients."""
@@ -22,21 +34,28 @@ class AWSClientFactory:
     def __init__(self, profile_name: str | None = None):
         resolved_profile = profile_name if profile_name is not None else self._default_profile
         self._session = Session(profile_name=resolved_profile)
-        self._clients: dict[str, Any] = {}
+        self._clients: dict[tuple[str, str], Any] = {}
+        # Clients are thread-safe once built, but Session.client() is not.
+        self._lock = threading.Lock()
 
     def get_client(self, service: str, region: str = "us-east-1") -> Any:
         """Get or create a cached boto3 client."""
-        key = f"{service}:{region}"
-        if key not in self._clients:
-            try:
-                self._clients[key] = self._session.client(
-                    service_name=service,
-                    region_name=region,
-                )
-            except (BotoCoreError, NoCredentialsError) as exc:
-                LOGGER.error("Failed to create %s client: %s", service, exc)
-                raise
-        return self._clients[key]
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    try:
+                        client = self._clients[key] = self._session.client(
+                            service_name=service,
+                            region_name=region,
+                            config=CLIENT_CONFIG,
+                        )
+                    except (BotoCoreError, NoCredentialsError) as exc:
+                        LOGGER.error("Failed to create %s client: %s", service, exc)
+                        raise
+        return client
 
     def clear_cache(self) -> None:
         """Clear cached clients (useful for testing)."""
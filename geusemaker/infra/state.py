@@ -242,11 +242,28 @@ class StateManager:
 
     async def archive_deployment(self, state: DeploymentState) -> Path:
         """Write a deployment state snapshot to the archive directory."""
-        timestamp = int(state.updated_at.timestamp())
-        archive_file = self.archive_path / f"{state.stack_name}-{timestamp}.json"
+        archive_file = self._archive_file(state)
         await asyncio.to_thread(self._write_state, archive_file, state)
         return archive_file
 
+    async def retire_deployment(self, state: DeploymentState) -> Path:
+        """Archive the final state snapshot, then remove the live state file.
+
+        Both steps run on one worker thread, and the live file is only removed once
+        the archive copy has been written.
+        """
+        return await asyncio.to_thread(self._retire_state, state)
+
+    def _retire_state(self, state: DeploymentState) -> Path:
+        archive_file = self._archive_file(state)
+        self._write_state(archive_file, state)
+        self._delete_file(self.deployment_path(state.stack_name))
+        return archive_file
+
+    def _archive_file(self, state: DeploymentState) -> Path:
+        timestamp = int(state.updated_at.timestamp())
+        return self.archive_path / f"{state.stack_name}-{timestamp}.json"
+
     def backup_state(self, stack_name: str, label: str | None = None) -> Path:
         """Create a compressed backup for the specified deployment."""
         file_path = self.deployment_path(stack_name)
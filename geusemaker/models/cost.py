@@ -62,7 +62,7 @@ class CostEstimate(BaseModel):
 
     def to_json(self) -> str:
         """Return a JSON string representation suitable for export."""
-        return json.dumps(self.model_dump(mode="json"), default=str, separators=(",", ":"))
+        return json.dumps(self.model_dump(mode="json"), separators=(",", ":"))
 
 
 class BudgetStatus(BaseModel):
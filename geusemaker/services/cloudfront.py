@@ -3,11 +3,87 @@
 from __future__ import annotations
 
 import time
+from dataclasses import dataclass
 from typing import Any
 
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
 from geusemaker.infra import AWSClientFactory
 from geusemaker.services.base import BaseService
 
+# Request fragments shared by every distribution and cache behavior we build.
+# They are handed to boto3 by reference, so treat them as read-only. (botocore's
+# parameter validator only accepts real dicts for structures, which rules out
+# MappingProxyType here.)
+_ALLOWED_METHODS: dict[str, Any] = {
+    "Quantity": 7,
+    "Items": ["HEAD", "DELETE", "POST", "GET", "OPTIONS", "PUT", "PATCH"],
+    "CachedMethods": {"Quantity": 2, "Items": ["HEAD", "GET"]},
+}
+_ORIGIN_SSL_PROTOCOLS: dict[str, Any] = {"Quantity": 1, "Items": ["TLSv1.2"]}
+_FORWARD_HOST: dict[str, Any] = {
+    "QueryString": True,
+    "Cookies": {"Forward": "all"},
+    "Headers": {"Quantity": 1, "Items": ["Host"]},
+}
+_FORWARD_ALL: dict[str, Any] = {
+    "QueryString": True,
+    "Cookies": {"Forward": "all"},
+    "Headers": {"Quantity": 1, "Items": ["*"]},
+}
+_FORWARD_NONE: dict[str, Any] = {
+    "QueryString": False,
+    "Cookies": {"Forward": "none"},
+    "Headers": {"Quantity": 0},
+}
+
+# Adaptive polling for wait_for_deployed(delay=None): start short, grow per poll, and
+# give up after the same 35 minutes botocore's distribution_deployed waiter allows.
+_ADAPTIVE_WAIT_INITIAL_DELAY_SECONDS = 5.0
+_ADAPTIVE_WAIT_GROWTH = 1.5
+_ADAPTIVE_WAIT_MAX_DELAY_SECONDS = 30.0
+_ADAPTIVE_WAIT_BUDGET_SECONDS = 35 * 60.0
+_THROTTLING_CODES = frozenset({"Throttling", "ThrottlingException"})
+
+_DEFAULT_VIEWER_CERTIFICATE: dict[str, Any] = {
+    "CloudFrontDefaultCertificate": True,
+    "MinimumProtocolVersion": "TLSv1.2_2021",
+}
+
+
+@dataclass(slots=True)
+class _AlbDistributionConfig:
+    """Inputs for an ALB-origin distribution, rendered to the API shape in one pass."""
+
+    caller_reference: str
+    comment: str
+    enabled: bool
+    origin: dict[str, Any]
+    default_cache_behavior: dict[str, Any]
+    price_class: str
+    viewer_certificate: dict[str, Any]
+    cache_behaviors: list[dict[str, Any]] | None = None
+    aliases: list[str] | None = None
+
+    def to_aws(self) -> dict[str, Any]:
+        """Return the DistributionConfig request dict, omitting unset optional sections."""
+        config: dict[str, Any] = {
+            "CallerReference": self.caller_reference,
+            "Comment": self.comment,
+            "Enabled": self.enabled,
+            "Origins": {"Quantity": 1, "Items": [self.origin]},
+            "DefaultCacheBehavior": self.default_cache_behavior,
+            "PriceClass": self.price_class,
+            "HttpVersion": "http2and3",
+            "IsIPV6Enabled": True,
+            "ViewerCertificate": self.viewer_certificate,
+        }
+        if self.cache_behaviors:
+            config["CacheBehaviors"] = {"Quantity": len(self.cache_behaviors), "Items": self.cache_behaviors}
+        if self.aliases:
+            config["Aliases"] = {"Quantity": len(self.aliases), "Items": self.aliases}
+        return config
+
 
 class CloudFrontService(BaseService):
     """Manage CloudFront distributions."""
@@ -16,6 +92,7 @@ class CloudFrontService(BaseService):
         # CloudFront is global; region kept for interface consistency.
         super().__init__(client_factory, region)
         self._cf = self._client("cloudfront")
+        self._waiters: dict[str, Any] = {}
 
     def create_distribution(self, config: dict[str, Any]) -> dict[str, Any]:
         """Create a distribution using a caller-provided config."""
@@ -80,7 +157,7 @@ class CloudFrontService(BaseService):
                 "HTTPPort": 80,
                 "HTTPSPort": 443,
                 "OriginProtocolPolicy": origin_protocol_policy,
-                "OriginSslProtocols": {"Quantity": 1, "Items": ["TLSv1.2"]},
+                "OriginSslProtocols": _ORIGIN_SSL_PROTOCOLS,
                 "OriginReadTimeout": 30,
                 "OriginKeepaliveTimeout": 5,
             },
@@ -90,17 +167,9 @@ class CloudFrontService(BaseService):
         default_cache_behavior: dict[str, Any] = {
             "TargetOriginId": origin_id,
             "ViewerProtocolPolicy": "redirect-to-https",  # Enforce HTTPS for all viewers
-            "AllowedMethods": {
-                "Quantity": 7,
-                "Items": ["HEAD", "DELETE", "POST", "GET", "OPTIONS", "PUT", "PATCH"],
-                "CachedMethods": {"Quantity": 2, "Items": ["HEAD", "GET"]},
-            },
+            "AllowedMethods": _ALLOWED_METHODS,
             "Compress": compress,
-            "ForwardedValues": {
-                "QueryString": True,
-                "Cookies": {"Forward": "all"},
-                "Headers": {"Quantity": 1, "Items": ["Host"]},
-            },
+            "ForwardedValues": _FORWARD_HOST,
             "MinTTL": min_ttl,
             "DefaultTTL": default_ttl,
             "MaxTTL": max_ttl,
@@ -110,42 +179,27 @@ class CloudFrontService(BaseService):
         if security_headers_policy_id:
             default_cache_behavior["ResponseHeadersPolicyId"] = security_headers_policy_id
 
-        # Build distribution config
-        distribution_config: dict[str, Any] = {
-            "CallerReference": caller_reference,
-            "Comment": comment,
-            "Enabled": enabled,
-            "Origins": {"Quantity": 1, "Items": [origin]},
-            "DefaultCacheBehavior": default_cache_behavior,
-            "PriceClass": price_class,
-            "HttpVersion": "http2and3",
-            "IsIPV6Enabled": True,
-        }
-
-        # Add cache behaviors if provided
-        if cache_behaviors:
-            distribution_config["CacheBehaviors"] = {
-                "Quantity": len(cache_behaviors),
-                "Items": cache_behaviors,
-            }
-
-        # Add SSL/custom domain configuration if provided
-        if ssl_certificate_arn and alternate_domain_names:
-            distribution_config["Aliases"] = {
-                "Quantity": len(alternate_domain_names),
-                "Items": alternate_domain_names,
-            }
-            distribution_config["ViewerCertificate"] = {
-                "ACMCertificateArn": ssl_certificate_arn,
-                "SSLSupportMethod": "sni-only",
-                "MinimumProtocolVersion": "TLSv1.2_2021",
-            }
-        else:
-            # Use default CloudFront certificate
-            distribution_config["ViewerCertificate"] = {
-                "CloudFrontDefaultCertificate": True,
-                "MinimumProtocolVersion": "TLSv1.2_2021",
-            }
+        # Custom domains need both a certificate and aliases; otherwise use the default certificate
+        use_custom_domain = bool(ssl_certificate_arn and alternate_domain_names)
+        distribution_config = _AlbDistributionConfig(
+            caller_reference=caller_reference,
+            comment=comment,
+            enabled=enabled,
+            origin=origin,
+            default_cache_behavior=default_cache_behavior,
+            price_class=price_class,
+            viewer_certificate=(
+                {
+                    "ACMCertificateArn": ssl_certificate_arn,
+                    "SSLSupportMethod": "sni-only",
+                    "MinimumProtocolVersion": "TLSv1.2_2021",
+                }
+                if use_custom_domain
+                else _DEFAULT_VIEWER_CERTIFICATE
+            ),
+            cache_behaviors=cache_behaviors or None,
+            aliases=alternate_domain_names if use_custom_domain else None,
+        ).to_aws()
 
         def _call() -> dict[str, Any]:
             return self._cf.create_distribution(DistributionConfig=distribution_config)  # type: ignore[no-any-return]
@@ -173,43 +227,29 @@ class CloudFrontService(BaseService):
             viewer_protocol: Viewer protocol policy (allow-all, redirect-to-https, https-only)
 
         Returns:
-            Cache behavior configuration dict
+            Cache behavior configuration dict (nested method/forwarding sections are
+            shared templates; copy them before mutating)
         """
         behavior: dict[str, Any] = {
             "PathPattern": path_pattern,
             "TargetOriginId": target_origin_id,
             "ViewerProtocolPolicy": viewer_protocol,
-            "AllowedMethods": {
-                "Quantity": 7,
-                "Items": ["HEAD", "DELETE", "POST", "GET", "OPTIONS", "PUT", "PATCH"],
-                "CachedMethods": {"Quantity": 2, "Items": ["HEAD", "GET"]},
-            },
+            "AllowedMethods": _ALLOWED_METHODS,
             "Compress": compress,
+            "ForwardedValues": _FORWARD_ALL if forward_all else _FORWARD_NONE,
             "MinTTL": 0,
             "DefaultTTL": ttl,
             "MaxTTL": ttl if ttl > 0 else 31536000,  # 1 year max if no caching
         }
 
-        if forward_all:
-            behavior["ForwardedValues"] = {
-                "QueryString": True,
-                "Cookies": {"Forward": "all"},
-                "Headers": {"Quantity": 1, "Items": ["*"]},
-            }
-        else:
-            behavior["ForwardedValues"] = {
-                "QueryString": False,
-                "Cookies": {"Forward": "none"},
-                "Headers": {"Quantity": 0},
-            }
-
         return behavior
 
     def wait_for_deployed(
         self,
         distribution_id: str,
         max_attempts: int = 60,
-        delay: int = 30,
+        delay: float | None = 30,
+        timeout_seconds: float = _ADAPTIVE_WAIT_BUDGET_SECONDS,
     ) -> None:
         """
         Wait for CloudFront distribution to reach 'Deployed' status.
@@ -219,32 +259,60 @@ class CloudFrontService(BaseService):
         Args:
             distribution_id: CloudFront distribution ID
             max_attempts: Maximum number of polling attempts (default 60 = 30 min)
-            delay: Seconds between polling attempts (default 30s)
+            delay: Seconds between polling attempts (default 30s). ``None`` polls
+                adaptively instead: 5s at first, growing 1.5x per poll up to 30s, and
+                doubling after a throttled poll, until ``timeout_seconds`` elapse.
+            timeout_seconds: Overall budget for adaptive polling (default 35 min)
 
         Raises:
             RuntimeError: If distribution doesn't deploy within timeout or enters error state
         """
 
-        def _call() -> None:
-            for attempt in range(max_attempts):
-                resp = self._cf.get_distribution(Id=distribution_id)
-                status = resp["Distribution"]["Status"]
+        def _deployed() -> bool:
+            status = self._cf.get_distribution(Id=distribution_id)["Distribution"]["Status"]
+            if status in ("Failed", "Cancelled"):
+                raise RuntimeError(f"Distribution entered {status} state")
+            return status == "Deployed"
 
-                if status == "Deployed":
+        def _call(fixed_delay: float) -> None:
+            for attempt in range(max_attempts):
+                if _deployed():
                     return
 
-                if status in ("Failed", "Cancelled"):
-                    raise RuntimeError(f"Distribution entered {status} state")
-
                 if attempt < max_attempts - 1:
-                    time.sleep(delay)
+                    time.sleep(fixed_delay)
 
             raise RuntimeError(
-                f"Distribution did not deploy within {max_attempts * delay}s. "
+                f"Distribution did not deploy within {max_attempts * fixed_delay}s. "
                 f"Check AWS Console for distribution {distribution_id}"
             )
 
-        self._safe_call(_call)
+        def _call_adaptive() -> None:
+            deadline = time.monotonic() + timeout_seconds
+            poll_delay = _ADAPTIVE_WAIT_INITIAL_DELAY_SECONDS
+            while True:
+                try:
+                    if _deployed():
+                        return
+                except ClientError as exc:
+                    if exc.response.get("Error", {}).get("Code") not in _THROTTLING_CODES:
+                        raise
+                    # Back off harder instead of failing while polling is throttled.
+                    poll_delay *= 2
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        f"Distribution did not deploy within {timeout_seconds:.0f}s. "
+                        f"Check AWS Console for distribution {distribution_id}"
+                    )
+                time.sleep(min(poll_delay, remaining))
+                poll_delay = min(poll_delay * _ADAPTIVE_WAIT_GROWTH, _ADAPTIVE_WAIT_MAX_DELAY_SECONDS)
+
+        if delay is None:
+            self._safe_call(_call_adaptive)
+        else:
+            self._safe_call(lambda: _call(delay))
 
     def get_distribution(self, distribution_id: str) -> dict[str, Any]:
         """
@@ -297,6 +365,69 @@ class CloudFrontService(BaseService):
 
         return self._safe_call(_call)
 
+    def create_invalidation_batched(
+        self,
+        distribution_id: str,
+        paths: list[str],
+        caller_reference: str,
+        collapse_threshold: int = 8,
+        wait: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Coalesce paths into a single invalidation and optionally wait for it once.
+
+        Duplicate paths are dropped, directories with at least ``collapse_threshold``
+        paths collapse to ``/dir/*``, and paths covered by a wildcard are removed.
+        One invalidation means one propagation wait instead of one per path group.
+
+        Args:
+            distribution_id: CloudFront distribution ID
+            paths: Paths to invalidate
+            caller_reference: Unique reference for this invalidation
+            collapse_threshold: Paths per directory that trigger a ``/dir/*`` wildcard
+            wait: Block until CloudFront reports the invalidation completed
+
+        Returns:
+            CreateInvalidation API response with Invalidation and Location
+
+        Raises:
+            RuntimeError: If invalidation creation or the wait fails
+        """
+        response = self.create_invalidation(
+            distribution_id,
+            self._coalesce_paths(paths, collapse_threshold),
+            caller_reference,
+        )
+        if wait:
+            invalidation_id = response["Invalidation"]["Id"]
+            self._safe_call(
+                lambda: self._waiter("invalidation_completed").wait(
+                    DistributionId=distribution_id,
+                    Id=invalidation_id,
+                ),
+            )
+        return response
+
+    @staticmethod
+    def _coalesce_paths(paths: list[str], collapse_threshold: int) -> list[str]:
+        unique = sorted(set(paths))
+        if "/*" in unique:
+            return ["/*"]
+
+        by_directory: dict[str, list[str]] = {}
+        for path in unique:
+            by_directory.setdefault(path.rsplit("/", 1)[0], []).append(path)
+
+        coalesced: list[str] = []
+        for directory, members in by_directory.items():
+            if len(members) >= collapse_threshold:
+                coalesced.append(f"{directory}/*")
+            else:
+                coalesced.extend(members)
+
+        prefixes = tuple(path[:-1] for path in coalesced if path.endswith("*"))
+        return sorted(path for path in coalesced if path.endswith("*") or not path.startswith(prefixes))
+
     def delete_distribution(self, distribution_id: str, etag: str) -> None:
         """
         Delete CloudFront distribution.
@@ -316,13 +447,20 @@ class CloudFrontService(BaseService):
 
         self._safe_call(_call)
 
-    def disable_distribution(self, distribution_id: str, etag: str) -> dict[str, Any]:
+    def disable_distribution(
+        self,
+        distribution_id: str,
+        etag: str,
+        current_config: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Disable CloudFront distribution (required before deletion).
 
         Args:
             distribution_id: CloudFront distribution ID
             etag: ETag from get_distribution() response
+            current_config: DistributionConfig from the same get_distribution() response;
+                when provided the config is not fetched again
 
         Returns:
             UpdateDistribution API response with updated Distribution and ETag
@@ -332,12 +470,13 @@ class CloudFrontService(BaseService):
         """
 
         def _call() -> dict[str, Any]:
-            # Get current config
-            resp = self._cf.get_distribution(Id=distribution_id)
-            config = resp["Distribution"]["DistributionConfig"]
+            config = current_config
+            if config is None:
+                resp = self._cf.get_distribution(Id=distribution_id)
+                config = resp["Distribution"]["DistributionConfig"]
 
             # Disable the distribution
-            config["Enabled"] = False
+            config = {**config, "Enabled": False}
 
             # Update distribution
             return self._cf.update_distribution(  # type: ignore[no-any-return]
@@ -348,5 +487,12 @@ class CloudFrontService(BaseService):
 
         return self._safe_call(_call)
 
+    def _waiter(self, name: str) -> Any:
+        """Return a cached boto3 waiter (waiter models are parsed once per service)."""
+        waiter = self._waiters.get(name)
+        if waiter is None:
+            waiter = self._waiters[name] = self._cf.get_waiter(name)
+        return waiter
+
 
 __all__ = ["CloudFrontService"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING, Literal
@@ -65,6 +66,9 @@ class InstanceTypeSelector:
         "p3.2xlarge",  # Training-optimized (V100, 16GB VRAM, 8 vCPU)
     ]
 
+    # Upper bound on concurrent per-candidate capacity checks
+    MAX_PARALLEL_CHECKS = 5
+
     # Minimum requirements for GPU instances (from your research)
     GPU_MIN_VRAM_GB = 16
     GPU_MIN_VCPU = 4
@@ -105,11 +109,14 @@ class InstanceTypeSelector:
         region = region or self._region
         instance_types = self.GPU_INSTANCE_TYPES if compute_type == "gpu" else self.CPU_INSTANCE_TYPES
 
-        LOGGER.info(f"Searching for best available {compute_type.upper()} instance...")
+        LOGGER.info("Searching for best available %s instance...", compute_type.upper())
+
+        # One bulk history request warms the per-type analysis cache that
+        # select_instance_type reads, instead of one request per candidate.
+        analyses = self._spot_service.analyze_spot_prices_bulk(list(instance_types), region) if use_spot else {}
 
-        candidates: list[tuple[int, InstanceSelection, float]] = []
-        for rank, instance_type in enumerate(instance_types):
-            LOGGER.debug(f"Checking {instance_type}...")
+        def _evaluate(instance_type: str) -> tuple[InstanceSelection, float]:
+            LOGGER.debug("Checking %s...", instance_type)
 
             # Create a temporary config to use spot selection service
             config = DeploymentConfig(
@@ -124,9 +131,18 @@ class InstanceTypeSelector:
 
             placement_score = 0.0
             if selection.is_spot and selection.availability_zone:
-                analysis = self._spot_service.analyze_spot_prices(instance_type, region)
+                analysis = analyses.get(instance_type) or self._spot_service.analyze_spot_prices(instance_type, region)
                 placement_score = analysis.placement_scores_by_az.get(selection.availability_zone, 0.0)
-            candidates.append((rank, selection, placement_score))
+            return selection, placement_score
+
+        # Every candidate is ranked under the policy, so none can be skipped. Cheap
+        # price/stability checks already short-circuit inside select_instance_type;
+        # the remaining capacity dry-runs are independent and run concurrently.
+        with ThreadPoolExecutor(max_workers=max(1, min(len(instance_types), self.MAX_PARALLEL_CHECKS))) as pool:
+            results = list(pool.map(_evaluate, instance_types))
+        candidates: list[tuple[int, InstanceSelection, float]] = [
+            (rank, selection, placement_score) for rank, (selection, placement_score) in enumerate(results)
+        ]
 
         if not candidates:  # defensive: the spot service normally returns on-demand fallback
             raise RuntimeError(f"No eligible {compute_type.upper()} instance candidates")
@@ -152,7 +168,7 @@ class InstanceTypeSelector:
             )
             for _, item, score in candidates[1:4]
         )
-        LOGGER.info(f"Selected {selection.instance_type} ({reason})")
+        LOGGER.info("Selected %s (%s)", selection.instance_type, reason)
 
         return InstanceTypeSelection(
             instance_type=selection.instance_type,
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from statistics import pstdev
-from typing import TYPE_CHECKING, Any
+from math import fsum, sqrt, sumprod
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
@@ -21,85 +25,237 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _store_bounded(
+    cache: dict[_K, _V],
+    key: _K,
+    value: _V,
+    max_entries: int,
+    expired: Callable[[_V], bool] | None = None,
+) -> None:
+    """Insert ``key`` as the newest entry, then evict from the oldest end.
+
+    Every store re-inserts its key, so dict order is age order: expired entries
+    (one TTL per cache) collect at the front and are dropped there, along with
+    anything beyond ``max_entries``. The entry just stored is always kept.
+    """
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > 1:
+        oldest = next(iter(cache))
+        if len(cache) <= max_entries and not (expired and expired(cache[oldest])):
+            break
+        del cache[oldest]
+
+
+_ZERO = Decimal("0.0")
+# Spot is only worth it below this fraction of the on-demand price.
+_SPOT_PRICE_CEILING = Decimal("0.8")
+_HOURS_PER_MONTH = Decimal("730")
+
+
+def _zero_comparison(on_demand_price: Decimal) -> SavingsComparison:
+    """Savings for selecting on-demand; the fields are known-valid, so validation is skipped."""
+    return SavingsComparison.model_construct(
+        on_demand_hourly=on_demand_price,
+        selected_hourly=on_demand_price,
+        hourly_savings=_ZERO,
+        monthly_savings=_ZERO,
+        savings_percentage=0.0,
+    )
+
 
 class SpotSelectionService(BaseService):
     """Analyze spot markets and choose the best placement."""
 
+    # Bounds for the per-instance caches, which otherwise grow for the life of the service.
+    _MAX_CAPACITY_ENTRIES = 1024
+    _MAX_ANALYSIS_ENTRIES = 256
+    _MAX_AMI_ENTRIES = 128
+    # Worker cap for the concurrent price/score/history lookups of one analysis batch.
+    MAX_PARALLEL_LOOKUPS = 8
+    # GetMetricData accepts at most 500 queries per request.
+    _MAX_METRIC_QUERIES = 500
+    # Price history samples kept per instance type for the stability score.
+    _MAX_HISTORY_SAMPLES = 1000
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
         pricing_service: PricingService,
         region: str = "us-east-1",
-        capacity_ttl_seconds: int = 120,
+        analysis_ttl_seconds: int = 60,
         ec2_client: Any | None = None,
         ec2_service: EC2Service | None = None,
+        positive_capacity_ttl_seconds: int = 300,
+        negative_capacity_ttl_seconds: int = 30,
+        use_cloudwatch_scores: bool = False,
+        cloudwatch_client: Any | None = None,
+        score_namespace: str = "SpotPlacementScore",
     ):
         super().__init__(client_factory, region)
         self._pricing_service = pricing_service
-        self._capacity_cache: dict[str, tuple[datetime, bool]] = {}
-        self._capacity_ttl = timedelta(seconds=capacity_ttl_seconds)
+        # Capacity results age differently: a successful dry-run stays valid for a
+        # while, but InsufficientInstanceCapacity often clears within seconds, so
+        # "no capacity" is only trusted briefly.
+        # Cache timestamps come from time.monotonic(): cheaper than datetime.now(UTC) and
+        # immune to wall-clock jumps.
+        self._capacity_pos_cache: dict[str, float] = {}
+        self._capacity_neg_cache: dict[str, float] = {}
+        self._capacity_pos_ttl = float(positive_capacity_ttl_seconds)
+        self._capacity_neg_ttl = float(negative_capacity_ttl_seconds)
+        self._analysis_ttl = float(analysis_ttl_seconds)
         self._ec2_client = ec2_client
+        self._ec2_clients: dict[str, Any] = {}  # Cache region -> ec2 client
         self._ec2_service = ec2_service
         self._ami_cache: dict[tuple[str, str, str], str] = {}  # Cache (os_type, ami_type, region) -> ami_id
         self._az_name_cache: dict[str, dict[str, str]] = {}  # Cache region -> {zone_id: zone_name}
         # Analysis cache avoids re-querying spot history/placement scores when callers
         # (e.g. InstanceTypeSelector) analyze the same instance type repeatedly.
-        self._analysis_cache: dict[tuple[str, str], tuple[datetime, SpotAnalysis]] = {}
+        self._analysis_cache: dict[tuple[str, str], tuple[float, SpotAnalysis]] = {}
+        # The caches are read and evicted from worker threads (InstanceTypeSelector's
+        # pool, the bulk analysis pool); one lock guards all of them.
+        self._cache_lock = threading.Lock()
+        # Optional: read placement scores a spot placement score tracker publishes to
+        # CloudWatch (one batched GetMetricData) instead of calling the SPS API per type.
+        self._use_cloudwatch_scores = use_cloudwatch_scores
+        self._cloudwatch_client = cloudwatch_client
+        self._cloudwatch_clients: dict[str, Any] = {}  # Cache region -> cloudwatch client
+        self._score_namespace = score_namespace
 
     def analyze_spot_prices(self, instance_type: str, region: str) -> SpotAnalysis:
         """Return spot analysis including recommended AZ and stability (cached briefly)."""
-        cache_key = (instance_type, region)
-        cached = self._analysis_cache.get(cache_key)
-        if cached and datetime.now(UTC) - cached[0] < self._capacity_ttl:
-            return cached[1]
+        return self.analyze_spot_prices_bulk([instance_type], region)[instance_type]
 
-        spot_prices = self._pricing_service.get_spot_prices(instance_type, region)
-        on_demand = self._pricing_service.get_on_demand_price(instance_type, region)
+    def analyze_spot_prices_bulk(self, instance_types: list[str], region: str) -> dict[str, SpotAnalysis]:
+        """Analyze several instance types from a single spot price history request.
+
+        The 24h history doubles as the current price source (newest sample per AZ), so
+        one ``describe_spot_price_history`` call replaces the per-type price and history
+        lookups. Types with no history take current prices from the pricing service,
+        which falls back to estimates.
+        """
+        now = time.monotonic()
+        results: dict[str, SpotAnalysis] = {}
+        missing: list[str] = []
+        with self._cache_lock:
+            for instance_type in instance_types:
+                cached = self._analysis_cache.get((instance_type, region))
+                if cached and now - cached[0] < self._analysis_ttl:
+                    results[instance_type] = cached[1]
+                elif instance_type not in missing:
+                    missing.append(instance_type)
+
+        if not missing:
+            return results
+
+        # The history fetch, on-demand prices and placement scores are independent
+        # AWS round trips; overlapping them costs max(RTT) instead of their sum.
+        workers = min(1 + 2 * len(missing), self.MAX_PARALLEL_LOOKUPS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            history_future = pool.submit(self._fetch_history, missing, region)
+            on_demand_futures = {
+                instance_type: pool.submit(self._pricing_service.get_on_demand_price, instance_type, region)
+                for instance_type in missing
+            }
+            tracked_future = (
+                pool.submit(self._tracked_placement_scores, missing, region) if self._use_cloudwatch_scores else None
+            )
+            score_futures = (
+                {}
+                if tracked_future
+                else {
+                    instance_type: pool.submit(self.get_spot_placement_scores, instance_type, region)
+                    for instance_type in missing
+                }
+            )
+            history_by_type, latest_by_type = history_future.result()
+            tracked = tracked_future.result() if tracked_future else {}
+
+        def placement_scores(instance_type: str) -> dict[str, float]:
+            if instance_type in score_futures:
+                return score_futures[instance_type].result()
+            # Types the tracker does not publish fall back to the SPS API.
+            return tracked.get(instance_type) or self.get_spot_placement_scores(instance_type, region)
+
+        for instance_type in missing:
+            history = history_by_type.get(instance_type, {})
+            prices_by_az = latest_by_type.get(instance_type) or self._current_prices(instance_type, region)
+            analysis = self._build_analysis(
+                instance_type,
+                region,
+                prices_by_az,
+                history,
+                on_demand_futures[instance_type].result().price_per_hour,
+                placement_scores(instance_type),
+            )
+            with self._cache_lock:
+                _store_bounded(
+                    self._analysis_cache,
+                    (instance_type, region),
+                    (now, analysis),
+                    self._MAX_ANALYSIS_ENTRIES,
+                    expired=lambda entry: now - entry[0] >= self._analysis_ttl,
+                )
+            results[instance_type] = analysis
+        return results
 
+    def _current_prices(self, instance_type: str, region: str) -> dict[str, Decimal]:
+        """Current spot price per AZ from the pricing service (first quote per AZ)."""
         prices_by_az: dict[str, Decimal] = {}
-        for price in spot_prices:
+        for price in self._pricing_service.get_spot_prices(instance_type, region):
             if price.availability_zone not in prices_by_az:
                 prices_by_az[price.availability_zone] = price.price_per_hour
+        return prices_by_az
 
-        # Get spot placement scores for availability prediction
-        placement_scores = self.get_spot_placement_scores(instance_type, region)
-
-        lowest_az = None
-        lowest_price = on_demand.price_per_hour
-        for az, price in prices_by_az.items():
-            if price < lowest_price:
-                lowest_price = price
-                lowest_az = az
+    def _build_analysis(
+        self,
+        instance_type: str,
+        region: str,
+        prices_by_az: dict[str, Decimal],
+        history: dict[str, list[float]],
+        on_demand_price: Decimal,
+        placement_scores: dict[str, float],
+    ) -> SpotAnalysis:
+        # Single C-level scan for the cheapest AZ; it only counts if it beats on-demand.
+        lowest_az = min(prices_by_az, key=prices_by_az.__getitem__, default=None)
+        lowest_price = on_demand_price
+        if lowest_az is not None and prices_by_az[lowest_az] < lowest_price:
+            lowest_price = prices_by_az[lowest_az]
+        else:
+            lowest_az = None
 
-        stability_scores = self._stability_scores(instance_type, region, prices_by_az)
-        stability = max(stability_scores.values()) if stability_scores else 0.0
+        stability = self._best_stability(history, prices_by_az)
         savings_pct = float(
             max(
                 Decimal(0),
-                (on_demand.price_per_hour - lowest_price) / on_demand.price_per_hour,
+                (on_demand_price - lowest_price) / on_demand_price,
             )
             * 100,
         )
 
-        analysis = SpotAnalysis(
+        return SpotAnalysis(
             instance_type=instance_type,
             region=region,
             prices_by_az=prices_by_az,
             recommended_az=lowest_az,
             lowest_price=lowest_price,
             price_stability_score=stability,
-            on_demand_price=on_demand.price_per_hour,
+            on_demand_price=on_demand_price,
             savings_percentage=savings_pct,
             placement_scores_by_az=placement_scores,
         )
-        self._analysis_cache[cache_key] = (datetime.now(UTC), analysis)
-        return analysis
 
     def _get_ami_for_dryrun(self, region: str, os_type: str = "amazon-linux-2023", ami_type: str = "base") -> str:
         """Get a valid AMI ID for dry-run checks (cached)."""
         cache_key = (os_type, ami_type, region)
-        if cache_key in self._ami_cache:
-            return self._ami_cache[cache_key]
+        with self._cache_lock:
+            cached = self._ami_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Use EC2Service if available, otherwise fallback to placeholder
         if self._ec2_service:
@@ -109,11 +265,12 @@ class SpotSelectionService(BaseService):
                     ami_type=ami_type,
                     architecture="x86_64",
                 )
-                self._ami_cache[cache_key] = ami_id
+                with self._cache_lock:
+                    _store_bounded(self._ami_cache, cache_key, ami_id, self._MAX_AMI_ENTRIES)
                 return ami_id
             except Exception as exc:  # noqa: BLE001
                 # Log and fallback to placeholder if AMI selection fails
-                LOGGER.debug(f"AMI selection failed for dry-run check: {exc}. Using fallback AMI.")
+                LOGGER.debug("AMI selection failed for dry-run check: %s. Using fallback AMI.", exc)
 
         # Fallback: use a placeholder AMI ID (less accurate but won't fail)
         return "ami-0c55b159cbfafe1f0"  # Generic Amazon Linux 2 AMI (always exists but may be deprecated)
@@ -122,23 +279,36 @@ class SpotSelectionService(BaseService):
     # Anything else (UnauthorizedOperation, missing default VPC, parameter issues)
     # says nothing about capacity, so treating it as "no capacity" would silently
     # force whole accounts onto on-demand.
-    _CAPACITY_ERROR_CODES = (
-        "InsufficientInstanceCapacity",
-        "SpotMaxPriceTooLow",
-        "MaxSpotInstanceCountExceeded",
-        "InstanceLimitExceeded",
-        "Unsupported",
+    _CAPACITY_ERROR_CODES = frozenset(
+        {
+            "InsufficientInstanceCapacity",
+            "SpotMaxPriceTooLow",
+            "MaxSpotInstanceCountExceeded",
+            "InstanceLimitExceeded",
+            "Unsupported",
+        },
     )
 
+    # Spot placement scores (1-10) at or above this are trusted without a dry-run.
+    _TRUSTED_PLACEMENT_SCORE = 7.0
+
+    # Exponent on the placement score when ranking AZs by price / score**weight.
+    _PLACEMENT_SCORE_WEIGHT = 1.5
+
     def check_spot_capacity(self, instance_type: str, az: str | None, region: str) -> bool:
         """Use a dry-run spot request to validate capacity with real AMI ID."""
         if not az:
             return False
 
+        now = time.monotonic()
         cache_key = f"{instance_type}:{az}"
-        cached = self._capacity_cache.get(cache_key)
-        if cached and datetime.now(UTC) - cached[0] < self._capacity_ttl:
-            return cached[1]
+        with self._cache_lock:
+            positive_at = self._capacity_pos_cache.get(cache_key)
+            negative_at = self._capacity_neg_cache.get(cache_key)
+        if positive_at is not None and now - positive_at < self._capacity_pos_ttl:
+            return True
+        if negative_at is not None and now - negative_at < self._capacity_neg_ttl:
+            return False
 
         # Get a valid AMI ID for more accurate dry-run validation
         ami_id = self._get_ami_for_dryrun(region)
@@ -159,17 +329,37 @@ class SpotSelectionService(BaseService):
             if code == "DryRunOperation":
                 # Dry-run "failure" that means the request would have succeeded.
                 result = True
-            elif code in self._CAPACITY_ERROR_CODES or "InsufficientInstanceCapacity" in str(exc):
+            elif code in self._CAPACITY_ERROR_CODES:
                 result = False
             else:
                 # Inconclusive (permissions, missing default VPC, ...): assume capacity
                 # and let launch-time fallback handle a genuine shortage.
-                LOGGER.debug(f"Spot capacity dry-run inconclusive in {az} ({code}); assuming capacity.")
+                LOGGER.debug("Spot capacity dry-run inconclusive in %s (%s); assuming capacity.", az, code)
                 result = True
         else:
             result = True
 
-        self._capacity_cache[cache_key] = (datetime.now(UTC), result)
+        with self._cache_lock:
+            if result:
+                _store_bounded(
+                    self._capacity_pos_cache,
+                    cache_key,
+                    now,
+                    self._MAX_CAPACITY_ENTRIES,
+                    expired=lambda checked: now - checked >= self._capacity_pos_ttl,
+                )
+                self._capacity_neg_cache.pop(cache_key, None)
+            else:
+                _store_bounded(
+                    self._capacity_neg_cache,
+                    cache_key,
+                    now,
+                    self._MAX_CAPACITY_ENTRIES,
+                    expired=lambda checked: now - checked >= self._capacity_neg_ttl,
+                )
+                self._capacity_pos_cache.pop(cache_key, None)
+                # The market moved under the cached analysis; re-analyze on the next request.
+                self._analysis_cache.pop((instance_type, region), None)
         return result
 
     def get_spot_placement_scores(
@@ -222,9 +412,62 @@ class SpotSelectionService(BaseService):
 
         except ClientError as exc:
             # Gracefully handle API failures - don't block deployment
-            LOGGER.debug(f"Could not fetch spot placement scores: {exc}")
+            LOGGER.debug("Could not fetch spot placement scores: %s", exc)
             return {}
 
+    def _tracked_placement_scores(self, instance_types: list[str], region: str) -> dict[str, dict[str, float]]:
+        """Latest tracked placement score per type and AZ from CloudWatch (empty on API errors).
+
+        Series are ``Score`` metrics dimensioned by ``InstanceType`` and ``AvailabilityZone``
+        under ``score_namespace``; up to 500 series are read per GetMetricData request.
+        """
+        series = [
+            (instance_type, az)
+            for instance_type in instance_types
+            for az in sorted(set(self._az_id_to_name(region).values()))
+        ]
+        end_time = datetime.now(UTC)
+        start_time = end_time - timedelta(hours=3)
+        scores: dict[str, dict[str, float]] = {}
+        try:
+            paginator = self._cloudwatch(region).get_paginator("get_metric_data")
+            for offset in range(0, len(series), self._MAX_METRIC_QUERIES):
+                batch = series[offset : offset + self._MAX_METRIC_QUERIES]
+                queries = [
+                    {
+                        "Id": f"s{index}",
+                        "MetricStat": {
+                            "Metric": {
+                                "Namespace": self._score_namespace,
+                                "MetricName": "Score",
+                                "Dimensions": [
+                                    {"Name": "InstanceType", "Value": instance_type},
+                                    {"Name": "AvailabilityZone", "Value": az},
+                                ],
+                            },
+                            "Period": 3600,
+                            "Stat": "Average",
+                        },
+                    }
+                    for index, (instance_type, az) in enumerate(batch)
+                ]
+                pages = paginator.paginate(
+                    MetricDataQueries=queries,
+                    StartTime=start_time,
+                    EndTime=end_time,
+                    ScanBy="TimestampDescending",
+                )
+                for page in pages:
+                    for result in page.get("MetricDataResults", []):
+                        values = result.get("Values")
+                        if values:
+                            instance_type, az = batch[int(result["Id"][1:])]
+                            # Newest first, so later pages never overwrite a score.
+                            scores.setdefault(instance_type, {}).setdefault(az, float(values[0]))
+        except ClientError as exc:
+            LOGGER.debug("Could not read tracked placement scores: %s", exc)
+        return scores
+
     def _az_id_to_name(self, region: str) -> dict[str, str]:
         """Map AZ ids (use1-az1) to AZ names (us-east-1a) for the region (cached)."""
         if self._az_name_cache.get(region) is None:
@@ -237,16 +480,18 @@ class SpotSelectionService(BaseService):
                     if zone_id and zone_name:
                         mapping[zone_id] = zone_name
             except ClientError as exc:
-                LOGGER.debug(f"Could not map AZ ids to names: {exc}")
+                LOGGER.debug("Could not map AZ ids to names: %s", exc)
             self._az_name_cache[region] = mapping
         return self._az_name_cache[region]
 
     def select_instance_type(self, config: DeploymentConfig) -> InstanceSelection:
         """Select spot or on-demand placement honoring user preference."""
-        analysis = self.analyze_spot_prices(config.instance_type, config.region)
-        on_demand_price = analysis.on_demand_price
-
         if not config.use_spot:
+            # The on-demand path needs no spot history, placement scores, or stability analysis.
+            on_demand_price = self._pricing_service.get_on_demand_price(
+                config.instance_type,
+                config.region,
+            ).price_per_hour
             return self._selection(
                 instance_type=config.instance_type,
                 az=None,
@@ -258,13 +503,19 @@ class SpotSelectionService(BaseService):
                 source="live",
             )
 
+        analysis = self.analyze_spot_prices(config.instance_type, config.region)
+        on_demand_price = analysis.on_demand_price
+        price_ceiling = on_demand_price * _SPOT_PRICE_CEILING
+
         # Check if spot prices are too high overall
-        if analysis.lowest_price >= on_demand_price * Decimal("0.8"):
+        if analysis.lowest_price >= price_ceiling:
             fallback_reason = "Spot price >= 80% of on-demand"
             LOGGER.info(
-                f"Spot price too high: ${analysis.lowest_price:.4f}/hr "
-                f"(${on_demand_price:.4f}/hr on-demand = {float(analysis.lowest_price / on_demand_price * 100):.1f}% of on-demand cost). "
-                "Falling back to on-demand."
+                "Spot price too high: $%.4f/hr ($%.4f/hr on-demand = %.1f%% of on-demand cost). "
+                "Falling back to on-demand.",
+                analysis.lowest_price,
+                on_demand_price,
+                analysis.lowest_price / on_demand_price * 100,
             )
             return self._selection(
                 instance_type=config.instance_type,
@@ -281,8 +532,8 @@ class SpotSelectionService(BaseService):
         if analysis.price_stability_score < 0.5:
             fallback_reason = "Spot price volatility too high"
             LOGGER.info(
-                f"Spot price unstable: stability score {analysis.price_stability_score:.2f} < 0.5 threshold. "
-                f"Falling back to on-demand for reliability."
+                "Spot price unstable: stability score %.2f < 0.5 threshold. Falling back to on-demand for reliability.",
+                analysis.price_stability_score,
             )
             return self._selection(
                 instance_type=config.instance_type,
@@ -296,10 +547,10 @@ class SpotSelectionService(BaseService):
             )
 
         # Try all AZs with good prices, sorted by price and placement score
-        # Filter to AZs with reasonable prices (< 80% of on-demand)
-        viable_azs = [
-            (az, price) for az, price in analysis.prices_by_az.items() if price < on_demand_price * Decimal("0.8")
-        ]
+        # Filter to AZs with reasonable prices (< 80% of on-demand); only names are
+        # ranked, prices stay in the analysis map instead of per-AZ tuples.
+        prices_by_az = analysis.prices_by_az
+        viable_azs = [az for az, price in prices_by_az.items() if price < price_ceiling]
 
         if not viable_azs:
             # No viable AZs found - fall back to on-demand
@@ -315,12 +566,11 @@ class SpotSelectionService(BaseService):
                 source="estimated",
             )
 
-        # Sort AZs by: 1) placement score (if available), 2) price
-        def az_score(az_price_tuple: tuple[str, Decimal]) -> tuple[float, Decimal]:
-            az, price = az_price_tuple
-            # Higher placement score is better (negate for sorting)
+        # Rank AZs price-capacity-optimized: price discounted by placement score, so a
+        # well-scored AZ that costs slightly more beats a cheap one likely to lack capacity.
+        def az_score(az: str) -> float:
             placement_score = analysis.placement_scores_by_az.get(az, 5.0)  # Default to mid-range
-            return (-placement_score, price)  # Sort by placement score desc, then price asc
+            return float(prices_by_az[az]) / max(placement_score, 1.0) ** self._PLACEMENT_SCORE_WEIGHT
 
         viable_azs.sort(key=az_score)
 
@@ -329,14 +579,25 @@ class SpotSelectionService(BaseService):
         selected_price = None
         unavailable_azs: list[str] = []
 
-        for az, price in viable_azs:
+        for az in viable_azs:
+            price = prices_by_az[az]
             placement_score = analysis.placement_scores_by_az.get(az, 0.0)
+            # Lazy %-args: nothing is formatted (Decimal.__format__ included) unless debug is on.
             LOGGER.debug(
-                f"Checking spot capacity for {config.instance_type} in {az}: "
-                f"${price:.4f}/hr (placement score: {placement_score:.1f})"
+                "Checking spot capacity for %s in %s: $%.4f/hr (placement score: %.1f)",
+                config.instance_type,
+                az,
+                price,
+                placement_score,
             )
 
-            if self.check_spot_capacity(config.instance_type, az, config.region):
+            # A high placement score already predicts launch success, so only weaker
+            # or unscored AZs spend a RunInstances dry-run (which counts against EC2 quotas).
+            if placement_score >= self._TRUSTED_PLACEMENT_SCORE or self.check_spot_capacity(
+                config.instance_type,
+                az,
+                config.region,
+            ):
                 # Found an AZ with capacity!
                 selected_az = az
                 selected_price = price
@@ -344,14 +605,14 @@ class SpotSelectionService(BaseService):
 
             # This AZ has no capacity, try next
             unavailable_azs.append(az)
-            LOGGER.debug(f"Spot capacity unavailable for {config.instance_type} in {az}. Trying next AZ...")
+            LOGGER.debug("Spot capacity unavailable for %s in %s. Trying next AZ...", config.instance_type, az)
 
         # If no AZ has capacity, fall back to on-demand
         if selected_az is None or selected_price is None:
             fallback_reason = (
                 f"Spot capacity unavailable in all {len(viable_azs)} viable AZs: {', '.join(unavailable_azs)}"
             )
-            LOGGER.info(f"{fallback_reason}. Falling back to on-demand.")
+            LOGGER.info("%s. Falling back to on-demand.", fallback_reason)
             return self._selection(
                 instance_type=config.instance_type,
                 az=None,
@@ -366,16 +627,29 @@ class SpotSelectionService(BaseService):
         # Successfully selected spot instance - log the decision
         savings_pct = float((on_demand_price - selected_price) / on_demand_price * 100)
         placement_score = analysis.placement_scores_by_az.get(selected_az, 0.0)
-        selection_reason = f"Best available spot price with capacity (placement score: {placement_score:.1f})"
+        selection_reason = (
+            "Best available spot price with capacity "
+            f"(placement score: {placement_score:.1f}, "
+            f"weighted score: {az_score(selected_az):.4f})"
+        )
 
         LOGGER.info(
-            f"Spot instance selected in {selected_az}: "
-            f"${selected_price:.4f}/hr (vs ${on_demand_price:.4f}/hr on-demand = {savings_pct:.1f}% savings). "
-            f"Stability score: {analysis.price_stability_score:.2f}, placement score: {placement_score:.1f}"
+            "Spot instance selected in %s: $%.4f/hr (vs $%.4f/hr on-demand = %.1f%% savings). "
+            "Stability score: %.2f, placement score: %.1f",
+            selected_az,
+            selected_price,
+            on_demand_price,
+            savings_pct,
+            analysis.price_stability_score,
+            placement_score,
         )
 
-        if unavailable_azs:
-            LOGGER.debug(f"Checked {len(unavailable_azs)} other AZ(s) with no capacity: {', '.join(unavailable_azs)}")
+        if unavailable_azs and LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Checked %d other AZ(s) with no capacity: %s",
+                len(unavailable_azs),
+                ", ".join(unavailable_azs),
+            )
 
         return self._selection(
             instance_type=config.instance_type,
@@ -399,17 +673,20 @@ class SpotSelectionService(BaseService):
         fallback_reason: str | None,
         source: str,
     ) -> InstanceSelection:
-        hourly_savings = (on_demand_price - price) if on_demand_price > price else Decimal("0.0")
-        monthly_savings = hourly_savings * Decimal("730")
-        comparison = SavingsComparison(
-            on_demand_hourly=on_demand_price,
-            selected_hourly=price,
-            hourly_savings=hourly_savings,
-            monthly_savings=monthly_savings,
-            savings_percentage=float(
-                (hourly_savings / on_demand_price * Decimal("100")) if on_demand_price else Decimal("0"),
-            ),
-        )
+        if not is_spot:
+            # Every on-demand path selects at the on-demand price, so savings are zero.
+            comparison = _zero_comparison(on_demand_price)
+        else:
+            hourly_savings = (on_demand_price - price) if on_demand_price > price else _ZERO
+            comparison = SavingsComparison(
+                on_demand_hourly=on_demand_price,
+                selected_hourly=price,
+                hourly_savings=hourly_savings,
+                monthly_savings=hourly_savings * _HOURS_PER_MONTH,
+                savings_percentage=float(
+                    (hourly_savings / on_demand_price * Decimal("100")) if on_demand_price else _ZERO,
+                ),
+            )
         return InstanceSelection(
             instance_type=instance_type,
             availability_zone=az,
@@ -423,53 +700,132 @@ class SpotSelectionService(BaseService):
 
     def _stability_scores(
         self,
-        instance_type: str,
-        region: str,
+        history: dict[str, list[float]],
         prices_by_az: dict[str, Decimal],
     ) -> dict[str, float]:
-        history = self._fetch_history(instance_type, region)
-        scores: dict[str, float] = {}
-        for az, samples in history.items():
-            if len(samples) < 2:
-                scores[az] = 1.0
-                continue
-            mean_price = sum(samples) / Decimal(len(samples))
-            if mean_price == 0:
-                scores[az] = 0.0
-                continue
-            variance = Decimal(pstdev(samples)) / mean_price
-            scores[az] = max(0.0, float(1 - variance))
+        scores = {az: self._stability_score(samples) for az, samples in history.items()}
         # Fill missing AZs from current prices
         for az in prices_by_az:
             scores.setdefault(az, 1.0)
         return scores
 
-    def _fetch_history(self, instance_type: str, region: str) -> dict[str, list[Decimal]]:
-        """Fetch 24h history for stability scoring, with a safe fallback."""
-        client = self._ec2(region)
-        start_time = datetime.now(UTC) - timedelta(hours=24)
-        try:
-            resp = client.describe_spot_price_history(
-                InstanceTypes=[instance_type],
-                ProductDescriptions=["Linux/UNIX"],
-                StartTime=start_time,
-                MaxResults=200,
-            )
-            history = resp.get("SpotPriceHistory", [])
-        except ClientError:
-            history = []
+    def _best_stability(self, history: dict[str, list[float]], prices_by_az: dict[str, Decimal]) -> float:
+        """Highest per-AZ stability score, i.e. ``max(_stability_scores(...).values())``.
+
+        Only the maximum is kept, and 1.0 is the ceiling: an AZ with fewer than two
+        samples (or none at all) reaches it, so the sample math is skipped entirely,
+        and the scan stops at the first AZ that scores 1.0.
+        """
+        if any(len(history.get(az, ())) < 2 for az in prices_by_az) or any(
+            len(samples) < 2 for samples in history.values()
+        ):
+            return 1.0
+        best = 0.0
+        for samples in history.values():
+            best = max(best, self._stability_score(samples))
+            if best >= 1.0:
+                break
+        return best
+
+    @staticmethod
+    def _stability_score(samples: list[float]) -> float:
+        """1 minus the relative standard deviation of an AZ's price samples, floored at 0."""
+        count = len(samples)
+        if count < 2:
+            return 1.0
+        # A statistical score, not money: float math avoids Decimal arithmetic
+        # over every sample and is plenty precise for a 0..1 ratio.
+        mean_price = fsum(samples) / count
+        if mean_price == 0:
+            return 0.0
+        # Population variance as E[x^2] - mean^2; sumprod runs the squares loop in C.
+        variance = max(0.0, sumprod(samples, samples) / count - mean_price * mean_price)
+        return max(0.0, 1.0 - sqrt(variance) / mean_price)
+
+    def _fetch_history(
+        self,
+        instance_types: list[str],
+        region: str,
+    ) -> tuple[dict[str, dict[str, list[float]]], dict[str, dict[str, Decimal]]]:
+        """Fetch 24h history for several types in one paginated request.
+
+        Returns the float samples grouped by type and AZ, plus the newest price per
+        type and AZ (the only values parsed as Decimal, since they are reported as money).
+        """
+        history = self._spot_price_history(
+            instance_types,
+            region,
+            datetime.now(UTC) - timedelta(hours=24),
+        )
 
-        grouped: dict[str, list[Decimal]] = {}
+        grouped: dict[str, dict[str, list[float]]] = {}
+        latest: dict[str, dict[str, tuple[datetime | None, str]]] = {}
         for entry in history:
+            instance_type = entry.get("InstanceType")
             az = entry.get("AvailabilityZone")
-            price = Decimal(str(entry.get("SpotPrice", "0")))
-            grouped.setdefault(az, []).append(price)
-        return grouped
+            if not instance_type or not az:
+                continue
+            raw_price = str(entry.get("SpotPrice", "0"))
+            grouped.setdefault(instance_type, {}).setdefault(az, []).append(float(raw_price))
+            timestamp = entry.get("Timestamp")
+            current = latest.setdefault(instance_type, {}).get(az)
+            if current is None or (timestamp and (current[0] is None or timestamp > current[0])):
+                latest[instance_type][az] = (timestamp, raw_price)
+
+        latest_prices = {
+            instance_type: {az: Decimal(raw_price) for az, (_, raw_price) in by_az.items()}
+            for instance_type, by_az in latest.items()
+        }
+        return grouped, latest_prices
+
+    def _spot_price_history(
+        self,
+        instance_types: list[str],
+        region: str,
+        start_time: datetime,
+    ) -> list[dict[str, Any]]:
+        """Page through spot price history (up to 1000 samples per type); empty on API errors.
+
+        Samples of all types share the pages, so each type is counted separately and
+        paging stops once every type has its fill.
+        """
+        params: dict[str, Any] = {
+            "InstanceTypes": instance_types,
+            "ProductDescriptions": ["Linux/UNIX"],
+            "StartTime": start_time,
+            "PaginationConfig": {"PageSize": min(200 * len(instance_types), 1000)},
+        }
+        remaining = dict.fromkeys(instance_types, self._MAX_HISTORY_SAMPLES)
+        history: list[dict[str, Any]] = []
+        try:
+            paginator = self._ec2(region).get_paginator("describe_spot_price_history")
+            for page in paginator.paginate(**params):
+                for entry in page.get("SpotPriceHistory", []):
+                    instance_type = entry.get("InstanceType")
+                    if remaining.get(instance_type, 0) > 0:
+                        remaining[instance_type] -= 1
+                        history.append(entry)
+                if not any(remaining.values()):
+                    break
+        except ClientError:
+            return []
+        return history
+
+    def _cloudwatch(self, region: str) -> Any:
+        if self._cloudwatch_client:
+            return self._cloudwatch_client
+        client = self._cloudwatch_clients.get(region)
+        if client is None:
+            client = self._cloudwatch_clients[region] = self._client_factory.get_client("cloudwatch", region=region)
+        return client
 
     def _ec2(self, region: str) -> Any:
         if self._ec2_client:
             return self._ec2_client
-        return self._client_factory.get_client("ec2", region=region)
+        client = self._ec2_clients.get(region)
+        if client is None:
+            client = self._ec2_clients[region] = self._client_factory.get_client("ec2", region=region)
+        return client
 
 
 __all__ = ["SpotSelectionService"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 
 from geusemaker.infra import AWSClientFactory
 from geusemaker.models.compute import InstanceSelection
@@ -18,6 +19,30 @@ from geusemaker.services.pricing import PricingService
 
 DATA_TRANSFER_GB_PRICE = Decimal("0.09")
 DEFAULT_HOURS_PER_MONTH = Decimal("730")
+# Precision kept for derived rates. Monthly-to-hourly divisions otherwise carry the full
+# 28-digit context into every later add, comparison and serialized report.
+_RATE_QUANTUM = Decimal("0.000001")
+_MONTHLY_QUANTUM = Decimal("0.0001")
+_REQUEST_BLOCK = Decimal(10_000)
+_ZERO = Decimal(0)
+
+
+def _as_hours(hours: int | Decimal) -> Decimal:
+    """Hours as Decimal, reusing the default month and already-converted values."""
+    if isinstance(hours, Decimal):
+        return hours
+    return DEFAULT_HOURS_PER_MONTH if hours == 730 else Decimal(hours)
+
+
+@lru_cache(maxsize=64)
+def _quantity(value: float) -> Decimal:
+    """Exact Decimal for a user-supplied quantity; sizes repeat, so conversions are memoized."""
+    return Decimal(repr(value))
+
+
+def _rate(value: Decimal) -> Decimal:
+    """Round a derived cost once, where it leaves the estimator."""
+    return value.quantize(_RATE_QUANTUM)
 
 
 class CostEstimator:
@@ -50,20 +75,21 @@ class CostEstimator:
     ) -> CostEstimate:
         """Return a complete cost estimate for a deployment config."""
         selection = selection or self._spot_selector.select_instance_type(config)
+        hours = _as_hours(hours_per_month)
         compute_cost = self.calculate_ec2_cost(
             instance_type=config.instance_type,
             is_spot=selection.is_spot,
             price_per_hour=selection.price_per_hour,
-            hours=hours_per_month,
+            hours=hours,
         )
 
         efs_pricing = self._pricing_service.get_efs_pricing(config.region)
-        storage_cost = self.calculate_efs_cost(storage_gb, efs_pricing, hours_per_month)
+        storage_cost = self.calculate_efs_cost(storage_gb, efs_pricing, hours)
 
         alb_cost = None
         if config.enable_alb or config.tier in ("automation", "gpu"):
             alb_pricing = self._pricing_service.get_alb_pricing(config.region)
-            alb_cost = self.calculate_alb_cost(alb_pricing, alb_lcus, hours_per_month)
+            alb_cost = self.calculate_alb_cost(alb_pricing, alb_lcus, hours)
 
         cf_cost = None
         if config.enable_cdn or config.tier == "gpu":
@@ -72,41 +98,33 @@ class CostEstimator:
                 data_transfer_gb,
                 cloudfront_requests,
                 cf_pricing,
-                hours_per_month,
+                hours,
             )
 
         data_transfer_cost = self.calculate_data_transfer_cost(
             data_transfer_gb=data_transfer_gb,
-            hours=hours_per_month,
+            hours=hours,
         )
 
-        total_hourly = (
-            compute_cost.hourly_cost
-            + storage_cost.hourly_cost
-            + data_transfer_cost.hourly_cost
-            + (alb_cost.hourly_cost if alb_cost else Decimal("0"))
-            + (cf_cost.hourly_cost if cf_cost else Decimal("0"))
-        )
-        total_monthly = (
-            compute_cost.monthly_cost
-            + storage_cost.monthly_cost
-            + data_transfer_cost.monthly_cost
-            + (alb_cost.monthly_cost if alb_cost else Decimal("0"))
-            + (cf_cost.monthly_cost if cf_cost else Decimal("0"))
-        )
+        # One pass over the components that apply, accumulating both totals.
+        total_hourly = total_monthly = _ZERO
+        for component in (compute_cost, storage_cost, data_transfer_cost, alb_cost, cf_cost):
+            if component is not None:
+                total_hourly += component.hourly_cost
+                total_monthly += component.monthly_cost
 
+        savings = selection.savings_vs_on_demand
+        on_demand_monthly = savings.on_demand_hourly * hours
         comparison = CostComparison(
-            spot_hourly=selection.price_per_hour
-            if selection.is_spot
-            else selection.savings_vs_on_demand.selected_hourly,
-            on_demand_hourly=selection.savings_vs_on_demand.on_demand_hourly,
-            spot_monthly=(selection.price_per_hour * Decimal(hours_per_month)).quantize(Decimal("0.0001"))
+            spot_hourly=selection.price_per_hour if selection.is_spot else savings.selected_hourly,
+            on_demand_hourly=savings.on_demand_hourly,
+            spot_monthly=(selection.price_per_hour * hours).quantize(_MONTHLY_QUANTUM)
             if selection.is_spot
-            else selection.savings_vs_on_demand.on_demand_hourly * Decimal(hours_per_month),
-            on_demand_monthly=selection.savings_vs_on_demand.on_demand_hourly * Decimal(hours_per_month),
-            hourly_savings=selection.savings_vs_on_demand.hourly_savings,
-            monthly_savings=selection.savings_vs_on_demand.monthly_savings,
-            savings_percentage=selection.savings_vs_on_demand.savings_percentage,
+            else on_demand_monthly,
+            on_demand_monthly=on_demand_monthly,
+            hourly_savings=savings.hourly_savings,
+            monthly_savings=savings.monthly_savings,
+            savings_percentage=savings.savings_percentage,
         )
 
         breakdown = CostBreakdown(
@@ -142,9 +160,9 @@ class CostEstimator:
         instance_type: str,
         is_spot: bool,
         price_per_hour: Decimal,
-        hours: int = 730,
+        hours: int | Decimal = 730,
     ) -> ComponentCost:
-        monthly_cost = price_per_hour * Decimal(hours)
+        monthly_cost = price_per_hour * _as_hours(hours)
         return ComponentCost(
             resource_type="compute",
             description=f"{'Spot' if is_spot else 'On-demand'} {instance_type}",
@@ -159,10 +177,10 @@ class CostEstimator:
         self,
         storage_gb: float,
         pricing,
-        hours_per_month: int,
+        hours_per_month: int | Decimal,
     ) -> ComponentCost:
-        monthly_cost = Decimal(str(storage_gb)) * pricing.standard_gb_month
-        hourly_cost = monthly_cost / Decimal(hours_per_month)
+        monthly_cost = _quantity(storage_gb) * pricing.standard_gb_month
+        hourly_cost = _rate(monthly_cost / _as_hours(hours_per_month))
         return ComponentCost(
             resource_type="storage",
             description="EFS storage (standard)",
@@ -177,10 +195,10 @@ class CostEstimator:
         self,
         pricing,
         expected_lcus: float,
-        hours_per_month: int,
+        hours_per_month: int | Decimal,
     ) -> ComponentCost:
-        hourly_cost = pricing.hourly_price + pricing.lcu_price * Decimal(str(expected_lcus))
-        monthly_cost = hourly_cost * Decimal(hours_per_month)
+        hourly_cost = pricing.hourly_price + pricing.lcu_price * _quantity(expected_lcus)
+        monthly_cost = hourly_cost * _as_hours(hours_per_month)
         return ComponentCost(
             resource_type="load_balancer",
             description="Application Load Balancer",
@@ -196,12 +214,12 @@ class CostEstimator:
         data_transfer_gb: float,
         requests: int,
         pricing,
-        hours_per_month: int,
+        hours_per_month: int | Decimal,
     ) -> ComponentCost:
-        monthly_transfer = Decimal(str(data_transfer_gb)) * pricing.data_transfer_gb
-        monthly_requests = (Decimal(requests) / Decimal(10_000)) * pricing.requests_per_10k
+        monthly_transfer = _quantity(data_transfer_gb) * pricing.data_transfer_gb
+        monthly_requests = (Decimal(requests) / _REQUEST_BLOCK) * pricing.requests_per_10k
         monthly_cost = monthly_transfer + monthly_requests
-        hourly_cost = monthly_cost / Decimal(hours_per_month)
+        hourly_cost = _rate(monthly_cost / _as_hours(hours_per_month))
         return ComponentCost(
             resource_type="cdn",
             description="CloudFront data + requests",
@@ -215,10 +233,10 @@ class CostEstimator:
     def calculate_data_transfer_cost(
         self,
         data_transfer_gb: float,
-        hours: int,
+        hours: int | Decimal,
     ) -> ComponentCost:
-        monthly_cost = Decimal(str(data_transfer_gb)) * DATA_TRANSFER_GB_PRICE
-        hourly_cost = monthly_cost / Decimal(hours)
+        monthly_cost = _quantity(data_transfer_gb) * DATA_TRANSFER_GB_PRICE
+        hourly_cost = _rate(monthly_cost / _as_hours(hours))
         return ComponentCost(
             resource_type="data_transfer",
             description="Data transfer out",
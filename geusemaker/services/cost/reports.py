@@ -18,7 +18,11 @@ class CostReportService:
         budget_status: BudgetStatus | None = None,
         cost_history: list[CostSnapshot] | None = None,
     ) -> dict:
-        """Return a dictionary with key cost metrics."""
+        """Return a JSON-ready dictionary with key cost metrics.
+
+        Nested models are dumped in pydantic's JSON mode, so Decimals and datetimes are
+        already strings and ``to_json`` needs no per-value ``default`` callback.
+        """
         total_cost_to_date = estimate.hourly_cost * Decimal(str(runtime_hours))
         return {
             "deployment": estimate.deployment_name,
@@ -28,8 +32,8 @@ class CostReportService:
             "monthly_cost": str(estimate.monthly_cost),
             "runtime_hours": runtime_hours,
             "cost_to_date": str(total_cost_to_date),
-            "budget": budget_status.model_dump() if budget_status else None,
-            "history": [snap.model_dump() for snap in cost_history or []],
+            "budget": budget_status.model_dump(mode="json") if budget_status else None,
+            "history": [snap.model_dump(mode="json") for snap in cost_history or []],
         }
 
     def snapshot(self, estimate: CostEstimate, runtime_hours: float) -> CostSnapshot:
@@ -43,7 +47,7 @@ class CostReportService:
 
     def to_json(self, report: dict) -> str:
         """Serialize a report dictionary to JSON."""
-        return json.dumps(report, separators=(",", ":"), default=str)
+        return json.dumps(report, separators=(",", ":"))
 
 
 __all__ = ["CostReportService"]
@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from geusemaker.infra import AWSClientFactory
 from geusemaker.models.cost import ResourceTags
 from geusemaker.services.base import BaseService
 
+_CREATED_AT_KEY = "geusemaker:created-at"
+# TagResources accepts at most 20 ARNs per request.
+_TAG_RESOURCES_BATCH = 20
+
+
+@lru_cache(maxsize=128)
+def _tag_template(deployment: str, tier: str, created_by: str) -> tuple[tuple[str, str], ...]:
+    """Validate the per-deployment tags once; only the creation time varies between calls."""
+    tags = ResourceTags(deployment=deployment, tier=tier, created_at="", created_by=created_by)
+    return tuple((tag["Key"], tag["Value"]) for tag in tags.to_aws())
+
 
 class ResourceTagger(BaseService):
     """Apply standardized GeuseMaker tags to AWS resources."""
@@ -21,13 +33,11 @@ class ResourceTagger(BaseService):
 
     def build_tags(self, deployment: str, tier: str, created_by: str = "geusemaker") -> list[dict[str, str]]:
         """Return standard tag set for a deployment."""
-        tags = ResourceTags(
-            deployment=deployment,
-            tier=tier,
-            created_at=datetime.now(UTC).isoformat(),
-            created_by=created_by,
-        )
-        return tags.to_aws()
+        created_at = datetime.now(UTC).isoformat()
+        return [
+            {"Key": key, "Value": created_at if key == _CREATED_AT_KEY else value}
+            for key, value in _tag_template(deployment, tier, created_by)
+        ]
 
     def tag_instances(self, instance_ids: list[str], tags: list[dict[str, str]]) -> Any:
         """Apply tags to EC2 instances."""
@@ -53,5 +63,25 @@ class ResourceTagger(BaseService):
 
         return self._safe_call(_call)
 
+    def tag_many(self, resource_arns: list[str], tags: list[dict[str, str]]) -> dict[str, Any]:
+        """Apply tags to resources of any service through the Resource Groups Tagging API.
+
+        One request covers up to 20 ARNs, so an instance, filesystem and ALB are tagged
+        in a single round trip instead of one per service. Returns the failures
+        reported by AWS, keyed by ARN (empty when everything was tagged).
+        """
+        tag_map = {tag["Key"]: tag["Value"] for tag in tags}
+        tagging = self._client("resourcegroupstaggingapi")
+        failed: dict[str, Any] = {}
+        for start in range(0, len(resource_arns), _TAG_RESOURCES_BATCH):
+            batch = resource_arns[start : start + _TAG_RESOURCES_BATCH]
+
+            def _call(batch: list[str] = batch) -> Any:
+                return tagging.tag_resources(ResourceARNList=batch, Tags=tag_map)
+
+            resp = self._safe_call(_call)
+            failed.update(resp.get("FailedResourcesMap", {}))
+        return failed
+
 
 __all__ = ["ResourceTagger"]
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from time import monotonic
-from typing import Any
+from typing import Any, TypeVar
 
 from botocore.exceptions import BotoCoreError, ClientError  # type: ignore[import-untyped]
 
@@ -28,6 +32,94 @@ from geusemaker.services.route53 import Route53Service
 from geusemaker.services.sg import SecurityGroupService
 from geusemaker.services.spot_automation import SpotAutomationService
 
+# Backoff for the delete retries below, used while a deleted ALB releases its target
+# group or certificate. botocore already retries throttling and 5xx errors (see
+# infra.clients.CLIENT_CONFIG); codes that outlast its budget get retried here as well.
+_IN_USE_BASE_DELAY_SECONDS = 2.0
+_IN_USE_MAX_DELAY_SECONDS = 30.0
+
+
+_THROTTLE_CODES: frozenset[str] = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "TooManyRequestsException",
+        "RequestThrottledException",
+    },
+)
+_TRANSIENT_CODES: frozenset[str] = frozenset({"ServiceUnavailable", "InternalError", "InternalFailure"})
+_THROTTLE_OR_TRANSIENT_CODES: frozenset[str] = _THROTTLE_CODES | _TRANSIENT_CODES
+_RETRYABLE_DELETE_CODES: frozenset[str] = frozenset({"ResourceInUse"}) | _THROTTLE_OR_TRANSIENT_CODES
+# Deleting something that no longer exists (e.g. when re-running an interrupted
+# destroy) is the outcome we wanted, not a failure.
+_NOT_FOUND_CODES: frozenset[str] = frozenset(
+    {
+        "InvalidInstanceID.NotFound",
+        "InvalidGroup.NotFound",
+        "InvalidSubnetID.NotFound",
+        "InvalidVpcID.NotFound",
+        "InvalidNetworkInterfaceID.NotFound",
+        "InvalidInternetGatewayID.NotFound",
+        "InvalidRouteTableID.NotFound",
+        "LoadBalancerNotFound",
+        "TargetGroupNotFound",
+        "FileSystemNotFound",
+        "MountTargetNotFound",
+        "NoSuchEntity",
+        "NoSuchDistribution",
+        "ResourceNotFoundException",
+    },
+)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given zero-based retry attempt."""
+    ceiling = min(_IN_USE_MAX_DELAY_SECONDS, _IN_USE_BASE_DELAY_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)  # noqa: S311 - jitter, not security
+
+
+_T = TypeVar("_T")
+
+
+def _already_gone(exc: Exception) -> bool:
+    """Return True when a delete failed only because the resource no longer exists."""
+    if isinstance(exc, AWSError):
+        return exc.code in _NOT_FOUND_CODES
+    if isinstance(exc, ClientError):
+        return exc.response.get("Error", {}).get("Code") in _NOT_FOUND_CODES
+    return False
+
+
+@dataclass(frozen=True)
+class _ResourceAction:
+    """How a single-resource teardown phase finds, describes and reports its resource."""
+
+    state_attr: str
+    label: str
+    failure: str
+
+
+@dataclass
+class _Teardown:
+    """Shared state for the phases of one ``destroy`` call.
+
+    Phases append to the result lists from the event loop and from worker threads;
+    each append is a single atomic list operation, so no further locking is needed.
+    """
+
+    state: DeploymentState
+    dry_run: bool
+    preserve_efs: bool
+    reused: frozenset[str]
+    present: frozenset[str]
+    progress: Callable[[str], None]
+    # One timestamp for the whole teardown keeps the audit trail consistent.
+    now: datetime
+    deleted: list[DeletedResource] = field(default_factory=list)
+    preserved: list[PreservedResource] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
 
 class DestructionService:
     """Destroy deployment resources while preserving reused assets."""
@@ -62,6 +154,73 @@ class DestructionService:
         self._ec2_raw = ec2_client or self.client_factory.get_client("ec2", region)
         self._elbv2_raw = elbv2_client or self.client_factory.get_client("elbv2", region)
 
+    # Upper bound on concurrent per-resource deletes (well below the client's connection pool).
+    MAX_PARALLEL_DELETES = 8
+    # Older states carry no provenance; only the network could have been reused.
+    _LEGACY_REUSED_NETWORK: frozenset[str] = frozenset({"vpc", "subnets"})
+
+    # Phases that simply preserve a reused resource or delete it with ``_delete_<phase>``.
+    # Keys double as the provenance key and the reported resource type.
+    _RESOURCE_ACTIONS: dict[str, _ResourceAction] = {
+        "cloudfront": _ResourceAction("cloudfront_id", "CloudFront distribution", "CloudFront deletion failed"),
+        "alb": _ResourceAction("alb_arn", "Application Load Balancer", "ALB deletion failed"),
+        "target_group": _ResourceAction("target_group_arn", "target group", "Target group cleanup failed"),
+        "iam_instance_profile": _ResourceAction(
+            "iam_instance_profile_name",
+            "IAM instance profile",
+            "IAM instance profile deletion failed",
+        ),
+        "iam_role": _ResourceAction("iam_role_name", "IAM role", "IAM role deletion failed"),
+        "security_group": _ResourceAction("security_group_id", "security group", "Security group deletion failed"),
+    }
+
+    # State attributes that give each phase something to do; phases whose attributes are
+    # all empty (partial deployments, failed creates) are not scheduled at all.
+    _PHASE_RESOURCES: dict[str, tuple[str, ...]] = {
+        "cloudfront": ("cloudfront_id",),
+        "spot_automation": ("auto_scaling_group_name", "launch_template_id"),
+        "deregister_targets": ("target_group_arn",),
+        "alb": ("alb_arn",),
+        "target_group": ("target_group_arn",),
+        "dns_certificate": ("alb_dns", "certificate_arn"),
+        "instance": ("instance_id",),
+        "iam_instance_profile": ("iam_instance_profile_name",),
+        "iam_role": ("iam_role_name",),
+        "efs_mount_targets": ("efs_id",),
+        "efs": ("efs_id",),
+        "security_group": ("security_group_id",),
+        "subnets": ("subnet_ids",),
+        "vpc": ("vpc_id",),
+    }
+
+    # Teardown phases and the phases each one must wait for. Independent branches run
+    # concurrently, so long waits (CloudFront propagation, instance termination, EFS
+    # mount target deletion) overlap instead of adding up. Listed in dependency order.
+    _PHASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+        # CloudFront uses the ALB as its origin.
+        ("cloudfront", ()),
+        # Stop replacement automation before deleting its ALB target group or IAM profile.
+        ("spot_automation", ()),
+        ("deregister_targets", ()),
+        # Deregistration only drains the target group; the ALB can go at the same time.
+        ("alb", ("cloudfront",)),
+        # The target group cannot be deleted while a listener (owned by the ALB) still
+        # references it.
+        ("target_group", ("alb", "deregister_targets", "spot_automation")),
+        # Alias records point at the ALB, and the certificate stays in use until its
+        # listener is gone.
+        ("dns_certificate", ("alb",)),
+        ("instance", ("spot_automation", "deregister_targets")),
+        ("iam_instance_profile", ("instance", "spot_automation")),
+        ("iam_role", ("iam_instance_profile",)),
+        ("efs_mount_targets", ("instance", "spot_automation")),
+        ("efs", ("efs_mount_targets",)),
+        # ENIs of the instance, mount targets and ALB hold the security group.
+        ("security_group", ("instance", "efs_mount_targets", "alb", "spot_automation")),
+        ("subnets", ("security_group",)),
+        ("vpc", ("subnets", "target_group", "dns_certificate", "efs")),
+    )
+
     def destroy(
         self,
         state: DeploymentState,
@@ -77,62 +236,133 @@ class DestructionService:
             preserve_efs: If True, preserve EFS filesystem and mount targets
             progress_callback: Optional callback to report progress (called with status messages)
         """
+        return asyncio.run(self.destroy_async(state, dry_run, preserve_efs, progress_callback))
+
+    async def destroy_async(
+        self,
+        state: DeploymentState,
+        dry_run: bool = False,
+        preserve_efs: bool = False,
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> DestructionResult:
+        """Awaitable form of :meth:`destroy` for callers already running an event loop."""
         start = monotonic()
-        deleted: list[DeletedResource] = []
-        preserved: list[PreservedResource] = []
-        errors: list[str] = []
-        provenance = self._provenance(state)
+        now = datetime.now(UTC)
+        progress_lock = threading.Lock()
 
         def _progress(msg: str) -> None:
+            # Phases report from worker threads; keep callbacks from interleaving.
             if progress_callback:
-                progress_callback(msg)
+                with progress_lock:
+                    progress_callback(msg)
+
+        ctx = _Teardown(
+            state=state,
+            dry_run=dry_run,
+            preserve_efs=preserve_efs,
+            reused=self._reused_resources(state),
+            present=self._present_phases(state),
+            progress=_progress,
+            now=now,
+        )
+        archived_path = await self._teardown(ctx)
+
+        duration = monotonic() - start
+        return DestructionResult(
+            success=not ctx.errors,
+            deleted_resources=ctx.deleted,
+            preserved_resources=ctx.preserved,
+            errors=ctx.errors,
+            duration_seconds=duration,
+            archived_state_path=archived_path,
+        )
+
+    async def _teardown(self, ctx: _Teardown) -> str | None:
+        """Run the teardown phases, then archive and remove the state file on one event loop."""
+        await self._run_phases(ctx)
+        if ctx.dry_run:
+            return None
+
+        state = ctx.state
+        ctx.progress("Archiving deployment state")
+        state.status = "terminated"
+        state.terminated_at = ctx.now
+        return str(await self.state_manager.retire_deployment(state))
+
+    async def _run_phases(self, ctx: _Teardown) -> None:
+        """Run every phase as soon as the phases it depends on have finished.
+
+        Phases record AWS failures in ``ctx.errors`` and carry on. Any other exception
+        stops the phases that depend on it and is re-raised once the rest have settled.
+        """
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def run(name: str, deps: tuple[str, ...]) -> None:
+            await asyncio.gather(*(tasks[dep] for dep in deps))
+            if name not in ctx.present:
+                return
+            action = self._RESOURCE_ACTIONS.get(name)
+            if action is not None:
+                await self._apply_resource_action(ctx, name, action)
+            else:
+                await getattr(self, f"_destroy_{name}")(ctx)
+
+        for name, deps in self._PHASES:
+            tasks[name] = asyncio.create_task(run(name, deps))
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _apply_resource_action(self, ctx: _Teardown, name: str, action: _ResourceAction) -> None:
+        """Preserve a reused resource, or delete it via ``_delete_<name>`` and record it.
 
-        # CloudFront cleanup (must be before ALB deletion - CloudFront depends on ALB as origin)
+        A ``_delete_<name>`` that records its own failure returns False, and the
+        resource is then left out of the deleted list.
+        """
+        resource_id = getattr(ctx.state, action.state_attr)
+        if not resource_id:
+            return
+        if name in ctx.reused:
+            ctx.progress(f"Preserving reused {action.label}")
+            ctx.preserved.append(PreservedResource(resource_type=name, resource_id=resource_id, reason="reused"))
+            return
+        ctx.progress(f"Deleting {action.label} {resource_id}")
         try:
-            if state.cloudfront_id:
-                if provenance.get("cloudfront") == "reused":
-                    _progress("Preserving reused CloudFront distribution")
-                    preserved.append(
-                        PreservedResource(
-                            resource_type="cloudfront",
-                            resource_id=state.cloudfront_id,
-                            reason="reused",
-                        ),
-                    )
-                else:
-                    _progress(f"Disabling CloudFront distribution {state.cloudfront_id}")
-                    if not dry_run:
-                        try:
-                            # Get current distribution config and ETag
-                            dist_resp = self.cloudfront.get_distribution(state.cloudfront_id)
-                            etag = dist_resp["ETag"]
-
-                            # Disable the distribution
-                            disable_resp = self.cloudfront.disable_distribution(state.cloudfront_id, etag)
-                            new_etag = disable_resp["ETag"]
-
-                            _progress("Waiting for CloudFront distribution to deploy (this may take several minutes)")
-                            self.cloudfront.wait_for_deployed(
-                                distribution_id=state.cloudfront_id,
-                                max_attempts=60,  # 30 minutes max
-                                delay=30,
-                            )
+            if not ctx.dry_run and await getattr(self, f"_delete_{name}")(ctx, resource_id) is False:
+                return
+        except (AWSError, ClientError, BotoCoreError) as exc:
+            if not _already_gone(exc):
+                ctx.errors.append(f"{action.failure}: {exc}")
+                return
+        ctx.deleted.append(self._deleted(name, resource_id, ctx.now))
+
+    async def _delete_cloudfront(self, ctx: _Teardown, distribution_id: str) -> None:
+        # Get current distribution config and ETag, then disable it reusing that config
+        dist_resp = await asyncio.to_thread(self.cloudfront.get_distribution, distribution_id)
+        disable_resp = await asyncio.to_thread(
+            self.cloudfront.disable_distribution,
+            distribution_id,
+            dist_resp["ETag"],
+            current_config=dist_resp["Distribution"]["DistributionConfig"],
+        )
 
-                            # Delete the distribution
-                            _progress(f"Deleting CloudFront distribution {state.cloudfront_id}")
-                            self.cloudfront.delete_distribution(state.cloudfront_id, new_etag)
-                        except AWSError as exc:
-                            errors.append(f"CloudFront deletion failed: {exc}")
-                    deleted.append(self._deleted("cloudfront", state.cloudfront_id))
-        except AWSError as exc:
-            errors.append(f"CloudFront cleanup failed: {exc}")
+        ctx.progress("Waiting for CloudFront distribution to deploy (this may take several minutes)")
+        await asyncio.to_thread(
+            self.cloudfront.wait_for_deployed,
+            distribution_id=distribution_id,
+            delay=None,  # adaptive polling, 35 minutes max
+        )
+        await asyncio.to_thread(self.cloudfront.delete_distribution, distribution_id, disable_resp["ETag"])
 
-        # Stop replacement automation before deleting its ALB target group or IAM profile.
+    async def _destroy_spot_automation(self, ctx: _Teardown) -> None:
+        state = ctx.state
         try:
             if state.auto_scaling_group_name or state.launch_template_id:
-                _progress("Deleting Spot interruption monitoring and Auto Scaling resources")
-                if not dry_run:
-                    self.spot_automation.delete(
+                ctx.progress("Deleting Spot interruption monitoring and Auto Scaling resources")
+                if not ctx.dry_run:
+                    await asyncio.to_thread(
+                        self.spot_automation.delete,
                         asg_name=state.auto_scaling_group_name,
                         launch_template_id=state.launch_template_id,
                         rule_names=state.spot_event_rule_names,
@@ -143,142 +373,95 @@ class DestructionService:
                         coordinator_role_name=state.spot_coordinator_role_name,
                     )
                 if state.auto_scaling_group_name:
-                    deleted.append(self._deleted("auto_scaling_group", state.auto_scaling_group_name))
+                    ctx.deleted.append(self._deleted("auto_scaling_group", state.auto_scaling_group_name, ctx.now))
                 if state.launch_template_id:
-                    deleted.append(self._deleted("launch_template", state.launch_template_id))
+                    ctx.deleted.append(self._deleted("launch_template", state.launch_template_id, ctx.now))
         except AWSError as exc:
-            errors.append(f"Spot automation cleanup failed: {exc}")
+            ctx.errors.append(f"Spot automation cleanup failed: {exc}")
 
-        # ALB cleanup (must be before EC2 instance termination)
-        # Order: deregister targets → delete listeners → delete ALB → delete target group
-        # The target group cannot be deleted while a listener still references it,
-        # so the ALB (which owns the listeners) must be deleted first.
+    async def _destroy_deregister_targets(self, ctx: _Teardown) -> None:
+        state = ctx.state
         try:
             if state.target_group_arn and state.instance_id:
-                if provenance.get("target_group") != "reused":
-                    _progress(f"Deregistering instance {state.instance_id} from target group")
-                    if not dry_run:
+                if "target_group" not in ctx.reused:
+                    ctx.progress(f"Deregistering instance {state.instance_id} from target group")
+                    if not ctx.dry_run:
                         try:
-                            self._elbv2_raw.deregister_targets(
+                            await asyncio.to_thread(
+                                self._elbv2_raw.deregister_targets,
                                 TargetGroupArn=state.target_group_arn,
                                 Targets=[{"Id": state.instance_id}],
                             )
                         except (ClientError, BotoCoreError) as exc:
-                            errors.append(f"Target deregistration failed: {exc}")
+                            ctx.errors.append(f"Target deregistration failed: {exc}")
         except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Target deregistration cleanup failed: {exc}")
+            ctx.errors.append(f"Target deregistration cleanup failed: {exc}")
 
-        try:
-            if state.alb_arn:
-                if provenance.get("alb") == "reused":
-                    _progress("Preserving reused ALB")
-                    preserved.append(
-                        PreservedResource(resource_type="alb", resource_id=state.alb_arn, reason="reused"),
-                    )
-                else:
-                    _progress("Deleting Application Load Balancer")
-                    if not dry_run:
-                        try:
-                            self._elbv2_raw.delete_load_balancer(LoadBalancerArn=state.alb_arn)
-                        except (ClientError, BotoCoreError) as exc:
-                            errors.append(f"ALB deletion failed: {exc}")
-                    deleted.append(self._deleted("alb", state.alb_arn))
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"ALB cleanup failed: {exc}")
+    async def _delete_alb(self, ctx: _Teardown, alb_arn: str) -> None:
+        await asyncio.to_thread(self._elbv2_raw.delete_load_balancer, LoadBalancerArn=alb_arn)
 
-        try:
-            if state.target_group_arn:
-                if provenance.get("target_group") == "reused":
-                    _progress("Preserving reused target group")
-                    preserved.append(
-                        PreservedResource(
-                            resource_type="target_group",
-                            resource_id=state.target_group_arn,
-                            reason="reused",
-                        ),
-                    )
-                else:
-                    _progress("Deleting target group")
-                    if not dry_run:
-                        self._delete_target_group_with_retry(state.target_group_arn, errors)
-                    deleted.append(self._deleted("target_group", state.target_group_arn))
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Target group cleanup failed: {exc}")
+    async def _delete_target_group(self, ctx: _Teardown, target_group_arn: str) -> bool:
+        return await asyncio.to_thread(self._delete_target_group_with_retry, target_group_arn, ctx.errors)
 
-        # Route 53 records and ACM certificate created for HTTPS (must be after ALB
-        # deletion: the alias records point at the ALB and the certificate cannot be
-        # deleted while an ALB listener still uses it)
+    async def _destroy_dns_certificate(self, ctx: _Teardown) -> None:
+        # Route 53 records and ACM certificate created for HTTPS
         try:
-            self._cleanup_dns_and_certificate(state, dry_run, deleted, errors, _progress)
+            await asyncio.to_thread(
+                self._cleanup_dns_and_certificate,
+                ctx.state,
+                ctx.dry_run,
+                ctx.deleted,
+                ctx.errors,
+                ctx.progress,
+                ctx.now,
+            )
         except AWSError as exc:
-            errors.append(f"DNS/certificate cleanup failed: {exc}")
+            ctx.errors.append(f"DNS/certificate cleanup failed: {exc}")
 
+    async def _destroy_instance(self, ctx: _Teardown) -> None:
+        state, _progress = ctx.state, ctx.progress
         try:
             if state.instance_id and not state.auto_scaling_group_name:
-                if provenance.get("instance") == "reused":
+                if "instance" in ctx.reused:
                     _progress("Preserving reused EC2 instance")
-                    preserved.append(
+                    ctx.preserved.append(
                         PreservedResource(resource_type="ec2_instance", resource_id=state.instance_id, reason="reused"),
                     )
                 else:
                     _progress("Terminating EC2 instance")
-                    if not dry_run:
-                        self.ec2.terminate_instance(state.instance_id)
+                    if not ctx.dry_run:
+                        await asyncio.to_thread(self.ec2.terminate_instance, state.instance_id)
                         _progress("Waiting for EC2 instance termination")
-                        self.ec2.wait_for_terminated(state.instance_id)
-                    deleted.append(self._deleted("ec2_instance", state.instance_id))
-        except AWSError as exc:
-            errors.append(f"Instance termination failed: {exc}")
-
-        # IAM cleanup: instance profile and role (must be after EC2 instance termination)
-        try:
-            if state.iam_instance_profile_name:
-                if provenance.get("iam_instance_profile") == "reused":
-                    _progress("Preserving reused IAM instance profile")
-                    preserved.append(
-                        PreservedResource(
-                            resource_type="iam_instance_profile",
-                            resource_id=state.iam_instance_profile_name,
-                            reason="reused",
-                        ),
-                    )
-                else:
-                    _progress(f"Deleting IAM instance profile {state.iam_instance_profile_name}")
-                    if not dry_run:
-                        self.iam.delete_instance_profile(
-                            state.iam_instance_profile_name,
-                            state.iam_role_name,
+                        # Poll every 2s (same 10 minute budget as the default waiter) so a
+                        # quick termination is noticed quickly.
+                        await asyncio.to_thread(
+                            self.ec2.wait_for_terminated,
+                            state.instance_id,
+                            delay=2,
+                            max_attempts=300,
                         )
-                    deleted.append(self._deleted("iam_instance_profile", state.iam_instance_profile_name))
+                    ctx.deleted.append(self._deleted("ec2_instance", state.instance_id, ctx.now))
         except AWSError as exc:
-            errors.append(f"IAM instance profile deletion failed: {exc}")
+            if _already_gone(exc):
+                ctx.deleted.append(self._deleted("ec2_instance", state.instance_id, ctx.now))
+            else:
+                ctx.errors.append(f"Instance termination failed: {exc}")
 
-        try:
-            if state.iam_role_name:
-                if provenance.get("iam_role") == "reused":
-                    _progress("Preserving reused IAM role")
-                    preserved.append(
-                        PreservedResource(
-                            resource_type="iam_role",
-                            resource_id=state.iam_role_name,
-                            reason="reused",
-                        ),
-                    )
-                else:
-                    _progress(f"Deleting IAM role {state.iam_role_name}")
-                    if not dry_run:
-                        self.iam.delete_role(state.iam_role_name)
-                    deleted.append(self._deleted("iam_role", state.iam_role_name))
-        except AWSError as exc:
-            errors.append(f"IAM role deletion failed: {exc}")
+    async def _delete_iam_instance_profile(self, ctx: _Teardown, profile_name: str) -> None:
+        await asyncio.to_thread(self.iam.delete_instance_profile, profile_name, ctx.state.iam_role_name)
+
+    async def _delete_iam_role(self, ctx: _Teardown, role_name: str) -> None:
+        await asyncio.to_thread(self.iam.delete_role, role_name)
 
+    async def _destroy_efs_mount_targets(self, ctx: _Teardown) -> None:
+        state, _progress = ctx.state, ctx.progress
         try:
             if state.efs_id:
-                if provenance.get("efs") == "reused" or preserve_efs:
-                    reason = "preserved by --preserve-efs flag" if preserve_efs else "reused"
+                if "efs" in ctx.reused or ctx.preserve_efs:
+                    reason = "preserved by --preserve-efs flag" if ctx.preserve_efs else "reused"
                     _progress(f"Preserving EFS mount targets ({reason})")
                     if state.efs_mount_target_id:
-                        preserved.append(
+                        ctx.preserved.append(
                             PreservedResource(
                                 resource_type="efs_mount_target",
                                 resource_id=state.efs_mount_target_id,
@@ -286,119 +469,134 @@ class DestructionService:
                             ),
                         )
                 else:
-                    mount_target_ids = self._mount_target_ids(state.efs_id, state.efs_mount_target_id)
-                    for mt_id in mount_target_ids:
+                    mount_target_ids = await asyncio.to_thread(
+                        self._mount_target_ids,
+                        state.efs_id,
+                        state.efs_mount_target_id,
+                    )
+
+                    # Mount targets are independent: request every deletion at once, then
+                    # wait for all of them together so teardown takes as long as the slowest.
+                    async def request_delete(mt_id: str) -> str | None:
+                        _progress(f"Deleting EFS mount target {mt_id}")
                         try:
-                            _progress(f"Deleting EFS mount target {mt_id}")
-                            if not dry_run:
-                                self.efs.delete_mount_target(mt_id)
-                                _progress(f"Waiting for EFS mount target {mt_id} deletion")
-                                self.efs.wait_for_mount_target_deleted(mt_id)
-                            deleted.append(self._deleted("efs_mount_target", mt_id))
+                            if not ctx.dry_run:
+                                await asyncio.to_thread(self.efs.delete_mount_target, mt_id)
                         except AWSError as exc:
-                            errors.append(f"EFS mount target {mt_id} deletion failed: {exc}")
+                            if not _already_gone(exc):
+                                ctx.errors.append(f"EFS mount target {mt_id} deletion failed: {exc}")
+                                return None
+                        return mt_id
+
+                    requested = await asyncio.gather(*(request_delete(mt_id) for mt_id in mount_target_ids))
+                    deleting = [mt_id for mt_id in requested if mt_id is not None]
+                    if deleting and not ctx.dry_run:
+                        _progress(f"Waiting for {len(deleting)} EFS mount target(s) to be deleted")
+                        outcomes = await asyncio.gather(
+                            *(
+                                asyncio.to_thread(self.efs.wait_for_mount_target_deleted, mt_id, delay=None)
+                                for mt_id in deleting
+                            ),
+                            return_exceptions=True,
+                        )
+                    else:
+                        outcomes = [None] * len(deleting)
+                    for mt_id, outcome in zip(deleting, outcomes, strict=True):
+                        if isinstance(outcome, AWSError):
+                            ctx.errors.append(f"EFS mount target {mt_id} deletion failed: {outcome}")
+                        elif isinstance(outcome, BaseException):
+                            raise outcome
+                        else:
+                            ctx.deleted.append(self._deleted("efs_mount_target", mt_id, ctx.now))
         except AWSError as exc:
-            errors.append(f"EFS mount target deletion failed: {exc}")
+            ctx.errors.append(f"EFS mount target deletion failed: {exc}")
 
+    async def _destroy_efs(self, ctx: _Teardown) -> None:
+        state, _progress = ctx.state, ctx.progress
         try:
             if state.efs_id:
-                if provenance.get("efs") == "reused" or preserve_efs:
-                    reason = "preserved by --preserve-efs flag" if preserve_efs else "reused"
+                if "efs" in ctx.reused or ctx.preserve_efs:
+                    reason = "preserved by --preserve-efs flag" if ctx.preserve_efs else "reused"
                     _progress(f"Preserving EFS filesystem ({reason})")
-                    preserved.append(PreservedResource(resource_type="efs", resource_id=state.efs_id, reason=reason))
+                    ctx.preserved.append(
+                        PreservedResource(resource_type="efs", resource_id=state.efs_id, reason=reason)
+                    )
                 else:
                     _progress("Deleting EFS filesystem")
-                    if not dry_run:
-                        self.efs.delete_filesystem(state.efs_id)
-                    deleted.append(self._deleted("efs", state.efs_id))
+                    if not ctx.dry_run:
+                        await asyncio.to_thread(self.efs.delete_filesystem, state.efs_id)
+                    ctx.deleted.append(self._deleted("efs", state.efs_id, ctx.now))
         except AWSError as exc:
-            errors.append(f"EFS deletion failed: {exc}")
+            if _already_gone(exc):
+                ctx.deleted.append(self._deleted("efs", state.efs_id, ctx.now))
+            else:
+                ctx.errors.append(f"EFS deletion failed: {exc}")
 
-        try:
-            if state.security_group_id:
-                if provenance.get("security_group") == "reused":
-                    _progress("Preserving reused security group")
-                    preserved.append(
-                        PreservedResource(
-                            resource_type="security_group",
-                            resource_id=state.security_group_id,
-                            reason="reused",
-                        ),
+    async def _delete_security_group(self, ctx: _Teardown, group_id: str) -> None:
+        await asyncio.to_thread(self.sg_service.delete_security_group, group_id)
+
+    async def _destroy_subnets(self, ctx: _Teardown) -> None:
+        state, _progress = ctx.state, ctx.progress
+        if "subnets" in ctx.reused:
+            _progress("Preserving reused subnets")
+            for subnet_id in state.subnet_ids:
+                ctx.preserved.append(PreservedResource(resource_type="subnet", resource_id=subnet_id, reason="reused"))
+            return
+
+        async def delete_subnet(subnet_id: str) -> None:
+            try:
+                if not ctx.dry_run:
+                    await asyncio.to_thread(
+                        self._retry_throttled, lambda: self._ec2_raw.delete_subnet(SubnetId=subnet_id)
                     )
-                else:
-                    _progress("Deleting security group")
-                    if not dry_run:
-                        self.sg_service.delete_security_group(state.security_group_id)
-                    deleted.append(self._deleted("security_group", state.security_group_id))
-        except AWSError as exc:
-            errors.append(f"Security group deletion failed: {exc}")
+            except (ClientError, BotoCoreError) as exc:
+                if not _already_gone(exc):
+                    ctx.errors.append(f"Subnet {subnet_id} deletion failed: {exc}")
+                    return
+            ctx.deleted.append(self._deleted("subnet", subnet_id, ctx.now))
 
-        try:
-            if provenance.get("subnets") != "reused":
-                _progress("Deleting subnets")
-                for subnet_id in state.subnet_ids:
-                    if not dry_run:
-                        self._ec2_raw.delete_subnet(SubnetId=subnet_id)
-                    deleted.append(self._deleted("subnet", subnet_id))
-            else:
-                _progress("Preserving reused subnets")
-                for subnet_id in state.subnet_ids:
-                    preserved.append(PreservedResource(resource_type="subnet", resource_id=subnet_id, reason="reused"))
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Subnet deletion failed: {exc}")
+        _progress("Deleting subnets")
+        # Subnets in one VPC have no dependencies on each other.
+        await asyncio.gather(*(delete_subnet(subnet_id) for subnet_id in state.subnet_ids))
 
+    async def _destroy_vpc(self, ctx: _Teardown) -> None:
+        state, _progress = ctx.state, ctx.progress
         try:
-            if provenance.get("vpc") != "reused":
+            if "vpc" not in ctx.reused:
                 _progress("Deleting VPC dependencies")
-                if not dry_run:
-                    self._delete_vpc_dependencies(state.vpc_id, state.stack_name, errors)
+                if not ctx.dry_run:
+                    await asyncio.to_thread(self._delete_vpc_dependencies, state.vpc_id, state.stack_name, ctx.errors)
                     _progress("Deleting VPC")
-                    self._ec2_raw.delete_vpc(VpcId=state.vpc_id)
-                deleted.append(self._deleted("vpc", state.vpc_id))
+                    await asyncio.to_thread(self._ec2_raw.delete_vpc, VpcId=state.vpc_id)
+                ctx.deleted.append(self._deleted("vpc", state.vpc_id, ctx.now))
             else:
                 _progress("Preserving reused VPC")
-                preserved.append(PreservedResource(resource_type="vpc", resource_id=state.vpc_id, reason="reused"))
+                ctx.preserved.append(PreservedResource(resource_type="vpc", resource_id=state.vpc_id, reason="reused"))
         except (ClientError, BotoCoreError) as exc:
-            errors.append(f"VPC deletion failed: {exc}")
-
-        archived_path: str | None = None
-        if not dry_run:
-            _progress("Archiving deployment state")
-            state.status = "terminated"
-            state.terminated_at = datetime.now(UTC)
-            archived = asyncio.run(self.state_manager.archive_deployment(state))
-            archived_path = str(archived)
-            asyncio.run(self.state_manager.delete_deployment(state.stack_name))
-
-        duration = monotonic() - start
-        return DestructionResult(
-            success=not errors,
-            deleted_resources=deleted,
-            preserved_resources=preserved,
-            errors=errors,
-            duration_seconds=duration,
-            archived_state_path=archived_path,
-        )
+            if _already_gone(exc):
+                ctx.deleted.append(self._deleted("vpc", state.vpc_id, ctx.now))
+            else:
+                ctx.errors.append(f"VPC deletion failed: {exc}")
 
-    def _deleted(self, resource_type: str, resource_id: str) -> DeletedResource:
+    def _deleted(self, resource_type: str, resource_id: str, deleted_at: datetime) -> DeletedResource:
         return DeletedResource(
             resource_type=resource_type,
             resource_id=resource_id,
-            deleted_at=datetime.now(UTC),
+            deleted_at=deleted_at,
             deletion_time_seconds=0.0,
         )
 
-    def _provenance(self, state: DeploymentState) -> dict[str, str]:
+    def _present_phases(self, state: DeploymentState) -> frozenset[str]:
+        """Return the phases with at least one resource recorded in the state."""
+        return frozenset(
+            name for name, attrs in self._PHASE_RESOURCES.items() if any(getattr(state, attr) for attr in attrs)
+        )
+
+    def _reused_resources(self, state: DeploymentState) -> frozenset[str]:
+        """Return the resource types that were reused rather than created by this deployment."""
         if state.resource_provenance:
-            return state.resource_provenance
-        prov = {
-            "vpc": "reused" if state.config.vpc_id else "created",
-            "subnets": "reused" if state.config.vpc_id else "created",
-            "security_group": "created",
-            "efs": "created",
-            "instance": "created",
-        }
-        return prov
+            return frozenset(key for key, origin in state.resource_provenance.items() if origin == "reused")
+        return self._LEGACY_REUSED_NETWORK if state.config.vpc_id else frozenset()
 
     def _cleanup_dns_and_certificate(
         self,
@@ -407,6 +605,7 @@ class DestructionService:
         deleted: list[DeletedResource],
         errors: list[str],
         _progress: Callable[[str], None],
+        now: datetime,
     ) -> None:
         """Delete Route 53 records and the ACM certificate created for HTTPS.
 
@@ -432,7 +631,7 @@ class DestructionService:
                     _progress(f"Deleting Route 53 {rrset['Type']} record for {domain}")
                     if not dry_run:
                         self.route53.delete_record_set(zone_id, rrset)
-                    deleted.append(self._deleted("route53_record", f"{rrset['Type']} {domain}"))
+                    deleted.append(self._deleted("route53_record", f"{rrset['Type']} {domain}", now))
             except AWSError as exc:
                 errors.append(f"Route 53 record cleanup for {domain} failed: {exc}")
 
@@ -464,7 +663,7 @@ class DestructionService:
         _progress(f"Deleting ACM certificate {cert_arn}")
         if not dry_run and not self._delete_certificate_with_retry(cert_arn, errors):
             return
-        deleted.append(self._deleted("acm_certificate", cert_arn))
+        deleted.append(self._deleted("acm_certificate", cert_arn, now))
 
         if validation_record and zone_id:
             try:
@@ -474,7 +673,7 @@ class DestructionService:
                     _progress(f"Deleting ACM validation record {validation_record['Name']}")
                     if not dry_run:
                         self.route53.delete_record_set(zone_id, rrset)
-                    deleted.append(self._deleted("route53_record", f"{rrset['Type']} {validation_record['Name']}"))
+                    deleted.append(self._deleted("route53_record", f"{rrset['Type']} {validation_record['Name']}", now))
             except AWSError as exc:
                 errors.append(f"ACM validation record cleanup failed: {exc}")
 
@@ -482,8 +681,7 @@ class DestructionService:
         self,
         target_group_arn: str,
         errors: list[str],
-        max_attempts: int = 6,
-        delay_seconds: int = 10,
+        max_attempts: int = 8,
     ) -> bool:
         """Delete a target group, retrying while the (async) ALB deletion releases it.
 
@@ -497,8 +695,10 @@ class DestructionService:
                 self._elbv2_raw.delete_target_group(TargetGroupArn=target_group_arn)
                 return True
             except ClientError as exc:
-                if exc.response["Error"]["Code"] == "ResourceInUse" and attempt < max_attempts - 1:
-                    _time.sleep(delay_seconds)
+                if _already_gone(exc):
+                    return True
+                if exc.response["Error"]["Code"] in _RETRYABLE_DELETE_CODES and attempt < max_attempts - 1:
+                    _time.sleep(_backoff_delay(attempt))
                     continue
                 errors.append(f"Target group deletion failed: {exc}")
                 return False
@@ -508,8 +708,7 @@ class DestructionService:
         self,
         certificate_arn: str,
         errors: list[str],
-        max_attempts: int = 6,
-        delay_seconds: int = 10,
+        max_attempts: int = 8,
     ) -> bool:
         """Delete an ACM certificate, retrying while the deleted ALB releases it."""
         import time as _time
@@ -519,13 +718,32 @@ class DestructionService:
                 self.acm.delete_certificate(certificate_arn)
                 return True
             except AWSError as exc:
-                if exc.code == "ResourceInUse" and attempt < max_attempts - 1:
-                    _time.sleep(delay_seconds)
+                if _already_gone(exc):
+                    return True
+                if exc.code in _RETRYABLE_DELETE_CODES and attempt < max_attempts - 1:
+                    _time.sleep(_backoff_delay(attempt))
                     continue
                 errors.append(f"ACM certificate deletion failed: {exc}")
                 return False
         return False
 
+    def _retry_throttled(self, call: Callable[[], _T], max_attempts: int = 6) -> _T:
+        """Run an EC2 delete, backing off while the API throttles or fails transiently.
+
+        Used for the fanned-out VPC teardown deletes, where a burst of calls can
+        outlast botocore's own retry budget.
+        """
+        import time as _time
+
+        for attempt in range(max_attempts - 1):
+            try:
+                return call()
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") not in _THROTTLE_OR_TRANSIENT_CODES:
+                    raise
+                _time.sleep(_backoff_delay(attempt))
+        return call()
+
     def _mount_target_ids(self, fs_id: str, fallback_mt: str | None) -> list[str]:
         """Return all mount target IDs for an EFS, with fallback to state value."""
         mount_targets = self.efs.list_mount_targets(fs_id)
@@ -538,75 +756,117 @@ class DestructionService:
         # Delete orphaned ALBs in this VPC first -- their managed ENIs block VPC deletion
         self._delete_orphan_albs_in_vpc(vpc_id, stack_name, errors)
 
-        # Delete network interfaces (must be done before VPC deletion)
-        try:
-            enis = self._ec2_raw.describe_network_interfaces(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]).get(
-                "NetworkInterfaces", []
-            )
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Describe network interfaces failed: {exc}")
-            enis = []
+        # The three lookups are independent; overlap them so they cost one round trip.
+        # Only "available" ENIs are listed: ENIs still attached to instances go away
+        # with the instance.
+        in_vpc = {"Name": "vpc-id", "Values": [vpc_id]}
+        enis, igws, route_tables = self._describe_concurrently(
+            errors,
+            (
+                "network interfaces",
+                "describe_network_interfaces",
+                "NetworkInterfaces",
+                [in_vpc, {"Name": "status", "Values": ["available"]}],
+            ),
+            (
+                "internet gateways",
+                "describe_internet_gateways",
+                "InternetGateways",
+                [{"Name": "attachment.vpc-id", "Values": [vpc_id]}],
+            ),
+            ("route tables", "describe_route_tables", "RouteTables", [in_vpc]),
+        )
 
-        for eni in enis:
+        # Delete detached network interfaces (must be done before VPC deletion)
+        def delete_eni(eni: dict[str, Any]) -> None:
             eni_id = eni.get("NetworkInterfaceId")
-            attachment = eni.get("Attachment", {})
-            description = eni.get("Description", "")
-
-            # Skip ENIs managed by ELB -- they are cleaned up when the ALB is deleted
-            if description.startswith("ELB "):
-                continue
-
-            # Skip network interfaces that are attached to running instances
-            # They will be deleted automatically when the instance is terminated
-            if attachment.get("Status") == "attached" and not description.startswith("ELB "):
-                continue
-
             try:
-                # Detach if still attached
-                if attachment:
-                    attachment_id = attachment.get("AttachmentId")
-                    if attachment_id:
-                        self._ec2_raw.detach_network_interface(AttachmentId=attachment_id, Force=True)
-                # Delete the network interface
-                self._ec2_raw.delete_network_interface(NetworkInterfaceId=eni_id)
+                self._retry_throttled(lambda: self._ec2_raw.delete_network_interface(NetworkInterfaceId=eni_id))
             except (ClientError, BotoCoreError) as exc:
-                errors.append(f"Network interface {eni_id} deletion failed: {exc}")
+                if not _already_gone(exc):
+                    errors.append(f"Network interface {eni_id} deletion failed: {exc}")
 
-        try:
-            igws = self._ec2_raw.describe_internet_gateways(
-                Filters=[{"Name": "attachment.vpc-id", "Values": [vpc_id]}]
-            ).get("InternetGateways", [])
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Describe internet gateways failed: {exc}")
-            igws = []
-
-        for igw in igws:
+        def delete_igw(igw: dict[str, Any]) -> None:
             igw_id = igw.get("InternetGatewayId")
             try:
-                attachments = igw.get("Attachments", [])
-                if any(att.get("VpcId") == vpc_id for att in attachments):
-                    self._ec2_raw.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
-                self._ec2_raw.delete_internet_gateway(InternetGatewayId=igw_id)
+                # An internet gateway attaches to at most one VPC.
+                attachments = igw.get("Attachments")
+                if attachments and attachments[0].get("VpcId") == vpc_id:
+                    self._retry_throttled(
+                        lambda: self._ec2_raw.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
+                    )
+                self._retry_throttled(lambda: self._ec2_raw.delete_internet_gateway(InternetGatewayId=igw_id))
             except (ClientError, BotoCoreError) as exc:
-                errors.append(f"Internet gateway {igw_id} deletion failed: {exc}")
+                if not _already_gone(exc):
+                    errors.append(f"Internet gateway {igw_id} deletion failed: {exc}")
 
-        try:
-            route_tables = self._ec2_raw.describe_route_tables(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]).get(
-                "RouteTables", []
-            )
-        except (ClientError, BotoCoreError) as exc:
-            errors.append(f"Describe route tables failed: {exc}")
-            route_tables = []
+        def delete_route_table(rt: dict[str, Any]) -> None:
+            rt_id = rt.get("RouteTableId")
+            try:
+                self._retry_throttled(lambda: self._ec2_raw.delete_route_table(RouteTableId=rt_id))
+            except (ClientError, BotoCoreError) as exc:
+                if not _already_gone(exc):
+                    errors.append(f"Route table {rt_id} deletion failed: {exc}")
 
+        # The main route table goes away with the VPC itself
+        non_main_route_tables = []
         for rt in route_tables:
-            rt_id = rt.get("RouteTableId")
-            associations = rt.get("Associations", [])
-            if any(assoc.get("Main") for assoc in associations):
-                continue
+            for assoc in rt.get("Associations", ()):
+                if assoc.get("Main"):
+                    break
+            else:
+                non_main_route_tables.append(rt)
+
+        # None of these depend on each other, so they share one pool instead of
+        # running as three batches. ENIs managed by ELB are cleaned up when the
+        # ALB is deleted.
+        self._delete_each(
+            (delete_eni, [eni for eni in enis if not eni.get("Description", "").startswith("ELB ")]),
+            (delete_igw, igws),
+            (delete_route_table, non_main_route_tables),
+        )
+
+    def _delete_each(self, *groups: tuple[Callable[[dict[str, Any]], None], list[dict[str, Any]]]) -> None:
+        """Run independent per-resource deletes concurrently, one ``(delete, items)`` pair per resource kind.
+
+        Each ``delete`` records its own failures; anything else it raises propagates.
+        """
+        jobs = [(delete, item) for delete, items in groups for item in items]
+        if len(jobs) <= 1:
+            for delete, item in jobs:
+                delete(item)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_DELETES, len(jobs))) as pool:
+            for future in [pool.submit(delete, item) for delete, item in jobs]:
+                future.result()
+
+    def _describe_concurrently(
+        self,
+        errors: list[str],
+        *lookups: tuple[str, str, str, list[dict[str, Any]]],
+    ) -> list[list[dict[str, Any]]]:
+        """Run filtered EC2 describe lookups in parallel, one ``(label, operation, key, filters)`` each.
+
+        A failed lookup is recorded in ``errors`` and yields an empty list.
+        """
+        with ThreadPoolExecutor(max_workers=len(lookups)) as pool:
+            futures = [
+                pool.submit(self._describe_all, operation, key, Filters=filters)
+                for _label, operation, key, filters in lookups
+            ]
+        results: list[list[dict[str, Any]]] = []
+        for (label, *_), future in zip(lookups, futures, strict=True):
             try:
-                self._ec2_raw.delete_route_table(RouteTableId=rt_id)
+                results.append(future.result())
             except (ClientError, BotoCoreError) as exc:
-                errors.append(f"Route table {rt_id} deletion failed: {exc}")
+                errors.append(f"Describe {label} failed: {exc}")
+                results.append([])
+        return results
+
+    def _describe_all(self, operation: str, key: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """Collect every item of a paginated EC2 describe call."""
+        paginator = self._ec2_raw.get_paginator(operation)
+        return [item for page in paginator.paginate(**kwargs) for item in page.get(key, [])]
 
     def _alb_belongs_to_stack(self, lb_arn: str, stack_name: str, errors: list[str]) -> bool:
         """Return True only when the ALB carries this stack's ``Stack`` tag.
@@ -0,0 +1,10 @@
+"""Helpers shared by the discovery services."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _tags_to_dict(tags: list[dict[str, Any]] | None) -> dict[str, str]:
+    """Flatten an AWS ``Tags`` list; AWS always returns both ``Key`` and ``Value``."""
+    return {tag["Key"]: tag["Value"] for tag in tags} if tags else {}
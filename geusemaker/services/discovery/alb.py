@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any
+
 from geusemaker.infra import AWSClientFactory
 from geusemaker.models.discovery import (
     ALBInfo,
@@ -13,9 +17,19 @@ from geusemaker.services.base import BaseService
 from geusemaker.services.discovery.cache import DiscoveryCache
 
 
+def _format_action(action: dict[str, Any]) -> str:
+    """Render a listener action as ``type`` or ``type:target-group-arn``."""
+    action_type = action.get("Type")
+    target_group_arn = action.get("TargetGroupArn")
+    return f"{action_type}:{target_group_arn}" if target_group_arn else str(action_type)
+
+
 class ALBDiscoveryService(BaseService):
     """Discover Application Load Balancers and assess readiness."""
 
+    # Upper bound on concurrent per-ALB listener/target group lookups.
+    MAX_PARALLEL_LOOKUPS = 8
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
@@ -24,7 +38,11 @@ class ALBDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._elbv2 = self._client("elbv2")
-        self._cache = cache or DiscoveryCache()
+        self._cache = cache or DiscoveryCache.default()
+
+    @cached_property
+    def _load_balancer_paginator(self) -> Any:
+        return self._elbv2.get_paginator("describe_load_balancers")
 
     def list_load_balancers(
         self,
@@ -38,15 +56,24 @@ class ALBDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[ALBInfo]:
-            paginator = self._elbv2.get_paginator("describe_load_balancers")
+            # search() filters each page lazily as it arrives.
+            pages = self._load_balancer_paginator.paginate()
+            lbs = [lb for lb in pages.search(f"LoadBalancers[?VpcId=='{vpc_id}']") if lb is not None]
+            if not lbs:
+                return []
             albs: list[ALBInfo] = []
-            for page in paginator.paginate():
-                for lb in page.get("LoadBalancers", []):
-                    if lb.get("VpcId") != vpc_id:
-                        continue
+            # Listener and target group lookups are independent, per ALB and of each other.
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_LOOKUPS, 2 * len(lbs))) as pool:
+                lookups = [
+                    (
+                        lb,
+                        pool.submit(self._describe_listeners, lb["LoadBalancerArn"]),
+                        pool.submit(self._describe_target_groups, lb["LoadBalancerArn"]),
+                    )
+                    for lb in lbs
+                ]
+                for lb, listeners, target_groups in lookups:
                     alb_arn = lb["LoadBalancerArn"]
-                    listeners = self._describe_listeners(alb_arn)
-                    target_groups = self._describe_target_groups(alb_arn)
                     availability_zones = [
                         zone.get("ZoneName") or zone.get("SubnetId", "") for zone in lb.get("AvailabilityZones", [])
                     ]
@@ -59,8 +86,8 @@ class ALBDiscoveryService(BaseService):
                             state=lb.get("State", {}).get("Code", "provisioning"),
                             vpc_id=lb.get("VpcId", vpc_id),
                             availability_zones=availability_zones,
-                            listeners=listeners,
-                            target_groups=target_groups,
+                            listeners=listeners.result(),
+                            target_groups=target_groups.result(),
                             tags={},
                         ),
                     )
@@ -90,10 +117,7 @@ class ALBDiscoveryService(BaseService):
         resp = self._elbv2.describe_listeners(LoadBalancerArn=alb_arn)
         listeners: list[ListenerInfo] = []
         for listener in resp.get("Listeners", []):
-            default_actions = [
-                f"{action.get('Type')}:{action.get('TargetGroupArn', '')}".rstrip(":")
-                for action in listener.get("DefaultActions", [])
-            ]
+            default_actions = [_format_action(action) for action in listener.get("DefaultActions", ())]
             listeners.append(
                 ListenerInfo(
                     arn=listener["ListenerArn"],
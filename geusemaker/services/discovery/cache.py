@@ -3,35 +3,59 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 from threading import Lock
-from typing import Generic, TypeVar
+from time import monotonic
+from typing import ClassVar, Generic, TypeVar
 
 _T = TypeVar("_T")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _CacheEntry(Generic[_T]):
     value: _T
-    expires_at: datetime
+    expires_at: float  # monotonic() deadline, immune to wall-clock changes
 
 
 class DiscoveryCache:
-    """Lightweight TTL cache used by discovery services."""
+    """Lightweight TTL cache used by discovery services.
+
+    Keys are namespaced by the service prefix before the first ``:`` (``albs:``,
+    ``efs:`` ...), and each namespace is stored separately so invalidating one
+    service's results does not scan everyone else's.
+    """
+
+    _default: ClassVar[DiscoveryCache | None] = None
+    _default_lock: ClassVar[Lock] = Lock()
 
     def __init__(self, default_ttl_seconds: int = 300):
         self.default_ttl_seconds = default_ttl_seconds
         self._lock = Lock()
-        self._store: dict[str, _CacheEntry[object]] = {}
+        self._shards: dict[str, dict[str, _CacheEntry[object]]] = {}
+
+    @classmethod
+    def default(cls) -> DiscoveryCache:
+        """Return the process-wide cache shared by discovery services not given their own."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def _namespace(key: str) -> str:
+        return key.partition(":")[0]
 
     def get(self, key: str) -> _T | None:
         """Return cached value if not expired."""
         with self._lock:
-            entry = self._store.get(key)
+            shard = self._shards.get(self._namespace(key))
+            if shard is None:
+                return None
+            entry = shard.get(key)
             if entry is None:
                 return None
-            if entry.expires_at <= datetime.now(UTC):
-                del self._store[key]
+            if entry.expires_at <= monotonic():
+                del shard[key]
                 return None
             return entry.value  # type: ignore[return-value]
 
@@ -39,20 +63,39 @@ class DiscoveryCache:
         """Store a value with TTL."""
         ttl = ttl_seconds or self.default_ttl_seconds
         with self._lock:
-            self._store[key] = _CacheEntry(
-                value=value,
-                expires_at=datetime.now(UTC) + timedelta(seconds=ttl),
+            self._shards.setdefault(self._namespace(key), {})[key] = _CacheEntry(
+                value=value, expires_at=monotonic() + ttl
             )
 
     def invalidate(self, prefix: str | None = None) -> None:
         """Invalidate entries optionally by prefix."""
         with self._lock:
             if prefix is None:
-                self._store.clear()
+                self._shards.clear()
                 return
-            for key in list(self._store.keys()):
-                if key.startswith(prefix):
-                    del self._store[key]
+            namespace, sep, rest = prefix.partition(":")
+            if not sep:
+                # Prefix of a namespace name itself, e.g. "sub" for "subnets:".
+                for name in [name for name in self._shards if name.startswith(prefix)]:
+                    del self._shards[name]
+                return
+            shard = self._shards.get(namespace)
+            if not shard:
+                return
+            if not rest:
+                del self._shards[namespace]
+                return
+            for key in [key for key in shard if key.startswith(prefix)]:
+                del shard[key]
+
+    def invalidate_vpc(self, vpc_id: str) -> None:
+        """Drop every result scoped to ``vpc_id`` along with the cached VPC listings."""
+        suffix = f":{vpc_id}"
+        with self._lock:
+            self._shards.pop("vpcs", None)
+            for shard in self._shards.values():
+                for key in [key for key in shard if key.endswith(suffix)]:
+                    del shard[key]
 
 
 __all__ = ["DiscoveryCache"]
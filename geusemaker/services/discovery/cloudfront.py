@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any
+
 from geusemaker.infra import AWSClientFactory
 from geusemaker.models.discovery import CloudFrontInfo, ValidationResult
 from geusemaker.services.base import BaseService
@@ -11,6 +15,14 @@ from geusemaker.services.discovery.cache import DiscoveryCache
 class CloudFrontDiscoveryService(BaseService):
     """Discover CloudFront distributions (global service)."""
 
+    # Fields read from each distribution. ListDistributions summaries normally carry
+    # them all, so get_distribution is only needed when one is missing.
+    _SUMMARY_FIELDS = frozenset({"Origins", "DefaultCacheBehavior", "ViewerCertificate", "Enabled"})
+    # Upper bound on concurrent get_distribution fallbacks.
+    MAX_PARALLEL_LOOKUPS = 8
+    # Longer TTL because CloudFront rarely changes quickly
+    CACHE_TTL_SECONDS = 600
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
@@ -19,8 +31,11 @@ class CloudFrontDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._cloudfront = self._client("cloudfront")
-        # Longer TTL because CloudFront rarely changes quickly
-        self._cache = cache or DiscoveryCache(default_ttl_seconds=600)
+        self._cache = cache or DiscoveryCache.default()
+
+    @cached_property
+    def _distributions_paginator(self) -> Any:
+        return self._cloudfront.get_paginator("list_distributions")
 
     def list_distributions(self, use_cache: bool = True) -> list[CloudFrontInfo]:
         """Return CloudFront distributions with key metadata."""
@@ -30,46 +45,20 @@ class CloudFrontDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[CloudFrontInfo]:
-            resp = self._cloudfront.list_distributions()
-            items = resp.get("DistributionList", {}).get("Items", []) or []
-            distributions: list[CloudFrontInfo] = []
-            for item in items:
-                dist_id = item["Id"]
-                detail = self._cloudfront.get_distribution(Id=dist_id).get(
-                    "Distribution",
-                    {},
-                )
-                config = detail.get("DistributionConfig", {})
-                origins_cfg = config.get("Origins", {}).get("Items", []) or []
-                origins = [origin.get("DomainName", "") for origin in origins_cfg]
-                default_cache_cfg = config.get("DefaultCacheBehavior", {})
-                default_cache = {
-                    "target_origin": default_cache_cfg.get("TargetOriginId", ""),
-                    "viewer_protocol_policy": default_cache_cfg.get(
-                        "ViewerProtocolPolicy",
-                        "",
-                    ),
-                }
-                viewer_cert = config.get("ViewerCertificate", {})
-                ssl_cert = viewer_cert.get("ACMCertificateArn") or viewer_cert.get(
-                    "IAMCertificateId",
-                )
-                distributions.append(
-                    CloudFrontInfo(
-                        distribution_id=dist_id,
-                        domain_name=item.get("DomainName", detail.get("DomainName", "")),
-                        status=item.get("Status", "InProgress"),
-                        origins=origins,
-                        default_cache_behavior=default_cache,
-                        enabled=config.get("Enabled", True),
-                        ssl_certificate=ssl_cert,
-                    ),
-                )
-            return distributions
+            items = [
+                item
+                for page in self._distributions_paginator.paginate()
+                for item in page.get("DistributionList", {}).get("Items", []) or []
+            ]
+            needs_detail = sum(not self._SUMMARY_FIELDS.issubset(item) for item in items)
+            if needs_detail <= 1:
+                return [self._distribution_info(item) for item in items]
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_LOOKUPS, needs_detail)) as pool:
+                return list(pool.map(self._distribution_info, items))
 
         distributions = self._safe_call(_call)
         if use_cache:
-            self._cache.set(cache_key, distributions)
+            self._cache.set(cache_key, distributions, ttl_seconds=self.CACHE_TTL_SECONDS)
         return distributions
 
     def validate_distribution_origin(
@@ -93,5 +82,34 @@ class CloudFrontDiscoveryService(BaseService):
             )
         return result
 
+    def _distribution_info(self, item: dict[str, Any]) -> CloudFrontInfo:
+        dist_id = item["Id"]
+        config = item
+        if not self._SUMMARY_FIELDS.issubset(item):
+            config = self._cloudfront.get_distribution(Id=dist_id).get("Distribution", {}).get("DistributionConfig", {})
+        origins_cfg = config.get("Origins", {}).get("Items", []) or []
+        origins = [origin.get("DomainName", "") for origin in origins_cfg]
+        default_cache_cfg = config.get("DefaultCacheBehavior", {})
+        default_cache = {
+            "target_origin": default_cache_cfg.get("TargetOriginId", ""),
+            "viewer_protocol_policy": default_cache_cfg.get(
+                "ViewerProtocolPolicy",
+                "",
+            ),
+        }
+        viewer_cert = config.get("ViewerCertificate", {})
+        ssl_cert = viewer_cert.get("ACMCertificateArn") or viewer_cert.get(
+            "IAMCertificateId",
+        )
+        return CloudFrontInfo(
+            distribution_id=dist_id,
+            domain_name=item.get("DomainName", ""),
+            status=item.get("Status", "InProgress"),
+            origins=origins,
+            default_cache_behavior=default_cache,
+            enabled=config.get("Enabled", True),
+            ssl_certificate=ssl_cert,
+        )
+
 
 __all__ = ["CloudFrontDiscoveryService"]
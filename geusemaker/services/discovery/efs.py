@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Any
 
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
@@ -13,16 +15,16 @@ from geusemaker.models.discovery import (
     ValidationResult,
 )
 from geusemaker.services.base import BaseService
+from geusemaker.services.discovery._util import _tags_to_dict
 from geusemaker.services.discovery.cache import DiscoveryCache
 
 
-def _tags_to_dict(tags: list[dict[str, Any]] | None) -> dict[str, str]:
-    return {tag["Key"]: tag["Value"] for tag in tags or [] if "Key" in tag and "Value" in tag}
-
-
 class EFSDiscoveryService(BaseService):
     """Discover EFS file systems and validate subnet coverage."""
 
+    # Upper bound on concurrent per-mount-target security group lookups.
+    MAX_PARALLEL_LOOKUPS = 8
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
@@ -31,7 +33,16 @@ class EFSDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._efs = self._client("efs")
-        self._cache = cache or DiscoveryCache()
+        self._cache = cache or DiscoveryCache.default()
+
+    # Created on first use and then reused; each paginate() call starts a fresh iteration.
+    @cached_property
+    def _file_system_paginator(self) -> Any:
+        return self._efs.get_paginator("describe_file_systems")
+
+    @cached_property
+    def _mount_target_paginator(self) -> Any:
+        return self._efs.get_paginator("describe_mount_targets")
 
     def list_file_systems(self, use_cache: bool = True) -> list[EFSInfo]:
         """List EFS file systems with mount targets."""
@@ -41,9 +52,8 @@ class EFSDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[EFSInfo]:
-            paginator = self._efs.get_paginator("describe_file_systems")
             items: list[EFSInfo] = []
-            for page in paginator.paginate():
+            for page in self._file_system_paginator.paginate():
                 for fs in page.get("FileSystems", []):
                     fs_id = fs["FileSystemId"]
                     tags = _tags_to_dict(fs.get("Tags"))
@@ -93,30 +103,39 @@ class EFSDiscoveryService(BaseService):
         return result
 
     def _describe_mount_targets(self, file_system_id: str) -> list[MountTargetInfo]:
-        paginator = self._efs.get_paginator("describe_mount_targets")
-        targets: list[MountTargetInfo] = []
-        for page in paginator.paginate(FileSystemId=file_system_id):
-            for target in page.get("MountTargets", []):
-                mt_id = target["MountTargetId"]
-                try:
-                    sg_resp = self._efs.describe_mount_target_security_groups(
-                        MountTargetId=mt_id,
-                    )
-                    sgs = sg_resp.get("SecurityGroups", [])
-                except ClientError:
-                    sgs = []
-                targets.append(
-                    MountTargetInfo(
-                        mount_target_id=mt_id,
-                        file_system_id=target.get("FileSystemId", file_system_id),
-                        subnet_id=target["SubnetId"],
-                        availability_zone=target.get("AvailabilityZoneId") or target.get("AvailabilityZoneName", ""),
-                        ip_address=target.get("IpAddress", ""),
-                        lifecycle_state=target.get("LifeCycleState", "available"),
-                        security_groups=sgs,
-                    ),
-                )
-        return targets
+        raw_targets = [
+            target
+            for page in self._mount_target_paginator.paginate(FileSystemId=file_system_id)
+            for target in page.get("MountTargets", [])
+        ]
+        mt_ids = [target["MountTargetId"] for target in raw_targets]
+        # EFS has no batch form of this call; fan the per-target lookups out instead.
+        if len(mt_ids) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_LOOKUPS, len(mt_ids))) as pool:
+                security_groups = list(pool.map(self._mount_target_security_groups, mt_ids))
+        else:
+            security_groups = [self._mount_target_security_groups(mt_id) for mt_id in mt_ids]
+        return [
+            MountTargetInfo(
+                mount_target_id=mt_id,
+                file_system_id=target.get("FileSystemId", file_system_id),
+                subnet_id=target["SubnetId"],
+                availability_zone=target.get("AvailabilityZoneId") or target.get("AvailabilityZoneName", ""),
+                ip_address=target.get("IpAddress", ""),
+                lifecycle_state=target.get("LifeCycleState", "available"),
+                security_groups=sgs,
+            )
+            for target, mt_id, sgs in zip(raw_targets, mt_ids, security_groups, strict=True)
+        ]
+
+    def _mount_target_security_groups(self, mount_target_id: str) -> list[str]:
+        try:
+            sg_resp = self._efs.describe_mount_target_security_groups(
+                MountTargetId=mount_target_id,
+            )
+        except ClientError:
+            return []
+        return sg_resp.get("SecurityGroups", [])
 
 
 __all__ = ["EFSDiscoveryService"]
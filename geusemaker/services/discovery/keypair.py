@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from geusemaker.infra import AWSClientFactory
 from geusemaker.models.discovery import KeyPairInfo
 from geusemaker.services.base import BaseService
+from geusemaker.services.discovery._util import _tags_to_dict
 from geusemaker.services.discovery.cache import DiscoveryCache
 
-
-def _tags_to_dict(tags: list[dict[str, Any]] | None) -> dict[str, str]:
-    return {tag["Key"]: tag["Value"] for tag in tags or [] if "Key" in tag and "Value" in tag}
+# Key types KeyPairInfo models; anything else is reported as "unknown".
+_KNOWN_KEY_TYPES = frozenset({"rsa", "ed25519"})
+# Fields DescribeKeyPairs always returns, fetched in one call per key pair.
+_KEY_PAIR_FIELDS = itemgetter("KeyName", "KeyFingerprint")
 
 
 class KeyPairDiscoveryService(BaseService):
     """List SSH key pairs in a region."""
 
+    # Upper bound on regions listed at once by list_key_pairs_multi.
+    MAX_PARALLEL_LOOKUPS = 8
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
@@ -25,7 +31,7 @@ class KeyPairDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._ec2 = self._client("ec2")
-        self._cache = cache or DiscoveryCache()
+        self._cache = cache or DiscoveryCache.default()
 
     def list_key_pairs(self, use_cache: bool = True) -> list[KeyPairInfo]:
         """Return key pair metadata for the region."""
@@ -35,17 +41,18 @@ class KeyPairDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[KeyPairInfo]:
-            response = self._ec2.describe_key_pairs()
+            response = self._ec2.describe_key_pairs(IncludePublicKey=False)
             pairs: list[KeyPairInfo] = []
             for kp in response.get("KeyPairs", []):
+                key_name, key_fingerprint = _KEY_PAIR_FIELDS(kp)
                 tags = _tags_to_dict(kp.get("Tags"))
                 key_type = (kp.get("KeyType") or "unknown").lower()
-                if key_type not in ("rsa", "ed25519"):
+                if key_type not in _KNOWN_KEY_TYPES:
                     key_type = "unknown"
                 pairs.append(
                     KeyPairInfo(
-                        key_name=kp.get("KeyName", ""),
-                        key_fingerprint=kp.get("KeyFingerprint", ""),
+                        key_name=key_name,
+                        key_fingerprint=key_fingerprint,
                         key_type=key_type,  # type: ignore[arg-type]
                         created_at=kp.get("CreateTime"),
                         tags=tags,
@@ -58,5 +65,21 @@ class KeyPairDiscoveryService(BaseService):
             self._cache.set(cache_key, pairs)
         return pairs
 
+    @classmethod
+    def list_key_pairs_multi(
+        cls,
+        client_factory: AWSClientFactory,
+        regions: list[str],
+        cache: DiscoveryCache | None = None,
+        use_cache: bool = True,
+    ) -> dict[str, list[KeyPairInfo]]:
+        """Return key pairs for several regions, listing the regions concurrently."""
+        services = [cls(client_factory, region=region, cache=cache) for region in dict.fromkeys(regions)]
+        if len(services) <= 1:
+            return {service.region: service.list_key_pairs(use_cache=use_cache) for service in services}
+        with ThreadPoolExecutor(max_workers=min(len(services), cls.MAX_PARALLEL_LOOKUPS)) as pool:
+            results = pool.map(lambda service: service.list_key_pairs(use_cache=use_cache), services)
+            return {service.region: pairs for service, pairs in zip(services, results, strict=True)}
+
 
 __all__ = ["KeyPairDiscoveryService"]
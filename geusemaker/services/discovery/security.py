@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Any
 
 from geusemaker.infra import AWSClientFactory
@@ -11,13 +12,10 @@ from geusemaker.models.discovery import (
     ValidationResult,
 )
 from geusemaker.services.base import BaseService
+from geusemaker.services.discovery._util import _tags_to_dict
 from geusemaker.services.discovery.cache import DiscoveryCache
 
 
-def _tags_to_dict(tags: list[dict[str, Any]] | None) -> dict[str, str]:
-    return {tag["Key"]: tag["Value"] for tag in tags or [] if "Key" in tag and "Value" in tag}
-
-
 class SecurityGroupDiscoveryService(BaseService):
     """Discover security groups and perform compatibility validation."""
 
@@ -29,7 +27,7 @@ class SecurityGroupDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._ec2 = self._client("ec2")
-        self._cache = cache or DiscoveryCache()
+        self._cache = cache or DiscoveryCache.default()
 
     def list_security_groups(
         self,
@@ -45,26 +43,26 @@ class SecurityGroupDiscoveryService(BaseService):
         def _call() -> list[SecurityGroupInfo]:
             paginator = self._ec2.get_paginator("describe_security_groups")
             groups: list[SecurityGroupInfo] = []
-            for page in paginator.paginate(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}],
-            ):
-                for sg in page.get("SecurityGroups", []):
-                    tags = _tags_to_dict(sg.get("Tags"))
-                    groups.append(
-                        SecurityGroupInfo(
-                            security_group_id=sg["GroupId"],
-                            name=sg.get("GroupName", ""),
-                            description=sg.get("Description", ""),
-                            vpc_id=sg.get("VpcId", vpc_id),
-                            ingress_rules=self._parse_rules(
-                                sg.get("IpPermissions", []),
-                            ),
-                            egress_rules=self._parse_rules(
-                                sg.get("IpPermissionsEgress", []),
-                            ),
-                            tags=tags,
+            pages = paginator.paginate(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
+            for sg in pages.search("SecurityGroups[]"):
+                if sg is None:
+                    continue
+                tags = _tags_to_dict(sg.get("Tags"))
+                groups.append(
+                    SecurityGroupInfo(
+                        security_group_id=sg["GroupId"],
+                        name=sg["GroupName"],
+                        description=sg["Description"],
+                        vpc_id=sg["VpcId"],
+                        ingress_rules=self._parse_rules(
+                            sg.get("IpPermissions", []),
                         ),
-                    )
+                        egress_rules=self._parse_rules(
+                            sg.get("IpPermissionsEgress", []),
+                        ),
+                        tags=tags,
+                    ),
+                )
             return groups
 
         groups = self._safe_call(_call)
@@ -79,8 +77,10 @@ class SecurityGroupDiscoveryService(BaseService):
     ) -> ValidationResult:
         """Validate that required ports are permitted."""
         result = ValidationResult.ok()
+        starts, ends = self._tcp_intervals(group.ingress_rules)
         for port in required_ports:
-            if not self._port_allowed(group.ingress_rules, port):
+            index = bisect_right(starts, port) - 1
+            if index < 0 or ends[index] < port:
                 result.add_issue(
                     f"Security group {group.security_group_id} is missing ingress for port {port}",
                 )
@@ -92,15 +92,23 @@ class SecurityGroupDiscoveryService(BaseService):
     ) -> list[SecurityGroupRule]:
         rules: list[SecurityGroupRule] = []
         for perm in permissions or []:
-            cidrs: list[str] = [rng["CidrIp"] for rng in perm.get("IpRanges", []) if "CidrIp" in rng]
-            cidrs.extend(rng["CidrIpv6"] for rng in perm.get("Ipv6Ranges", []) if "CidrIpv6" in rng)
-            source_groups = [grp["GroupId"] for grp in perm.get("UserIdGroupPairs", []) if "GroupId" in grp]
             description = perm.get("Description")
-            if description is None and perm.get("IpRanges"):
-                described = [rng.get("Description") for rng in perm["IpRanges"] if rng.get("Description")]
-                description = described[0] if described else None
+            # One pass over the IPv4 ranges collects CIDRs and the first range description.
+            cidrs: list[str] = []
+            for rng in perm.get("IpRanges", []):
+                cidr = rng.get("CidrIp")
+                if cidr is not None:
+                    cidrs.append(cidr)
+                if description is None:
+                    description = rng.get("Description") or None
+            for rng in perm.get("Ipv6Ranges", []):
+                cidr = rng.get("CidrIpv6")
+                if cidr is not None:
+                    cidrs.append(cidr)
+            source_groups = [grp["GroupId"] for grp in perm.get("UserIdGroupPairs", []) if "GroupId" in grp]
+            # Every field comes straight from the EC2 response, so validation is skipped.
             rules.append(
-                SecurityGroupRule(
+                SecurityGroupRule.model_construct(
                     protocol=perm.get("IpProtocol", "-1"),
                     from_port=perm.get("FromPort"),
                     to_port=perm.get("ToPort"),
@@ -111,14 +119,30 @@ class SecurityGroupDiscoveryService(BaseService):
             )
         return rules
 
-    def _port_allowed(self, rules: list[SecurityGroupRule], port: int) -> bool:
-        for rule in rules:
-            if rule.protocol in ("-1", "tcp"):
-                from_port = rule.from_port if rule.from_port is not None else port
-                to_port = rule.to_port if rule.to_port is not None else port
-                if from_port <= port <= to_port:
-                    return True
-        return False
+    def _tcp_intervals(self, rules: list[SecurityGroupRule]) -> tuple[list[int], list[int]]:
+        """Merge the port ranges open to TCP into sorted, disjoint ``(starts, ends)``.
+
+        A missing bound means the rule is open on that side (e.g. protocol ``-1``).
+        """
+        ranges = sorted(
+            (
+                rule.from_port if rule.from_port is not None else 0,
+                rule.to_port if rule.to_port is not None else 65535,
+            )
+            for rule in rules
+            if rule.protocol in ("-1", "tcp")
+        )
+        starts: list[int] = []
+        ends: list[int] = []
+        for start, end in ranges:
+            if start > end:
+                continue
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
 
 
 __all__ = ["SecurityGroupDiscoveryService"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any
 
 from geusemaker.infra import AWSClientFactory
@@ -11,16 +13,29 @@ from geusemaker.models.discovery import (
     VPCInfo,
 )
 from geusemaker.services.base import BaseService
+from geusemaker.services.discovery._util import _tags_to_dict
 from geusemaker.services.discovery.cache import DiscoveryCache
 
+# Fields DescribeVpcs/DescribeSubnets always return, fetched in one call per item.
+_VPC_FIELDS = itemgetter("VpcId", "CidrBlock", "State")
+_SUBNET_FIELDS = itemgetter("SubnetId", "VpcId", "CidrBlock", "AvailabilityZone", "AvailableIpAddressCount")
 
-def _tags_to_dict(tags: list[dict[str, Any]] | None) -> dict[str, str]:
-    return {tag["Key"]: tag["Value"] for tag in tags or [] if "Key" in tag and "Value" in tag}
+
+def _routes_to_internet_gateway(routes: list[dict[str, Any]]) -> bool:
+    """Return True if any live route targets an internet gateway."""
+    for route in routes:
+        gateway_id = route.get("GatewayId")
+        if gateway_id is not None and gateway_id.startswith("igw-") and route.get("State") != "blackhole":
+            return True
+    return False
 
 
 class VPCDiscoveryService(BaseService):
     """Discover VPCs, subnets, and run basic compatibility checks."""
 
+    # DescribeRouteTables caps MaxResults at 100; ask for full pages.
+    ROUTE_TABLE_PAGE_SIZE = 100
+
     def __init__(
         self,
         client_factory: AWSClientFactory,
@@ -29,7 +44,7 @@ class VPCDiscoveryService(BaseService):
     ):
         super().__init__(client_factory, region)
         self._ec2 = self._client("ec2")
-        self._cache = cache or DiscoveryCache()
+        self._cache = cache or DiscoveryCache.default()
 
     def list_vpcs(self, use_cache: bool = True) -> list[VPCInfo]:
         """List VPCs in the configured region."""
@@ -39,29 +54,35 @@ class VPCDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[VPCInfo]:
-            igw_map = self._internet_gateway_map()
             paginator = self._ec2.get_paginator("describe_vpcs")
+            # Internet gateways and VPCs are independent lookups; overlap the two.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                gateways = pool.submit(self._internet_gateway_map)
+                raw_vpcs = [vpc for vpc in paginator.paginate().search("Vpcs[]") if vpc is not None]
+                igw_map = gateways.result()
             vpcs: list[VPCInfo] = []
-            for page in paginator.paginate():
-                for vpc in page.get("Vpcs", []):
-                    tags = _tags_to_dict(vpc.get("Tags"))
-                    vpcs.append(
-                        VPCInfo(
-                            vpc_id=vpc["VpcId"],
-                            cidr_block=vpc["CidrBlock"],
-                            name=tags.get("Name"),
-                            state=vpc.get("State", "available"),
-                            is_default=vpc.get("IsDefault", False),
-                            has_internet_gateway=vpc["VpcId"] in igw_map,
-                            region=self.region,
-                            tags=tags,
-                        ),
-                    )
+            for vpc in raw_vpcs:
+                vpc_id, cidr_block, state = _VPC_FIELDS(vpc)
+                tags = _tags_to_dict(vpc.get("Tags"))
+                vpcs.append(
+                    VPCInfo(
+                        vpc_id=vpc_id,
+                        cidr_block=cidr_block,
+                        name=tags.get("Name"),
+                        state=state,
+                        is_default=vpc.get("IsDefault", False),
+                        has_internet_gateway=vpc_id in igw_map,
+                        region=self.region,
+                        tags=tags,
+                    ),
+                )
             return vpcs
 
         vpcs = self._safe_call(_call)
         if use_cache:
             self._cache.set(cache_key, vpcs)
+            # Cached alongside the list (same TTL) so lookups by ID skip the scan.
+            self._cache.set(f"{cache_key}:index", {vpc.vpc_id: vpc for vpc in vpcs})
         return vpcs
 
     def list_subnets(self, vpc_id: str, use_cache: bool = True) -> list[SubnetInfo]:
@@ -72,40 +93,40 @@ class VPCDiscoveryService(BaseService):
             return cached  # type: ignore[return-value]
 
         def _call() -> list[SubnetInfo]:
-            route_table_map, main_route_table = self._route_table_lookup(vpc_id)
             paginator = self._ec2.get_paginator("describe_subnets")
+            # Route tables and subnets are independent lookups; overlap the two.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                route_tables = pool.submit(self._route_table_lookup, vpc_id)
+                pages = paginator.paginate(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
+                raw_subnets = [subnet for subnet in pages.search("Subnets[]") if subnet is not None]
+                route_table_map, main_route_table = route_tables.result()
             items: list[SubnetInfo] = []
-            for page in paginator.paginate(
-                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}],
-            ):
-                for subnet in page.get("Subnets", []):
-                    subnet_id = subnet["SubnetId"]
-                    tags = _tags_to_dict(subnet.get("Tags"))
-                    route_table_id, has_igw = route_table_map.get(
-                        subnet_id,
-                        main_route_table,
-                    ) or (None, False)
-                    is_public = bool(has_igw or subnet.get("MapPublicIpOnLaunch"))
-                    items.append(
-                        SubnetInfo(
-                            subnet_id=subnet_id,
-                            vpc_id=subnet["VpcId"],
-                            cidr_block=subnet["CidrBlock"],
-                            availability_zone=subnet["AvailabilityZone"],
-                            available_ip_count=int(
-                                subnet.get("AvailableIpAddressCount", 0),
-                            ),
-                            name=tags.get("Name"),
-                            is_public=is_public,
-                            map_public_ip_on_launch=subnet.get(
-                                "MapPublicIpOnLaunch",
-                                False,
-                            ),
-                            route_table_id=route_table_id,
-                            has_internet_route=has_igw,
-                            tags=tags,
+            for subnet in raw_subnets:
+                subnet_id, subnet_vpc_id, cidr_block, availability_zone, available_ip_count = _SUBNET_FIELDS(subnet)
+                tags = _tags_to_dict(subnet.get("Tags"))
+                route_table_id, has_igw = route_table_map.get(
+                    subnet_id,
+                    main_route_table,
+                ) or (None, False)
+                is_public = bool(has_igw or subnet.get("MapPublicIpOnLaunch"))
+                items.append(
+                    SubnetInfo(
+                        subnet_id=subnet_id,
+                        vpc_id=subnet_vpc_id,
+                        cidr_block=cidr_block,
+                        availability_zone=availability_zone,
+                        available_ip_count=available_ip_count,
+                        name=tags.get("Name"),
+                        is_public=is_public,
+                        map_public_ip_on_launch=subnet.get(
+                            "MapPublicIpOnLaunch",
+                            False,
                         ),
-                    )
+                        route_table_id=route_table_id,
+                        has_internet_route=has_igw,
+                        tags=tags,
+                    ),
+                )
             return items
 
         subnets = self._safe_call(_call)
@@ -115,10 +136,9 @@ class VPCDiscoveryService(BaseService):
 
     def validate_vpc(self, vpc_id: str) -> ValidationResult:
         """Validate VPC readiness for deployment (IGW + available state)."""
-        vpcs = [v for v in self.list_vpcs() if v.vpc_id == vpc_id]
-        if not vpcs:
+        vpc = self._vpc_index().get(vpc_id)
+        if vpc is None:
             return ValidationResult.failed(f"VPC {vpc_id} not found in {self.region}")
-        vpc = vpcs[0]
         result = ValidationResult.ok()
         if vpc.state != "available":
             result.add_issue(f"VPC {vpc_id} is in {vpc.state} state")
@@ -131,7 +151,8 @@ class VPCDiscoveryService(BaseService):
         if not subnets:
             return ValidationResult.failed("No subnets provided for validation")
         result = ValidationResult.ok()
-        azs = {subnet.availability_zone for subnet in subnets}
+        first_az = subnets[0].availability_zone
+        multi_az = any(subnet.availability_zone != first_az for subnet in subnets)
         for subnet in subnets:
             if subnet.route_table_id is None:
                 result.add_issue(
@@ -142,22 +163,30 @@ class VPCDiscoveryService(BaseService):
                     f"Subnet {subnet.subnet_id} lacks a route to an internet gateway",
                     level="warning",
                 )
-        if len(azs) == 1:
+        if not multi_az:
             result.add_issue(
                 "All subnets are in the same availability zone; consider spreading across AZs",
                 level="warning",
             )
         return result
 
+    def _vpc_index(self) -> dict[str, VPCInfo]:
+        """Return VPCs keyed by ID, reusing the index cached with the VPC listing."""
+        index: dict[str, VPCInfo] | None = self._cache.get(f"vpcs:{self.region}:index")
+        if index is None:
+            index = {vpc.vpc_id: vpc for vpc in self.list_vpcs()}
+        return index
+
     def _internet_gateway_map(self) -> set[str]:
-        gateways = self._ec2.describe_internet_gateways()
-        attached_vpcs: set[str] = set()
-        for igw in gateways.get("InternetGateways", []):
-            for attachment in igw.get("Attachments", []):
-                vpc_id = attachment.get("VpcId")
-                if vpc_id:
-                    attached_vpcs.add(vpc_id)
-        return attached_vpcs
+        gateways = self._ec2.describe_internet_gateways(
+            Filters=[{"Name": "attachment.state", "Values": ["available"]}],
+        )
+        return {
+            attachment["VpcId"]
+            for igw in gateways["InternetGateways"]
+            for attachment in igw.get("Attachments", ())
+            if attachment.get("VpcId")
+        }
 
     def _route_table_lookup(
         self,
@@ -167,21 +196,21 @@ class VPCDiscoveryService(BaseService):
         paginator = self._ec2.get_paginator("describe_route_tables")
         subnet_map: dict[str, tuple[str, bool]] = {}
         main: tuple[str, bool] | None = None
-        for page in paginator.paginate(
+        pages = paginator.paginate(
             Filters=[{"Name": "vpc-id", "Values": [vpc_id]}],
-        ):
-            for rt in page.get("RouteTables", []):
-                rt_id = rt["RouteTableId"]
-                has_igw = any(
-                    route.get("GatewayId", "").startswith("igw-") and route.get("State") != "blackhole"
-                    for route in rt.get("Routes", [])
-                )
-                for assoc in rt.get("Associations", []):
-                    if assoc.get("Main"):
-                        main = (rt_id, has_igw)
-                    subnet_id = assoc.get("SubnetId")
-                    if subnet_id:
-                        subnet_map[subnet_id] = (rt_id, has_igw)
+            PaginationConfig={"PageSize": self.ROUTE_TABLE_PAGE_SIZE},
+        )
+        for rt in pages.search("RouteTables[]"):
+            if rt is None:
+                continue
+            rt_id = rt["RouteTableId"]
+            has_igw = _routes_to_internet_gateway(rt.get("Routes", []))
+            for assoc in rt.get("Associations", []):
+                if assoc.get("Main"):
+                    main = (rt_id, has_igw)
+                subnet_id = assoc.get("SubnetId")
+                if subnet_id:
+                    subnet_map[subnet_id] = (rt_id, has_igw)
         return subnet_map, main
 
 
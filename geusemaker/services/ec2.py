@@ -270,12 +270,26 @@ class EC2Service(BaseService):
 
         self._safe_call(_call)
 
-    def wait_for_terminated(self, instance_id: str) -> None:
-        """Wait until an instance is terminated."""
+    def wait_for_terminated(
+        self,
+        instance_id: str,
+        delay: int | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """Wait until an instance is terminated.
+
+        ``delay``/``max_attempts`` override the botocore waiter's 15s x 40 polling.
+        """
+        waiter_config = {
+            key: value for key, value in (("Delay", delay), ("MaxAttempts", max_attempts)) if value is not None
+        }
 
         def _call() -> None:
             waiter = self._ec2.get_waiter("instance_terminated")
-            waiter.wait(InstanceIds=[instance_id])
+            if waiter_config:
+                waiter.wait(InstanceIds=[instance_id], WaiterConfig=waiter_config)
+            else:
+                waiter.wait(InstanceIds=[instance_id])
 
         self._safe_call(_call)
 
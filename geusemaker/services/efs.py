@@ -8,6 +8,11 @@ from typing import Any
 from geusemaker.infra import AWSClientFactory
 from geusemaker.services.base import BaseService
 
+# Adaptive mount target deletion polling (wait_for_mount_target_deleted(delay=None)).
+_FAST_POLL_SECONDS = 2.0
+_FAST_POLL_WINDOW_SECONDS = 30.0
+_SLOW_POLL_SECONDS = 10.0
+
 
 class EFSService(BaseService):
     """Manage EFS lifecycle."""
@@ -162,38 +167,67 @@ class EFSService(BaseService):
 
         return self._safe_call(_call)
 
-    def wait_for_mount_target_deleted(self, mount_target_id: str, max_attempts: int = 60, delay: int = 5) -> None:
-        """Wait until an EFS mount target is fully deleted."""
+    def wait_for_mount_target_deleted(
+        self,
+        mount_target_id: str,
+        max_attempts: int = 60,
+        delay: float | None = 5,
+        timeout_seconds: float = 300,
+    ) -> None:
+        """Wait until an EFS mount target is fully deleted.
+
+        ``delay=None`` polls adaptively instead of every ``delay`` seconds: every 2s
+        for the first 30s (most mount targets are gone by then), then every 10s until
+        ``timeout_seconds`` elapse.
+        """
         from botocore.exceptions import ClientError
 
-        def _call() -> None:
-            for attempt in range(max_attempts):
-                try:
-                    resp = self._efs.describe_mount_targets(MountTargetId=mount_target_id)
-                except ClientError as exc:
-                    # MountTargetNotFound means it's already gone -- treat as success
-                    if exc.response.get("Error", {}).get("Code") == "MountTargetNotFound":
-                        return
-                    raise
-
-                targets = resp.get("MountTargets", [])
-                if not targets:
-                    return
+        def _deleted() -> bool:
+            try:
+                resp = self._efs.describe_mount_targets(MountTargetId=mount_target_id)
+            except ClientError as exc:
+                # MountTargetNotFound means it's already gone -- treat as success
+                if exc.response.get("Error", {}).get("Code") == "MountTargetNotFound":
+                    return True
+                raise
 
-                state = targets[0].get("LifeCycleState")
-                if state == "deleted":
-                    return
-                if state not in ("deleting", "available", "creating"):
-                    raise RuntimeError(f"EFS mount target {mount_target_id} entered invalid state: {state}")
+            targets = resp.get("MountTargets", [])
+            if not targets:
+                return True
 
+            state = targets[0].get("LifeCycleState")
+            if state == "deleted":
+                return True
+            if state not in ("deleting", "available", "creating"):
+                raise RuntimeError(f"EFS mount target {mount_target_id} entered invalid state: {state}")
+            return False
+
+        def _call(fixed_delay: float) -> None:
+            for attempt in range(max_attempts):
+                if _deleted():
+                    return
                 if attempt < max_attempts - 1:
-                    time.sleep(delay)
+                    time.sleep(fixed_delay)
 
             raise RuntimeError(
-                f"EFS mount target {mount_target_id} did not delete within {max_attempts * delay} seconds (timeout)"
+                f"EFS mount target {mount_target_id} did not delete within {max_attempts * fixed_delay} seconds (timeout)"
             )
 
-        self._safe_call(_call)
+        def _call_adaptive() -> None:
+            started = time.monotonic()
+            while not _deleted():
+                elapsed = time.monotonic() - started
+                if elapsed >= timeout_seconds:
+                    raise RuntimeError(
+                        f"EFS mount target {mount_target_id} did not delete within {timeout_seconds:.0f} seconds (timeout)"
+                    )
+                poll = _FAST_POLL_SECONDS if elapsed < _FAST_POLL_WINDOW_SECONDS else _SLOW_POLL_SECONDS
+                time.sleep(min(poll, timeout_seconds - elapsed))
+
+        if delay is None:
+            self._safe_call(_call_adaptive)
+        else:
+            self._safe_call(lambda: _call(delay))
 
 
 __all__ = ["EFSService"]
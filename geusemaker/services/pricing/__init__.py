@@ -20,8 +20,14 @@ from geusemaker.services.pricing.elb import ELBPricingService
 class PricingService:
     """High-level pricing façade exposing resource-specific services."""
 
-    def __init__(self, client_factory: AWSClientFactory, region: str = "us-east-1", cache_ttl_seconds: int = 900):
-        cache = PricingCache(ttl_seconds=cache_ttl_seconds)
+    def __init__(
+        self,
+        client_factory: AWSClientFactory,
+        region: str = "us-east-1",
+        cache_ttl_seconds: int = 900,
+        list_price_ttl_seconds: int = 86_400,
+    ):
+        cache = PricingCache(ttl_seconds=cache_ttl_seconds, list_price_ttl_seconds=list_price_ttl_seconds)
         self.ec2 = EC2PricingService(client_factory, cache=cache, region=region)
         self.efs = EFSPricingService(client_factory, cache=cache, region=region)
         self.elb = ELBPricingService(client_factory, cache=cache, region=region)
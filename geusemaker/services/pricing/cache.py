@@ -7,10 +7,16 @@ from typing import Any
 
 
 class PricingCache:
-    """Simple in-memory cache with TTL semantics."""
+    """Simple in-memory cache with TTL semantics.
 
-    def __init__(self, ttl_seconds: int = 900):
+    Spot prices move within minutes and use ``ttl_seconds``; published list prices
+    (on-demand, EFS, ALB, CloudFront) change rarely and are stored with the longer
+    ``list_price_ttl_seconds``.
+    """
+
+    def __init__(self, ttl_seconds: int = 900, list_price_ttl_seconds: int = 86_400):
         self.ttl_seconds = ttl_seconds
+        self.list_price_ttl_seconds = list_price_ttl_seconds
         self._store: dict[str, tuple[datetime, Any]] = {}
 
     def get(self, key: str) -> Any | None:
@@ -24,9 +30,10 @@ class PricingCache:
             return None
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """Store a value with an expiry time."""
-        expires_at = datetime.now(UTC) + timedelta(seconds=self.ttl_seconds)
+    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """Store a value with an expiry time (``ttl_seconds`` overrides the default)."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = datetime.now(UTC) + timedelta(seconds=ttl)
         self._store[key] = (expires_at, value)
 
     def invalidate(self, key: str | None = None) -> None:
@@ -48,7 +48,7 @@ class CloudFrontPricingService(BaseService):
             return cached
 
         pricing = DEFAULT_CF.get(price_class, DEFAULT_CF["PriceClass_100"])
-        self.cache.set(cache_key, pricing)
+        self.cache.set(cache_key, pricing, ttl_seconds=self.cache.list_price_ttl_seconds)
         return pricing
 
 
@@ -56,6 +56,7 @@ class EC2PricingService(BaseService):
             region="us-east-1",
         )
         self._ec2_client = ec2_client
+        self._ec2_clients: dict[str, Any] = {}  # Cache region -> ec2 client
 
     def get_spot_prices(self, instance_type: str, region: str) -> list[SpotPrice]:
         """Return recent spot prices by AZ for an instance type."""
@@ -150,9 +151,12 @@ class EC2PricingService(BaseService):
                 operating_system=operating_system,  # type: ignore[arg-type]
             )
 
+        # Live list prices are kept for a day; fallbacks expire sooner so the API is retried.
+        ttl_seconds: int | None = self.cache.list_price_ttl_seconds
         try:
             od_price = self._safe_call(_call)
         except (RuntimeError, ClientError):
+            ttl_seconds = None
             od_price = OnDemandPrice(
                 instance_type=instance_type,
                 price_per_hour=self._fallback_on_demand(instance_type),
@@ -160,7 +164,7 @@ class EC2PricingService(BaseService):
                 operating_system=operating_system,  # type: ignore[arg-type]
             )
 
-        self.cache.set(cache_key, od_price)
+        self.cache.set(cache_key, od_price, ttl_seconds=ttl_seconds)
         return od_price
 
     def _fallback_on_demand(self, instance_type: str) -> Decimal:
@@ -174,7 +178,10 @@ class EC2PricingService(BaseService):
     def _ec2(self, region: str) -> Any:
         if self._ec2_client:
             return self._ec2_client
-        return self._client_factory.get_client("ec2", region=region)
+        client = self._ec2_clients.get(region)
+        if client is None:
+            client = self._ec2_clients[region] = self._client_factory.get_client("ec2", region=region)
+        return client
 
 
 __all__ = ["EC2PricingService"]
@@ -64,9 +64,12 @@ class EFSPricingService(BaseService):
                 throughput_mibps=None,
             )
 
+        # Live list prices are kept for a day; fallbacks expire sooner so the API is retried.
+        ttl_seconds: int | None = self.cache.list_price_ttl_seconds
         try:
             pricing = self._safe_call(_call)
         except RuntimeError:
+            ttl_seconds = None
             pricing = EFSPricing(
                 region=region,
                 standard_gb_month=DEFAULT_EFS["standard_gb_month"],
@@ -74,7 +77,7 @@ class EFSPricingService(BaseService):
                 throughput_mibps=None,
             )
 
-        self.cache.set(cache_key, pricing)
+        self.cache.set(cache_key, pricing, ttl_seconds=ttl_seconds)
         return pricing
 
 
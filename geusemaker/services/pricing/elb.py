@@ -40,7 +40,7 @@ class ELBPricingService(BaseService):
             lcu_price=DEFAULT_ALB["lcu_price"],
         )
         # ALB pricing is largely region-neutral; caching avoids redundant calls.
-        self.cache.set(cache_key, pricing)
+        self.cache.set(cache_key, pricing, ttl_seconds=self.cache.list_price_ttl_seconds)
         return pricing
 
 
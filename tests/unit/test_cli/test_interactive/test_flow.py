@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import threading
 from decimal import Decimal
 
+import boto3
+from moto import mock_aws
+
 from geusemaker.cli.components.dialogs import Dialogs, scripted_inputs
-from geusemaker.cli.interactive.flow import InteractiveFlow, InteractiveSessionStore
+from geusemaker.cli.interactive.flow import DiscoveryFacade, InteractiveFlow, InteractiveSessionStore
+from geusemaker.infra import AWSClientFactory
 from geusemaker.models.cost import (
     ComponentCost,
     CostBreakdown,
@@ -106,6 +111,9 @@ class FakeDiscovery:
         assert vpc_id == self.vpc.vpc_id
         return [self.sg]
 
+    def list_vpc_resources(self, vpc_id: str):
+        return self.list_subnets(vpc_id), self.list_security_groups(vpc_id)
+
     def list_file_systems(self):
         return [self.efs]
 
@@ -292,3 +300,31 @@ def test_quick_setup_skips_ami_and_resource_discovery(monkeypatch, tmp_path):
     assert config.os_type == "ubuntu-22.04"
     assert config.vpc_id is None
     assert config.efs_id is None
+
+
+@mock_aws
+def test_discovery_facade_lists_vpc_resources_concurrently(monkeypatch):
+    ec2 = boto3.Session(region_name="us-east-1").client("ec2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnet_id = ec2.create_subnet(VpcId=vpc_id, CidrBlock="10.0.1.0/24")["Subnet"]["SubnetId"]
+    sg_id = ec2.create_security_group(GroupName="web", Description="web", VpcId=vpc_id)["GroupId"]
+    facade = DiscoveryFacade(AWSClientFactory(), region="us-east-1")
+    barrier = threading.Barrier(2, timeout=5)
+
+    for service, operation in (
+        (facade._vpc_service, "describe_subnets"),
+        (facade._sg_service, "describe_security_groups"),
+    ):
+        original = getattr(service._ec2, operation)
+
+        def rendezvous(*, _original=original, **kwargs):
+            barrier.wait()
+            return _original(**kwargs)
+
+        monkeypatch.setattr(service._ec2, operation, rendezvous)
+
+    subnets, security_groups = facade.list_vpc_resources(vpc_id)
+
+    assert not barrier.broken
+    assert [subnet.subnet_id for subnet in subnets] == [subnet_id]
+    assert sg_id in {group.security_group_id for group in security_groups}
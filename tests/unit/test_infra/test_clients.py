@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from geusemaker.infra.clients import AWSClientFactory
+
+
+def test_clients_are_cached_and_share_connection_config() -> None:
+    factory = AWSClientFactory()
+
+    ec2 = factory.get_client("ec2", "us-east-1")
+
+    assert factory.get_client("ec2", "us-east-1") is ec2
+    assert factory.get_client("ec2", "us-west-2") is not ec2
+    config = ec2.meta.config
+    assert config.max_pool_connections == 32
+    assert config.tcp_keepalive is True
+    assert config.retries["mode"] == "adaptive"
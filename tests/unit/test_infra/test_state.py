@@ -60,6 +60,20 @@ def test_save_and_load_round_trip(tmp_path: Path) -> None:
     assert loaded.schema_version == STATE_SCHEMA_VERSION
 
 
+def test_retire_archives_final_state_and_removes_live_file(tmp_path: Path) -> None:
+    manager = StateManager(base_path=tmp_path)
+    state = _state("demo")
+    asyncio.run(manager.save_deployment(state))
+    state.status = "terminated"
+
+    archived = asyncio.run(manager.retire_deployment(state))
+
+    assert archived.parent == manager.archive_path
+    assert json.loads(archived.read_text())["status"] == "terminated"
+    assert not manager.deployment_path("demo").exists()
+    assert asyncio.run(manager.load_deployment("demo")) is None
+
+
 def test_load_allows_pending_instance_when_creating(tmp_path: Path) -> None:
     manager = StateManager(base_path=tmp_path)
     config = DeploymentConfig(stack_name="pending", tier="dev", region="us-east-1")
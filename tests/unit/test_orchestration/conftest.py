@@ -43,6 +43,11 @@ class StubStateManager:
         _ = state.updated_at
         return None
 
+    async def retire_deployment(self, state) -> None:  # type: ignore[no-untyped-def]
+        """Archive and remove deployment (stub mirrors the real signature)."""
+        _ = state.updated_at
+        return None
+
 
 class StubVPCService:
     """Stub VPC service that can create or configure VPCs with subnets."""
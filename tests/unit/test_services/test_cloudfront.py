@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 from moto import mock_aws
 
 from geusemaker.infra import AWSClientFactory
+from geusemaker.services.base import AWSError
 from geusemaker.services.cloudfront import CloudFrontService
 
 
+class _StatusSequenceCF:
+    """Fake CloudFront client returning a scripted sequence of statuses (or errors)."""
+
+    def __init__(self, outcomes: list[str | Exception]) -> None:
+        self.outcomes = outcomes
+        self.polls = 0
+
+    def get_distribution(self, Id: str) -> dict:  # noqa: N803
+        outcome = self.outcomes[min(self.polls, len(self.outcomes) - 1)]
+        self.polls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return {"Distribution": {"Id": Id, "Status": outcome}}
+
+
 @mock_aws
 def test_create_distribution_success() -> None:
     """Test successful distribution creation with basic config."""
@@ -294,6 +312,33 @@ def test_create_invalidation_success() -> None:
     assert set(invalidation_resp["Invalidation"]["InvalidationBatch"]["Paths"]["Items"]) == set(paths)
 
 
+def test_coalesce_paths_dedups_and_collapses_dense_directories() -> None:
+    paths = [f"/assets/{i}.js" for i in range(3)] + ["/index.html", "/index.html", "/api/*", "/api/v1/x"]
+
+    assert CloudFrontService._coalesce_paths(paths, collapse_threshold=3) == ["/api/*", "/assets/*", "/index.html"]
+    assert CloudFrontService._coalesce_paths(["/a", "/*"], collapse_threshold=8) == ["/*"]
+
+
+@mock_aws
+def test_create_invalidation_batched_sends_single_request() -> None:
+    svc = CloudFrontService(AWSClientFactory(), region="us-east-1")
+    create_resp = svc.create_distribution_with_alb_origin(
+        alb_dns_name="test-alb.elb.amazonaws.com",
+        caller_reference="test-batched-invalidation",
+    )
+    dist_id = create_resp["Distribution"]["Id"]
+
+    resp = svc.create_invalidation_batched(
+        dist_id,
+        [f"/static/{i}.css" for i in range(10)] + ["/index.html"],
+        caller_reference="batched-001",
+        wait=False,
+    )
+
+    items = resp["Invalidation"]["InvalidationBatch"]["Paths"]["Items"]
+    assert sorted(items) == ["/index.html", "/static/*"]
+
+
 @mock_aws
 def test_disable_distribution_success() -> None:
     """Test distribution can be disabled."""
@@ -315,6 +360,33 @@ def test_disable_distribution_success() -> None:
     assert disable_resp["Distribution"]["DistributionConfig"]["Enabled"] is False
 
 
+@mock_aws
+def test_disable_distribution_reuses_supplied_config() -> None:
+    """A caller holding the current config skips the extra get_distribution call."""
+    svc = CloudFrontService(AWSClientFactory(), region="us-east-1")
+
+    create_resp = svc.create_distribution_with_alb_origin(
+        alb_dns_name="test-alb.elb.amazonaws.com",
+        caller_reference="test-disable-002",
+        enabled=True,
+    )
+    dist_id = create_resp["Distribution"]["Id"]
+    current = svc.get_distribution(dist_id)
+    calls: list[str] = []
+    svc._cf.meta.events.register("before-call.cloudfront.*", lambda model, **_: calls.append(model.name))
+
+    disable_resp = svc.disable_distribution(
+        dist_id,
+        current["ETag"],
+        current_config=current["Distribution"]["DistributionConfig"],
+    )
+
+    assert disable_resp["Distribution"]["DistributionConfig"]["Enabled"] is False
+    assert calls == ["UpdateDistribution"]
+    # The caller's config is not mutated.
+    assert current["Distribution"]["DistributionConfig"]["Enabled"] is True
+
+
 @mock_aws
 def test_delete_distribution_success() -> None:
     """Test distribution deletion."""
@@ -371,6 +443,42 @@ def test_wait_for_deployed_timeout() -> None:
     svc.wait_for_deployed(dist_id, max_attempts=1, delay=0)
 
 
+@mock_aws
+def test_wait_for_deployed_adaptive_polling_grows_and_backs_off_on_throttling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Adaptive polling starts at 5s, grows 1.5x up to 30s and doubles after throttling."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    throttled = ClientError({"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "GetDistribution")
+    svc = CloudFrontService(AWSClientFactory(), region="us-east-1")
+    svc._cf = _StatusSequenceCF(["InProgress"] * 6 + [throttled, "InProgress", "Deployed"])  # type: ignore[assignment]
+
+    svc.wait_for_deployed("EDIST", delay=None)
+
+    assert sleeps == [5.0, 7.5, 11.25, 16.875, 25.3125, 30.0, 60.0, 30.0]
+
+
+@mock_aws
+def test_wait_for_deployed_adaptive_polling_respects_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+    svc = CloudFrontService(AWSClientFactory(), region="us-east-1")
+    svc._cf = _StatusSequenceCF(["InProgress"])  # type: ignore[assignment]
+
+    with pytest.raises(RuntimeError, match="did not deploy"):
+        svc.wait_for_deployed("EDIST", delay=None, timeout_seconds=0)
+
+
+@mock_aws
+def test_wait_for_deployed_adaptive_polling_raises_other_errors() -> None:
+    denied = ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "GetDistribution")
+    svc = CloudFrontService(AWSClientFactory(), region="us-east-1")
+    svc._cf = _StatusSequenceCF([denied])  # type: ignore[assignment]
+
+    with pytest.raises(AWSError):
+        svc.wait_for_deployed("EDIST", delay=None)
+
+
 @mock_aws
 def test_create_distribution_with_all_features() -> None:
     """Test distribution creation with all features combined."""
@@ -21,6 +21,9 @@ class FakeSpotService:
         item = self.selections[instance_type]
         return SimpleNamespace(placement_scores_by_az={item.availability_zone: self.scores[instance_type]})
 
+    def analyze_spot_prices_bulk(self, instance_types, region):
+        return {name: self.analyze_spot_prices(name, region) for name in instance_types}
+
 
 def selection(instance_type: str, price: str, *, spot: bool = True) -> InstanceSelection:
     return InstanceSelection(
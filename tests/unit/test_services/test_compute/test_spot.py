@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import logging
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from decimal import Decimal
 
+import pytest
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 from geusemaker.models.deployment import DeploymentConfig
@@ -35,6 +41,15 @@ class StubPricingService:
         )
 
 
+class FakePaginator:
+    def __init__(self, operation: Callable[..., dict]) -> None:
+        self._operation = operation
+
+    def paginate(self, **kwargs: object) -> list[dict]:
+        kwargs.pop("PaginationConfig", None)
+        return [self._operation(**kwargs)]
+
+
 class FakeEC2:
     def __init__(
         self,
@@ -52,6 +67,10 @@ class FakeEC2:
     def describe_spot_price_history(self, **_: object) -> dict:
         return {"SpotPriceHistory": []}
 
+    def get_paginator(self, name: str) -> FakePaginator:
+        assert name == "describe_spot_price_history"
+        return FakePaginator(self.describe_spot_price_history)
+
     def run_instances(self, **_: object) -> dict:
         if self.code:
             raise ClientError({"Error": {"Code": self.code}}, "RunInstances")
@@ -239,7 +258,7 @@ def test_multi_az_checking_uses_secondary_when_primary_unavailable() -> None:
 
     class MultiAZEC2(FakeEC2):
         def __init__(self) -> None:
-            super().__init__(code="DryRunOperation", placement_scores={"us-east-1a": 3.0, "us-east-1b": 8.0})
+            super().__init__(code="DryRunOperation", placement_scores={"us-east-1a": 3.0, "us-east-1b": 6.0})
             self.az_calls: list[str] = []
 
         def run_instances(self, **kwargs: object) -> dict:
@@ -270,3 +289,427 @@ def test_multi_az_checking_uses_secondary_when_primary_unavailable() -> None:
 
     # Verify that both AZs were checked
     assert "us-east-1a" in ec2.az_calls or "us-east-1b" in ec2.az_calls
+
+
+def test_bulk_analysis_uses_single_history_request() -> None:
+    """Bulk analysis groups one history response by type and AZ and caches each result."""
+
+    class HistoryEC2(FakeEC2):
+        def __init__(self) -> None:
+            super().__init__(code="DryRunOperation")
+            self.history_calls: list[list[str]] = []
+
+        def describe_spot_price_history(self, **kwargs: object) -> dict:
+            self.history_calls.append(list(kwargs["InstanceTypes"]))  # type: ignore[arg-type]
+            newer = datetime(2026, 1, 2, tzinfo=UTC)
+            older = datetime(2026, 1, 1, tzinfo=UTC)
+            return {
+                "SpotPriceHistory": [
+                    {
+                        "InstanceType": "t3.medium",
+                        "AvailabilityZone": "us-east-1a",
+                        "SpotPrice": "0.013",
+                        "Timestamp": older,
+                    },
+                    {
+                        "InstanceType": "t3.medium",
+                        "AvailabilityZone": "us-east-1a",
+                        "SpotPrice": "0.012",
+                        "Timestamp": newer,
+                    },
+                    {
+                        "InstanceType": "m5.large",
+                        "AvailabilityZone": "us-east-1b",
+                        "SpotPrice": "0.030",
+                        "Timestamp": newer,
+                    },
+                ],
+            }
+
+    pricing = StubPricingService(spot_price=Decimal("0.02"), on_demand=Decimal("0.0416"))
+    ec2 = HistoryEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, region="us-east-1", ec2_client=ec2)
+
+    analyses = service.analyze_spot_prices_bulk(["t3.medium", "m5.large"], "us-east-1")
+
+    assert ec2.history_calls == [["t3.medium", "m5.large"]]
+    assert analyses["t3.medium"].prices_by_az == {"us-east-1a": Decimal("0.012")}
+    assert analyses["m5.large"].recommended_az == "us-east-1b"
+    # The per-type entry point now reads from the warmed cache.
+    assert service.analyze_spot_prices("t3.medium", "us-east-1") is analyses["t3.medium"]
+    assert len(ec2.history_calls) == 1
+
+
+def test_stability_scores_use_relative_deviation() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, region="us-east-1", ec2_client=ec2)
+
+    scores = service._stability_scores(
+        {"us-east-1a": [1.0, 3.0], "us-east-1b": [0.5]},
+        {"us-east-1c": Decimal("0.4")},
+    )
+
+    assert scores["us-east-1a"] == 0.5  # mean 2, population stdev 1
+    assert scores["us-east-1b"] == 1.0
+    assert scores["us-east-1c"] == 1.0
+
+
+def test_negative_capacity_result_expires_before_positive() -> None:
+    """A cached 'no capacity' is only trusted briefly; a successful dry-run is kept longer."""
+
+    class CountingEC2(FakeEC2):
+        def __init__(self, code: str) -> None:
+            super().__init__(code=code)
+            self.dry_runs = 0
+
+        def run_instances(self, **kwargs: object) -> dict:
+            self.dry_runs += 1
+            return super().run_instances(**kwargs)
+
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    unavailable = CountingEC2(code="InsufficientInstanceCapacity")
+    service = SpotSelectionService(
+        FakeFactory(unavailable),
+        pricing_service=pricing,
+        ec2_client=unavailable,
+        positive_capacity_ttl_seconds=300,
+        negative_capacity_ttl_seconds=0,
+    )
+    assert service.check_spot_capacity("t3.medium", "us-east-1a", "us-east-1") is False
+    assert service.check_spot_capacity("t3.medium", "us-east-1a", "us-east-1") is False
+    assert unavailable.dry_runs == 2
+
+    available = CountingEC2(code="DryRunOperation")
+    service = SpotSelectionService(
+        FakeFactory(available),
+        pricing_service=pricing,
+        ec2_client=available,
+        positive_capacity_ttl_seconds=300,
+        negative_capacity_ttl_seconds=0,
+    )
+    assert service.check_spot_capacity("t3.medium", "us-east-1a", "us-east-1") is True
+    assert service.check_spot_capacity("t3.medium", "us-east-1a", "us-east-1") is True
+    assert available.dry_runs == 1
+
+
+def test_analysis_derives_current_prices_from_history() -> None:
+    """A single history request supplies both current prices and stability samples."""
+
+    class HistoryOnlyEC2(FakeEC2):
+        def __init__(self) -> None:
+            super().__init__()
+            self.history_calls = 0
+
+        def describe_spot_price_history(self, **_: object) -> dict:
+            self.history_calls += 1
+            return {
+                "SpotPriceHistory": [
+                    {"InstanceType": "t3.medium", "AvailabilityZone": "us-east-1b", "SpotPrice": "0.011"},
+                ],
+            }
+
+    class NoSpotQuotePricing(StubPricingService):
+        def get_spot_prices(self, instance_type: str, region: str) -> list[SpotPrice]:
+            raise AssertionError("current prices should come from the history response")
+
+    pricing = NoSpotQuotePricing(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = HistoryOnlyEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    analysis = service.analyze_spot_prices("t3.medium", "us-east-1")
+
+    assert ec2.history_calls == 1
+    assert analysis.prices_by_az == {"us-east-1b": Decimal("0.011")}
+    assert analysis.recommended_az == "us-east-1b"
+
+
+def test_on_demand_request_skips_spot_market_queries() -> None:
+    class NoSpotCallsEC2(FakeEC2):
+        def describe_spot_price_history(self, **_: object) -> dict:
+            raise AssertionError("spot history should not be fetched for on-demand")
+
+        def get_spot_placement_scores(self, **_: object) -> dict:  # type: ignore[override]
+            raise AssertionError("placement scores should not be fetched for on-demand")
+
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = NoSpotCallsEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    selection = service.select_instance_type(_config(use_spot=False))
+
+    assert selection.is_spot is False
+    assert selection.price_per_hour == Decimal("0.0416")
+    assert selection.selection_reason == "User requested on-demand"
+
+
+def test_high_placement_score_skips_capacity_dry_run() -> None:
+    class NoDryRunEC2(FakeEC2):
+        def run_instances(self, **_: object) -> dict:
+            raise AssertionError("a trusted placement score should not be dry-run")
+
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = NoDryRunEC2(placement_scores={"us-east-1a": 8.0})
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    selection = service.select_instance_type(_config())
+
+    assert selection.is_spot is True
+    assert selection.availability_zone == "us-east-1a"
+
+
+def test_analysis_cache_is_invalidated_by_capacity_miss() -> None:
+    class CountingEC2(FakeEC2):
+        def __init__(self) -> None:
+            super().__init__(code="InsufficientInstanceCapacity")
+            self.history_calls = 0
+
+        def describe_spot_price_history(self, **kwargs: object) -> dict:
+            self.history_calls += 1
+            return super().describe_spot_price_history(**kwargs)
+
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = CountingEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    service.analyze_spot_prices("t3.medium", "us-east-1")
+    service.analyze_spot_prices("t3.medium", "us-east-1")
+    assert ec2.history_calls == 1
+
+    assert service.check_spot_capacity("t3.medium", "us-east-1a", "us-east-1") is False
+    service.analyze_spot_prices("t3.medium", "us-east-1")
+    assert ec2.history_calls == 2
+
+
+def test_price_history_is_capped_per_instance_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    def sample(instance_type: str) -> dict[str, object]:
+        return {"InstanceType": instance_type, "AvailabilityZone": "us-east-1a", "SpotPrice": "0.01"}
+
+    pages = [
+        {"SpotPriceHistory": [sample("t3.medium"), sample("t3.medium"), sample("t3.medium")]},
+        {"SpotPriceHistory": [sample("t3.medium"), sample("m5.large")]},
+        {"SpotPriceHistory": [sample("m5.large"), sample("m5.large")]},
+        {"SpotPriceHistory": [sample("m5.large")]},
+    ]
+    served: list[dict] = []
+
+    class PagedPaginator:
+        def paginate(self, **_: object) -> Iterator[dict]:
+            for page in pages:
+                served.append(page)
+                yield page
+
+    class PagedEC2(FakeEC2):
+        def get_paginator(self, name: str) -> PagedPaginator:  # type: ignore[override]  # noqa: ARG002
+            return PagedPaginator()
+
+    ec2 = PagedEC2()
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+    monkeypatch.setattr(service, "_MAX_HISTORY_SAMPLES", 2)
+
+    history = service._spot_price_history(["t3.medium", "m5.large"], "us-east-1", datetime.now(UTC))
+
+    assert [entry["InstanceType"] for entry in history] == ["t3.medium", "t3.medium", "m5.large", "m5.large"]
+    assert len(served) == 3
+
+
+def test_az_ranking_weighs_placement_score_against_price() -> None:
+    """A well-scored AZ that costs slightly more outranks a cheaper mid-scored one."""
+
+    class TwoAZPricingService(StubPricingService):
+        def get_spot_prices(self, instance_type: str, region: str) -> list[SpotPrice]:
+            return [
+                SpotPrice(
+                    instance_type=instance_type,
+                    availability_zone=f"{region}{suffix}",
+                    price_per_hour=price,
+                    timestamp=datetime.now(UTC),
+                    region=region,
+                )
+                for suffix, price in (("a", Decimal("0.010")), ("b", Decimal("0.013")))
+            ]
+
+    pricing = TwoAZPricingService(spot_price=Decimal("0.010"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2(code="DryRunOperation", placement_scores={"us-east-1a": 5.0, "us-east-1b": 9.0})
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    selection = service.select_instance_type(_config())
+
+    assert selection.availability_zone == "us-east-1b"
+    assert "weighted score" in selection.selection_reason
+
+
+def test_no_recommended_az_when_spot_is_not_cheaper() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.05"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    analysis = service.analyze_spot_prices("t3.medium", "us-east-1")
+
+    assert analysis.recommended_az is None
+    assert analysis.lowest_price == Decimal("0.0416")
+    assert analysis.savings_percentage == 0.0
+
+
+def test_capacity_cache_is_bounded_and_drops_expired_entries() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2(code="DryRunOperation")
+    service = SpotSelectionService(
+        FakeFactory(ec2),
+        pricing_service=pricing,
+        ec2_client=ec2,
+        positive_capacity_ttl_seconds=0,
+    )
+    service._MAX_CAPACITY_ENTRIES = 2  # type: ignore[misc]
+
+    for az in ("us-east-1a", "us-east-1b", "us-east-1c"):
+        assert service.check_spot_capacity("t3.medium", az, "us-east-1") is True
+
+    # With a zero TTL every older entry has expired; only the newest survives.
+    assert list(service._capacity_pos_cache) == ["t3.medium:us-east-1c"]
+
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+    service._MAX_CAPACITY_ENTRIES = 2  # type: ignore[misc]
+    for az in ("us-east-1a", "us-east-1b", "us-east-1c"):
+        service.check_spot_capacity("t3.medium", az, "us-east-1")
+
+    assert list(service._capacity_pos_cache) == ["t3.medium:us-east-1b", "t3.medium:us-east-1c"]
+
+
+def test_capacity_cache_survives_concurrent_checks() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2(code="DryRunOperation")
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+    service._MAX_CAPACITY_ENTRIES = 8  # type: ignore[misc]
+    # Switch threads as often as possible so unguarded evictions would collide.
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(service.check_spot_capacity, "t3.medium", f"us-east-1-az{index}", "us-east-1")
+                for index in range(2000)
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        sys.setswitchinterval(previous_interval)
+
+    assert all(results)
+    assert len(service._capacity_pos_cache) == 8
+
+
+def test_analysis_overlaps_on_demand_and_placement_score_lookups() -> None:
+    """Both lookups must be in flight together; sequential calls would break the barrier."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierPricingService(StubPricingService):
+        def get_on_demand_price(
+            self, instance_type: str, region: str, operating_system: str = "Linux"
+        ) -> OnDemandPrice:
+            barrier.wait()
+            return super().get_on_demand_price(instance_type, region, operating_system)
+
+    class BarrierEC2(FakeEC2):
+        def get_spot_placement_scores(self, **kwargs: object) -> dict:  # type: ignore[override]
+            barrier.wait()
+            return super().get_spot_placement_scores(**kwargs)  # type: ignore[arg-type]
+
+    pricing = BarrierPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = BarrierEC2(placement_scores={"us-east-1a": 8.0})
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    analysis = service.analyze_spot_prices("t3.medium", "us-east-1")
+
+    assert analysis.on_demand_price == Decimal("0.0416")
+    assert analysis.placement_scores_by_az == {"us-east-1a": 8.0}
+
+
+def test_on_demand_selection_reports_zero_savings() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    comparison = service.select_instance_type(_config(use_spot=False)).savings_vs_on_demand
+
+    assert comparison.on_demand_hourly == comparison.selected_hourly == Decimal("0.0416")
+    assert comparison.hourly_savings == comparison.monthly_savings == Decimal("0")
+    assert comparison.savings_percentage == 0.0
+    assert comparison.model_dump(mode="json")["monthly_savings"] == "0.0"
+
+
+def test_cloudwatch_tracked_scores_replace_placement_score_calls() -> None:
+    """Tracked scores come from one batched query; untracked types fall back to the SPS API."""
+
+    class FakeCloudWatch:
+        def __init__(self) -> None:
+            self.requests: list[list[dict]] = []
+
+        def get_paginator(self, name: str) -> FakePaginator:
+            assert name == "get_metric_data"
+            return FakePaginator(self.get_metric_data)
+
+        def get_metric_data(self, MetricDataQueries: list[dict], **_: object) -> dict:  # noqa: N803
+            self.requests.append(MetricDataQueries)
+            results = []
+            for query in MetricDataQueries:
+                dims = {d["Name"]: d["Value"] for d in query["MetricStat"]["Metric"]["Dimensions"]}
+                tracked = dims["InstanceType"] == "t3.medium" and dims["AvailabilityZone"] == "us-east-1a"
+                results.append({"Id": query["Id"], "Values": [9.0, 4.0] if tracked else []})
+            return {"MetricDataResults": results}
+
+    class CountingEC2(FakeEC2):
+        def __init__(self) -> None:
+            super().__init__(
+                placement_scores={"us-east-1b": 3.0},
+                zone_id_to_name={"use1-az1": "us-east-1a", "use1-az2": "us-east-1b"},
+            )
+            self.sps_calls: list[list[str]] = []
+
+        def get_spot_placement_scores(self, InstanceTypes: list[str], **kwargs: object) -> dict:  # type: ignore[override]  # noqa: N803
+            self.sps_calls.append(InstanceTypes)
+            return super().get_spot_placement_scores(InstanceTypes, **kwargs)  # type: ignore[arg-type]
+
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = CountingEC2()
+    cloudwatch = FakeCloudWatch()
+    service = SpotSelectionService(
+        FakeFactory(ec2),
+        pricing_service=pricing,
+        ec2_client=ec2,
+        use_cloudwatch_scores=True,
+        cloudwatch_client=cloudwatch,
+    )
+
+    analyses = service.analyze_spot_prices_bulk(["t3.medium", "m5.large"], "us-east-1")
+
+    assert len(cloudwatch.requests) == 1
+    assert len(cloudwatch.requests[0]) == 4  # 2 types x 2 AZs
+    assert analyses["t3.medium"].placement_scores_by_az == {"us-east-1a": 9.0}
+    assert analyses["m5.large"].placement_scores_by_az == {"us-east-1b": 3.0}
+    assert ec2.sps_calls == [["m5.large"]]
+
+
+def test_best_stability_matches_the_per_az_maximum() -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2()
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+    volatile = {"us-east-1a": [1.0, 3.0], "us-east-1b": [2.0, 2.0, 6.0]}
+    prices = {"us-east-1a": Decimal("2"), "us-east-1b": Decimal("2")}
+
+    assert service._best_stability(volatile, prices) == max(service._stability_scores(volatile, prices).values())
+    assert service._best_stability(volatile, {**prices, "us-east-1c": Decimal("2")}) == 1.0
+    assert service._best_stability({}, {}) == 0.0
+
+
+def test_selection_logs_format_lazily(caplog: pytest.LogCaptureFixture) -> None:
+    pricing = StubPricingService(spot_price=Decimal("0.012"), on_demand=Decimal("0.0416"))
+    ec2 = FakeEC2(code="DryRunOperation")
+    service = SpotSelectionService(FakeFactory(ec2), pricing_service=pricing, ec2_client=ec2)
+
+    with caplog.at_level(logging.DEBUG, logger="geusemaker.services.compute.spot"):
+        service.select_instance_type(_config())
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Checking spot capacity for t3.medium in us-east-1a: $0.0120/hr (placement score: 0.0)" in messages
+    assert any(message.startswith("Spot instance selected in us-east-1a: $0.0120/hr") for message in messages)
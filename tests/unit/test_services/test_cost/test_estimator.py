@@ -102,3 +102,57 @@ def test_cost_estimate_includes_components() -> None:
     assert estimate.breakdown.storage.monthly_cost == Decimal("15.0")
     assert estimate.breakdown.load_balancer is not None
     assert estimate.comparison.savings_percentage > 0
+
+
+def test_derived_hourly_rates_are_rounded_once() -> None:
+    estimator = CostEstimator(
+        client_factory=AWSClientFactory(),
+        pricing_service=StubPricingService(),  # type: ignore[arg-type]
+        spot_selector=StubSpotSelector(_selection()),  # type: ignore[arg-type]
+    )
+
+    storage = estimator.calculate_efs_cost(15, StubPricingService().get_efs_pricing("us-east-1"), 730)
+
+    assert storage.monthly_cost == Decimal("4.5")
+    assert storage.hourly_cost == Decimal("0.006164")
+
+
+def test_totals_sum_every_included_component() -> None:
+    config = DeploymentConfig(
+        stack_name="stack",
+        tier="gpu",
+        region="us-east-1",
+        instance_type="t3.medium",
+        use_spot=True,
+    )
+    estimator = CostEstimator(
+        client_factory=AWSClientFactory(),
+        pricing_service=StubPricingService(),  # type: ignore[arg-type]
+        spot_selector=StubSpotSelector(_selection()),  # type: ignore[arg-type]
+    )
+
+    estimate = estimator.estimate_deployment_cost(config=config)
+
+    breakdown = estimate.breakdown
+    components = [
+        breakdown.compute,
+        breakdown.storage,
+        breakdown.data_transfer,
+        breakdown.load_balancer,
+        breakdown.cdn,
+    ]
+    assert all(component is not None for component in components)
+    assert estimate.hourly_cost == sum(c.hourly_cost for c in components if c)
+    assert estimate.monthly_cost == sum(c.monthly_cost for c in components if c)
+
+
+def test_fractional_quantities_convert_exactly() -> None:
+    estimator = CostEstimator(
+        client_factory=AWSClientFactory(),
+        pricing_service=StubPricingService(),  # type: ignore[arg-type]
+        spot_selector=StubSpotSelector(_selection()),  # type: ignore[arg-type]
+    )
+
+    transfer = estimator.calculate_data_transfer_cost(data_transfer_gb=0.1, hours=730)
+
+    assert transfer.monthly_cost == Decimal("0.009")
@@ -57,3 +57,15 @@ def test_report_and_json_export() -> None:
     assert "hourly_cost" in report
     json_body = report_service.to_json(report)
     assert '"deployment":"stack"' in json_body
+
+
+def test_report_history_is_json_ready() -> None:
+    report_service = CostReportService()
+    estimate = _estimate()
+    snapshot = report_service.snapshot(estimate, runtime_hours=2.0)
+
+    report = report_service.build_report(estimate, runtime_hours=2.0, cost_history=[snapshot])
+
+    assert report["history"][0]["total_cost_to_date"] == "0.200"
+    assert isinstance(report["history"][0]["timestamp"], str)
+    assert '"runtime_hours":2.0' in report_service.to_json(report)
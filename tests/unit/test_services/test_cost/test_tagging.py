@@ -36,11 +36,22 @@ class FakeELBv2:
         return {"ok": True}
 
 
+class FakeTagging:
+    def __init__(self) -> None:
+        self.requests: list[tuple[list[str], dict[str, str]]] = []
+
+    def tag_resources(self, ResourceARNList: list[str], Tags: dict[str, str]) -> dict:  # noqa: N803
+        self.requests.append((ResourceARNList, Tags))
+        failed = {arn: {"ErrorCode": "InvalidParameterException"} for arn in ResourceARNList if "missing" in arn}
+        return {"FailedResourcesMap": failed}
+
+
 class FakeFactory:
     def __init__(self) -> None:
         self.ec2 = FakeEC2()
         self.efs = FakeEFS()
         self.elb = FakeELBv2()
+        self.tagging = FakeTagging()
 
     def get_client(self, service_name: str, region: str = "us-east-1") -> object:  # noqa: ARG002
         if service_name == "ec2":
@@ -49,6 +60,8 @@ class FakeFactory:
             return self.efs
         if service_name == "elbv2":
             return self.elb
+        if service_name == "resourcegroupstaggingapi":
+            return self.tagging
         raise KeyError(service_name)
 
 
@@ -66,3 +79,38 @@ def test_resource_tagger_builds_and_applies_tags() -> None:
 
     tagger.tag_alb("arn:aws:elasticloadbalancing:::alb/123", tags)
     assert factory.elb.tags == tags
+
+
+def test_build_tags_reuses_template_but_stamps_each_call() -> None:
+    tagger = ResourceTagger(FakeFactory())
+
+    first = tagger.build_tags("stack", "prod", created_by="ci")
+    second = tagger.build_tags("stack", "prod", created_by="ci")
+
+    assert [tag["Key"] for tag in first] == [
+        "geusemaker:deployment",
+        "geusemaker:tier",
+        "geusemaker:created-at",
+        "geusemaker:created-by",
+    ]
+    assert {tag["Key"]: tag["Value"] for tag in first if tag["Key"] != "geusemaker:created-at"} == {
+        "geusemaker:deployment": "stack",
+        "geusemaker:tier": "prod",
+        "geusemaker:created-by": "ci",
+    }
+    assert first[2]["Value"] and second[2]["Value"] >= first[2]["Value"]
+    # Callers get their own dicts, so mutating one tag set cannot leak into the next.
+    assert first[0] is not second[0]
+
+
+def test_tag_many_batches_arns_across_services() -> None:
+    factory = FakeFactory()
+    tagger = ResourceTagger(factory)
+    arns = [f"arn:aws:ec2:us-east-1:123:instance/i-{n}" for n in range(24)]
+    arns.append("arn:aws:elasticfilesystem:us-east-1:123:file-system/fs-missing")
+
+    failed = tagger.tag_many(arns, [{"Key": "geusemaker:deployment", "Value": "stack"}])
+
+    assert [len(batch) for batch, _ in factory.tagging.requests] == [20, 5]
+    assert factory.tagging.requests[0][1] == {"geusemaker:deployment": "stack"}
+    assert list(failed) == [arns[-1]]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
 
+import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
 from geusemaker.infra.state import StateManager
 from geusemaker.models import CostTracking, DeploymentConfig, DeploymentState
 from geusemaker.services.destruction.service import DestructionService
@@ -13,8 +17,16 @@ class StubWaiter:
     def __init__(self, calls: list[tuple[str, object]]):
         self.calls = calls
 
-    def wait(self, InstanceIds):  # type: ignore[no-untyped-def]
-        self.calls.append(("wait", InstanceIds))
+    def wait(self, InstanceIds, WaiterConfig=None):  # type: ignore[no-untyped-def]  # noqa: ANN001
+        self.calls.append(("wait", InstanceIds, WaiterConfig))
+
+
+class StubEC2Paginator:
+    def __init__(self, method):  # type: ignore[no-untyped-def]  # noqa: ANN001
+        self.method = method
+
+    def paginate(self, **kwargs):  # type: ignore[no-untyped-def]
+        return [self.method(**kwargs)]
 
 
 class StubEC2:
@@ -27,6 +39,10 @@ class StubEC2:
             {"RouteTableId": "rtb-main", "Associations": [{"Main": True}]},
             {"RouteTableId": "rtb-1", "Associations": [{"Main": False}]},
         ]
+        self.network_interfaces: list[dict[str, str]] = []
+
+    def get_paginator(self, name: str) -> StubEC2Paginator:
+        return StubEC2Paginator(getattr(self, name))
 
     def terminate_instances(self, InstanceIds):  # type: ignore[no-untyped-def]
         self.calls.append(("terminate", InstanceIds))
@@ -59,8 +75,11 @@ class StubEC2:
         return {"RouteTables": list(self.route_tables)}
 
     def describe_network_interfaces(self, Filters=None):  # type: ignore[no-untyped-def] # noqa: ANN001
-        """Return empty list of network interfaces for testing."""
-        return {"NetworkInterfaces": []}
+        self.calls.append(("describe_enis", Filters))
+        return {"NetworkInterfaces": list(self.network_interfaces)}
+
+    def delete_network_interface(self, NetworkInterfaceId):  # type: ignore[no-untyped-def]
+        self.calls.append(("delete_eni", NetworkInterfaceId))
 
     def delete_route_table(self, RouteTableId):  # type: ignore[no-untyped-def]
         self.calls.append(("delete_rtb", RouteTableId))
@@ -121,6 +140,28 @@ class StubELBV2Order(StubELBV2):
             raise RuntimeError("ResourceInUse: target group still referenced by listener")
 
 
+class StubELBV2Rendezvous(StubELBV2Order):
+    """Block ALB deletion until the instance is being terminated concurrently."""
+
+    def __init__(self, barrier: threading.Barrier) -> None:
+        super().__init__()
+        self.barrier = barrier
+
+    def delete_load_balancer(self, LoadBalancerArn):  # type: ignore[no-untyped-def]  # noqa: N803
+        self.barrier.wait()
+        super().delete_load_balancer(LoadBalancerArn)
+
+
+class StubEC2Rendezvous(StubEC2):
+    def __init__(self, barrier: threading.Barrier) -> None:
+        super().__init__()
+        self.barrier = barrier
+
+    def terminate_instances(self, InstanceIds):  # type: ignore[no-untyped-def]
+        self.barrier.wait()
+        super().terminate_instances(InstanceIds)
+
+
 def _state() -> DeploymentState:
     config = DeploymentConfig(stack_name="demo", tier="dev")
     cost = CostTracking(
@@ -257,3 +298,466 @@ def test_destruction_deletes_efs_when_flag_not_set(tmp_path: Path) -> None:
 
     # EFS should NOT be in preserved resources
     assert not any(res.resource_type == "efs" for res in result.preserved_resources)
+
+
+def test_destruction_runs_independent_phases_concurrently(tmp_path: Path) -> None:
+    """ALB deletion and instance termination do not depend on each other and overlap."""
+    state = _state()
+    state.alb_arn = "arn:aws:elasticloadbalancing:us-east-1:123:loadbalancer/app/demo/abc"
+    state.target_group_arn = "arn:aws:elasticloadbalancing:us-east-1:123:targetgroup/demo/def"
+
+    # Run serially, either call would wait for the other until the barrier times out.
+    barrier = threading.Barrier(2, timeout=5)
+    ec2 = StubEC2Rendezvous(barrier)
+    elbv2 = StubELBV2Rendezvous(barrier)
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(mount_targets=["mt-1"]),
+        elbv2_client=elbv2,
+    )
+
+    result = service.destroy(state)
+
+    assert result.success is True
+    assert not barrier.broken
+    assert ("terminate", ["i-1"]) in ec2.calls
+    assert sorted(call[0] for call in elbv2.calls[:2]) == ["delete_load_balancer", "deregister_targets"]
+    assert elbv2.calls[-1][0] == "delete_target_group"
+
+
+def test_destruction_deletes_all_mount_targets_before_waiting(tmp_path: Path) -> None:
+    """Every mount target deletion is requested concurrently before waiting on any of them."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class RecordingEFS(StubEFS):
+        def delete_mount_target(self, MountTargetId):  # type: ignore[no-untyped-def]
+            barrier.wait()
+            super().delete_mount_target(MountTargetId)
+
+        def describe_mount_targets(self, FileSystemId=None, MountTargetId=None):  # type: ignore[no-untyped-def] # noqa: ANN001
+            if MountTargetId:
+                self.calls.append(("wait_mt", MountTargetId))
+            return super().describe_mount_targets(FileSystemId=FileSystemId, MountTargetId=MountTargetId)
+
+    state = _state()
+    efs = RecordingEFS(mount_targets=["mt-1", "mt-2", "mt-3"])
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=efs,
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(state)
+
+    assert result.success is True
+    assert not barrier.broken
+    kinds = [call[0] for call in efs.calls if call[0] in ("delete_mt", "wait_mt")]
+    assert kinds[:3] == ["delete_mt"] * 3
+    assert sorted(kinds[3:]) == ["wait_mt"] * 3
+    assert {res.resource_id for res in result.deleted_resources if res.resource_type == "efs_mount_target"} == {
+        "mt-1",
+        "mt-2",
+        "mt-3",
+    }
+
+
+def test_target_group_retry_backs_off_with_jitter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retryable delete errors back off with jittered delays bounded by the exponential ceiling."""
+
+    class InUseELBV2(StubELBV2):
+        def __init__(self) -> None:
+            self.attempts = 0
+
+        def delete_target_group(self, TargetGroupArn):  # type: ignore[no-untyped-def]  # noqa: N803
+            self.attempts += 1
+            # Still held by the listener, then throttled once the API is busy.
+            codes = {1: "ResourceInUse", 2: "ResourceInUse", 3: "Throttling"}
+            if self.attempts in codes:
+                raise ClientError({"Error": {"Code": codes[self.attempts], "Message": "retry"}}, "DeleteTargetGroup")
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    elbv2 = InUseELBV2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=elbv2,
+    )
+    errors: list[str] = []
+
+    assert service._delete_target_group_with_retry("arn:tg", errors) is True
+    assert errors == []
+    assert elbv2.attempts == 4
+    assert len(sleeps) == 3
+    assert all(0 <= delay <= 2.0 * 2**attempt for attempt, delay in enumerate(sleeps))
+
+
+def test_destruction_deletes_only_available_non_elb_network_interfaces(tmp_path: Path) -> None:
+    state = _state()
+    ec2 = StubEC2()
+    ec2.network_interfaces = [
+        {"NetworkInterfaceId": "eni-1", "Description": ""},
+        {"NetworkInterfaceId": "eni-elb", "Description": "ELB app/demo/abc"},
+    ]
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    service.destroy(state)
+
+    filters = next(call[1] for call in ec2.calls if call[0] == "describe_enis")
+    assert {"Name": "status", "Values": ["available"]} in filters
+    assert ("delete_eni", "eni-1") in ec2.calls
+    assert ("delete_eni", "eni-elb") not in ec2.calls
+
+
+def test_vpc_dependencies_are_deleted_concurrently(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class RendezvousEC2(StubEC2):
+        def delete_route_table(self, RouteTableId):  # type: ignore[no-untyped-def]
+            barrier.wait()
+            super().delete_route_table(RouteTableId)
+
+    ec2 = RendezvousEC2()
+    ec2.route_tables.append({"RouteTableId": "rtb-2", "Associations": []})
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+    errors: list[str] = []
+
+    service._delete_vpc_dependencies("vpc-1", "demo", errors)
+
+    assert errors == []
+    assert not barrier.broken
+    assert {call[1] for call in ec2.calls if call[0] == "delete_rtb"} == {"rtb-1", "rtb-2"}
+
+
+def test_vpc_dependencies_of_different_kinds_are_deleted_together(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class RendezvousEC2(StubEC2):
+        def delete_internet_gateway(self, InternetGatewayId):  # type: ignore[no-untyped-def]
+            barrier.wait()
+            super().delete_internet_gateway(InternetGatewayId)
+
+        def delete_route_table(self, RouteTableId):  # type: ignore[no-untyped-def]
+            barrier.wait()
+            super().delete_route_table(RouteTableId)
+
+    ec2 = RendezvousEC2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+    errors: list[str] = []
+
+    service._delete_vpc_dependencies("vpc-1", "demo", errors)
+
+    assert errors == []
+    assert not barrier.broken
+    assert ("delete_igw", "igw-1") in ec2.calls
+    assert ("delete_rtb", "rtb-1") in ec2.calls
+
+
+def test_destruction_stamps_resources_with_one_timestamp(tmp_path: Path) -> None:
+    state = _state()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=StubEFS(mount_targets=["mt-1"]),
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(state)
+
+    assert {res.deleted_at for res in result.deleted_resources} == {state.terminated_at}
+
+
+def test_target_group_retry_gives_up_on_permanent_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class DeniedELBV2(StubELBV2):
+        def delete_target_group(self, TargetGroupArn):  # type: ignore[no-untyped-def]  # noqa: N803
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteTargetGroup")
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=DeniedELBV2(),
+    )
+    errors: list[str] = []
+
+    assert service._delete_target_group_with_retry("arn:tg", errors) is False
+    assert sleeps == []
+    assert len(errors) == 1
+
+
+def test_destruction_does_not_report_failed_target_group_as_deleted(tmp_path: Path) -> None:
+    class DeniedELBV2(StubELBV2Order):
+        def delete_target_group(self, TargetGroupArn):  # type: ignore[no-untyped-def]  # noqa: N803
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteTargetGroup")
+
+    state = _state()
+    state.target_group_arn = "arn:aws:elasticloadbalancing:us-east-1:123:targetgroup/demo/def"
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=DeniedELBV2(),
+    )
+
+    result = service.destroy(state)
+
+    assert result.success is False
+    assert [error for error in result.errors if error.startswith("Target group")] == [
+        "Target group deletion failed: An error occurred (AccessDenied) when calling the DeleteTargetGroup operation: denied",
+    ]
+    assert not any(res.resource_type == "target_group" for res in result.deleted_resources)
+
+
+def test_destruction_preserves_reused_and_reports_failed_single_resources(tmp_path: Path) -> None:
+    class FailingSGEC2(StubEC2):
+        def delete_security_group(self, GroupId):  # type: ignore[no-untyped-def]
+            raise ClientError({"Error": {"Code": "DependencyViolation", "Message": "in use"}}, "DeleteSecurityGroup")
+
+    state = _state()
+    state.alb_arn = "arn:aws:elasticloadbalancing:us-east-1:123:loadbalancer/app/shared/abc"
+    state.resource_provenance = {"alb": "reused"}
+    elbv2 = StubELBV2Order()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=FailingSGEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=elbv2,
+    )
+
+    result = service.destroy(state)
+
+    assert not any(call[0] == "delete_load_balancer" for call in elbv2.calls)
+    assert any(res.resource_type == "alb" and res.reason == "reused" for res in result.preserved_resources)
+    assert result.success is False
+    assert any(error.startswith("Security group deletion failed") for error in result.errors)
+    assert not any(res.resource_type == "security_group" for res in result.deleted_resources)
+
+
+def test_vpc_dependency_lookups_run_together_and_fail_independently(tmp_path: Path) -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    class LookupEC2(StubEC2):
+        def describe_network_interfaces(self, Filters=None):  # type: ignore[no-untyped-def] # noqa: ANN001
+            barrier.wait()
+            return super().describe_network_interfaces(Filters=Filters)
+
+        def describe_internet_gateways(self, Filters=None):  # type: ignore[no-untyped-def] # noqa: ANN001
+            barrier.wait()
+            raise ClientError({"Error": {"Code": "UnauthorizedOperation", "Message": "no"}}, "DescribeInternetGateways")
+
+        def describe_route_tables(self, Filters=None):  # type: ignore[no-untyped-def] # noqa: ANN001
+            barrier.wait()
+            return super().describe_route_tables(Filters=Filters)
+
+    ec2 = LookupEC2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+    errors: list[str] = []
+
+    service._delete_vpc_dependencies("vpc-1", "demo", errors)
+
+    assert not barrier.broken
+    assert len(errors) == 1
+    assert errors[0].startswith("Describe internet gateways failed")
+    assert ("delete_rtb", "rtb-1") in ec2.calls
+    assert not any(call[0] == "delete_igw" for call in ec2.calls)
+
+
+def test_destruction_deregisters_targets_while_deleting_alb(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class PipelinedELBV2(StubELBV2Order):
+        def deregister_targets(self, TargetGroupArn, Targets):  # type: ignore[no-untyped-def]  # noqa: N803
+            barrier.wait()
+            super().deregister_targets(TargetGroupArn, Targets)
+
+        def delete_load_balancer(self, LoadBalancerArn):  # type: ignore[no-untyped-def]  # noqa: N803
+            barrier.wait()
+            super().delete_load_balancer(LoadBalancerArn)
+
+    state = _state()
+    state.alb_arn = "arn:aws:elasticloadbalancing:us-east-1:123:loadbalancer/app/demo/abc"
+    state.target_group_arn = "arn:aws:elasticloadbalancing:us-east-1:123:targetgroup/demo/def"
+    elbv2 = PipelinedELBV2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=StubEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=elbv2,
+    )
+
+    result = service.destroy(state)
+
+    assert result.success is True
+    assert not barrier.broken
+    assert elbv2.calls[-1][0] == "delete_target_group"
+
+
+def test_destruction_polls_instance_termination_quickly(tmp_path: Path) -> None:
+    ec2 = StubEC2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    service.destroy(_state())
+
+    assert ("wait", ["i-1"], {"Delay": 2, "MaxAttempts": 300}) in ec2.calls
+
+
+def test_every_phase_declares_its_resources() -> None:
+    phases = {name for name, _deps in DestructionService._PHASES}
+    assert phases == set(DestructionService._PHASE_RESOURCES)
+
+
+def test_destruction_skips_phases_without_resources(tmp_path: Path) -> None:
+    """A deployment that failed before EFS and the instance existed never touches them."""
+
+    class RecordingEFS(StubEFS):
+        def describe_mount_targets(self, FileSystemId=None, MountTargetId=None):  # type: ignore[no-untyped-def] # noqa: ANN001
+            self.calls.append(("describe_mt", FileSystemId or MountTargetId))
+            return super().describe_mount_targets(FileSystemId=FileSystemId, MountTargetId=MountTargetId)
+
+    state = _state()
+    state.efs_id = None
+    state.efs_mount_target_id = None
+    state.instance_id = None
+    ec2 = StubEC2()
+    efs = RecordingEFS()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=efs,
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(state)
+
+    assert result.success is True
+    assert efs.calls == []
+    assert not any(call[0] == "terminate" for call in ec2.calls)
+    assert ("delete_vpc", "vpc-1") in ec2.calls
+
+
+def test_destruction_treats_already_deleted_resources_as_deleted(tmp_path: Path) -> None:
+    class GoneEC2(StubEC2):
+        def terminate_instances(self, InstanceIds):  # type: ignore[no-untyped-def]
+            raise ClientError(
+                {"Error": {"Code": "InvalidInstanceID.NotFound", "Message": "gone"}}, "TerminateInstances"
+            )
+
+        def delete_security_group(self, GroupId):  # type: ignore[no-untyped-def]
+            raise ClientError({"Error": {"Code": "InvalidGroup.NotFound", "Message": "gone"}}, "DeleteSecurityGroup")
+
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=GoneEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(_state())
+
+    assert result.success is True
+    deleted = {res.resource_type for res in result.deleted_resources}
+    assert {"ec2_instance", "security_group", "vpc"} <= deleted
+
+
+def test_destruction_deletes_subnets_concurrently_and_reports_each_failure(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SubnetEC2(StubEC2):
+        def delete_subnet(self, SubnetId):  # type: ignore[no-untyped-def]
+            if SubnetId == "subnet-3":
+                raise ClientError({"Error": {"Code": "DependencyViolation", "Message": "in use"}}, "DeleteSubnet")
+            barrier.wait()
+            super().delete_subnet(SubnetId)
+
+    state = _state()
+    state.subnet_ids = ["subnet-1", "subnet-2", "subnet-3"]
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=SubnetEC2(),
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(state)
+
+    assert not barrier.broken
+    subnets = {res.resource_id for res in result.deleted_resources if res.resource_type == "subnet"}
+    assert subnets == {"subnet-1", "subnet-2"}
+    assert any(error.startswith("Subnet subnet-3 deletion failed") for error in result.errors)
+
+
+def test_vpc_teardown_deletes_back_off_while_throttled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    class ThrottledEC2(StubEC2):
+        def __init__(self) -> None:
+            super().__init__()
+            self.throttles = 2
+
+        def delete_subnet(self, SubnetId):  # type: ignore[no-untyped-def]
+            if self.throttles:
+                self.throttles -= 1
+                raise ClientError({"Error": {"Code": "RequestLimitExceeded", "Message": "slow down"}}, "DeleteSubnet")
+            super().delete_subnet(SubnetId)
+
+    ec2 = ThrottledEC2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    result = service.destroy(_state())
+
+    assert result.success is True
+    assert ("delete_subnet", "subnet-1") in ec2.calls
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_destroy_async_runs_on_the_callers_event_loop(tmp_path: Path) -> None:
+    ec2 = StubEC2()
+    service = DestructionService(
+        state_manager=StateManager(base_path=tmp_path),
+        ec2_client=ec2,
+        efs_client=StubEFS(),
+        elbv2_client=StubELBV2(),
+    )
+
+    result = await service.destroy_async(_state())
+
+    assert result.success is True
+    assert ("delete_vpc", "vpc-1") in ec2.calls
+    assert result.archived_state_path is not None
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from geusemaker.services.discovery import DiscoveryCache
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_discovery_cache() -> Iterator[None]:
+    """Keep results cached by one moto-backed test out of the next."""
+    yield
+    DiscoveryCache.default().invalidate()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from geusemaker.services.discovery import DiscoveryCache
+
+
+def test_cache_expires_entries_on_the_monotonic_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("geusemaker.services.discovery.cache.monotonic", lambda: clock[0])
+    cache = DiscoveryCache(default_ttl_seconds=60)
+
+    cache.set("vpcs:us-east-1", ["vpc-1"])
+    clock[0] += 59
+    assert cache.get("vpcs:us-east-1") == ["vpc-1"]
+
+    clock[0] += 1
+    assert cache.get("vpcs:us-east-1") is None
+
+
+def test_cache_invalidates_by_prefix() -> None:
+    cache = DiscoveryCache()
+    cache.set("albs:us-east-1:vpc-1", ["alb"])
+    cache.set("efs:us-east-1", ["fs"])
+
+    cache.invalidate("albs:")
+
+    assert cache.get("albs:us-east-1:vpc-1") is None
+    assert cache.get("efs:us-east-1") == ["fs"]
+
+
+def test_cache_invalidates_within_and_across_namespaces() -> None:
+    cache = DiscoveryCache()
+    cache.set("subnets:us-east-1:vpc-1", ["subnet-1"])
+    cache.set("subnets:us-east-1:vpc-2", ["subnet-2"])
+    cache.set("sg:us-east-1:vpc-1", ["sg-1"])
+
+    cache.invalidate("subnets:us-east-1:vpc-1")
+    assert cache.get("subnets:us-east-1:vpc-1") is None
+    assert cache.get("subnets:us-east-1:vpc-2") == ["subnet-2"]
+
+    cache.invalidate("s")
+    assert cache.get("subnets:us-east-1:vpc-2") is None
+    assert cache.get("sg:us-east-1:vpc-1") is None
+
+    cache.set("keypairs:us-east-1", ["kp"])
+    cache.invalidate()
+    assert cache.get("keypairs:us-east-1") is None
+
+
+def test_default_cache_is_shared_by_services() -> None:
+    assert DiscoveryCache.default() is DiscoveryCache.default()
+
+
+def test_invalidate_vpc_drops_results_scoped_to_that_vpc() -> None:
+    cache = DiscoveryCache()
+    cache.set("vpcs:us-east-1", ["vpc-1", "vpc-2"])
+    cache.set("subnets:us-east-1:vpc-1", ["subnet-1"])
+    cache.set("sg:us-east-1:vpc-1", ["sg-1"])
+    cache.set("albs:us-east-1:vpc-2", ["alb-2"])
+    cache.set("efs:us-east-1", ["fs-1"])
+
+    cache.invalidate_vpc("vpc-1")
+
+    assert cache.get("vpcs:us-east-1") is None
+    assert cache.get("subnets:us-east-1:vpc-1") is None
+    assert cache.get("sg:us-east-1:vpc-1") is None
+    assert cache.get("albs:us-east-1:vpc-2") == ["alb-2"]
+    assert cache.get("efs:us-east-1") == ["fs-1"]
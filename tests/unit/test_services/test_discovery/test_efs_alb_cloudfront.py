@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import threading
+
 import boto3
+import pytest
 from moto import mock_aws
 
 from geusemaker.infra import AWSClientFactory
@@ -9,6 +12,7 @@ from geusemaker.services.discovery import (
     CloudFrontDiscoveryService,
     EFSDiscoveryService,
 )
+from geusemaker.services.discovery._util import _tags_to_dict
 
 
 @mock_aws
@@ -135,3 +139,171 @@ def test_storage_and_edge_discovery_round_trip() -> None:
         "example.com",
     )
     assert cf_validation.is_valid is True
+
+
+@mock_aws
+def test_efs_discovery_reuses_paginators_across_refreshes(monkeypatch: pytest.MonkeyPatch) -> None:
+    efs_client = boto3.Session(region_name="us-east-1").client("efs")
+    fs_id = efs_client.create_file_system(CreationToken="paginators")["FileSystemId"]
+    service = EFSDiscoveryService(AWSClientFactory(), region="us-east-1")
+    assert [fs.file_system_id for fs in service.list_file_systems(use_cache=False)] == [fs_id]
+
+    def no_new_paginators(name: str) -> None:
+        raise AssertionError(f"paginator {name} rebuilt")
+
+    monkeypatch.setattr(service._efs, "get_paginator", no_new_paginators)
+
+    assert [fs.file_system_id for fs in service.list_file_systems(use_cache=False)] == [fs_id]
+
+
+@mock_aws
+def test_alb_discovery_pairs_each_vpc_alb_with_its_own_listeners() -> None:
+    session = boto3.Session(region_name="us-east-1")
+    ec2 = session.client("ec2")
+    elbv2 = session.client("elbv2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnets = [
+        ec2.create_subnet(VpcId=vpc_id, CidrBlock=f"10.0.{index}.0/24", AvailabilityZone=f"us-east-1{zone}")["Subnet"][
+            "SubnetId"
+        ]
+        for index, zone in enumerate("ab", start=1)
+    ]
+    ports = {}
+    for name, port in (("gm-alb-a", 80), ("gm-alb-b", 8080)):
+        arn = elbv2.create_load_balancer(Name=name, Subnets=subnets, Scheme="internet-facing", Type="application")[
+            "LoadBalancers"
+        ][0]["LoadBalancerArn"]
+        tg_arn = elbv2.create_target_group(Name=f"{name}-tg", Protocol="HTTP", Port=port, VpcId=vpc_id)["TargetGroups"][
+            0
+        ]["TargetGroupArn"]
+        elbv2.create_listener(
+            LoadBalancerArn=arn,
+            Protocol="HTTP",
+            Port=port,
+            DefaultActions=[{"Type": "forward", "TargetGroupArn": tg_arn}],
+        )
+        ports[arn] = port
+    other_vpc = ec2.create_vpc(CidrBlock="10.1.0.0/16")["Vpc"]["VpcId"]
+    other_subnets = [
+        ec2.create_subnet(VpcId=other_vpc, CidrBlock=f"10.1.{index}.0/24", AvailabilityZone=f"us-east-1{zone}")[
+            "Subnet"
+        ]["SubnetId"]
+        for index, zone in enumerate("ab", start=1)
+    ]
+    elbv2.create_load_balancer(Name="other-alb", Subnets=other_subnets, Scheme="internet-facing", Type="application")
+
+    albs = ALBDiscoveryService(AWSClientFactory(), region="us-east-1").list_load_balancers(vpc_id, use_cache=False)
+
+    assert {alb.arn: [listener.port for listener in alb.listeners] for alb in albs} == {
+        arn: [port] for arn, port in ports.items()
+    }
+    for alb in albs:
+        [listener] = alb.listeners
+        assert listener.default_actions == [f"forward:{alb.target_groups[0].arn}"]
+
+
+@mock_aws
+def test_cloudfront_discovery_reads_list_summaries_without_detail_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    cloudfront = boto3.Session(region_name="us-east-1").client("cloudfront")
+    cloudfront.create_distribution(
+        DistributionConfig={
+            "CallerReference": "summary",
+            "Comment": "summary",
+            "Enabled": True,
+            "Origins": {
+                "Quantity": 1,
+                "Items": [
+                    {
+                        "Id": "origin-1",
+                        "DomainName": "origin.example.com",
+                        "CustomOriginConfig": {
+                            "HTTPPort": 80,
+                            "HTTPSPort": 443,
+                            "OriginProtocolPolicy": "http-only",
+                        },
+                    },
+                ],
+            },
+            "DefaultCacheBehavior": {
+                "TargetOriginId": "origin-1",
+                "ViewerProtocolPolicy": "redirect-to-https",
+                "ForwardedValues": {"QueryString": False, "Cookies": {"Forward": "none"}},
+                "MinTTL": 0,
+            },
+        },
+    )
+    service = CloudFrontDiscoveryService(AWSClientFactory(), region="us-east-1")
+
+    def no_detail_calls(**kwargs: object) -> None:
+        raise AssertionError("get_distribution called")
+
+    monkeypatch.setattr(service._cloudfront, "get_distribution", no_detail_calls)
+
+    [distribution] = service.list_distributions(use_cache=False)
+
+    assert distribution.origins == ["origin.example.com"]
+    assert distribution.default_cache_behavior["viewer_protocol_policy"] == "redirect-to-https"
+    assert distribution.enabled is True
+
+
+@mock_aws
+def test_cloudfront_discovery_fetches_missing_details_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    service = CloudFrontDiscoveryService(AWSClientFactory(), region="us-east-1")
+
+    class SparsePaginator:
+        def paginate(self) -> list[dict[str, object]]:
+            return [{"DistributionList": {"Items": [{"Id": "E1", "DomainName": "a"}, {"Id": "E2", "DomainName": "b"}]}}]
+
+    def get_distribution(Id: str) -> dict[str, object]:  # noqa: N803
+        barrier.wait()
+        origin = {"Quantity": 1, "Items": [{"Id": "o", "DomainName": f"{Id}.example.com"}]}
+        return {"Distribution": {"DistributionConfig": {"Origins": origin, "Enabled": False}}}
+
+    monkeypatch.setattr(service, "_distributions_paginator", SparsePaginator())
+    monkeypatch.setattr(service._cloudfront, "get_distribution", get_distribution)
+
+    distributions = service.list_distributions(use_cache=False)
+
+    assert not barrier.broken
+    assert [dist.origins for dist in distributions] == [["E1.example.com"], ["E2.example.com"]]
+    assert all(dist.enabled is False for dist in distributions)
+
+
+@mock_aws
+def test_efs_discovery_looks_up_mount_target_security_groups_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = boto3.Session(region_name="us-east-1")
+    ec2 = session.client("ec2")
+    efs_client = session.client("efs")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    fs_id = efs_client.create_file_system(CreationToken="sgs")["FileSystemId"]
+    expected = {}
+    for index, zone in enumerate("ab", start=1):
+        subnet_id = ec2.create_subnet(
+            VpcId=vpc_id, CidrBlock=f"10.0.{index}.0/24", AvailabilityZone=f"us-east-1{zone}"
+        )["Subnet"]["SubnetId"]
+        sg_id = ec2.create_security_group(GroupName=f"efs-{zone}", Description="efs", VpcId=vpc_id)["GroupId"]
+        efs_client.create_mount_target(FileSystemId=fs_id, SubnetId=subnet_id, SecurityGroups=[sg_id])
+        expected[subnet_id] = [sg_id]
+    service = EFSDiscoveryService(AWSClientFactory(), region="us-east-1")
+    barrier = threading.Barrier(2, timeout=5)
+    describe = service._efs.describe_mount_target_security_groups
+
+    def rendezvous(**kwargs: str) -> dict[str, object]:
+        barrier.wait()
+        return describe(**kwargs)
+
+    monkeypatch.setattr(service._efs, "describe_mount_target_security_groups", rendezvous)
+
+    [filesystem] = service.list_file_systems(use_cache=False)
+
+    assert not barrier.broken
+    assert {mt.subnet_id: mt.security_groups for mt in filesystem.mount_targets} == expected
+
+
+def test_tags_to_dict_flattens_tag_lists() -> None:
+    tags = [{"Key": "Name", "Value": "shared"}, {"Key": "env", "Value": ""}]
+
+    assert _tags_to_dict(tags) == {"Name": "shared", "env": ""}
+    assert _tags_to_dict(None) == {}
+    assert _tags_to_dict([]) == {}
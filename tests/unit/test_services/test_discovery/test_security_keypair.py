@@ -4,6 +4,7 @@ import boto3
 from moto import mock_aws
 
 from geusemaker.infra import AWSClientFactory
+from geusemaker.models.discovery import SecurityGroupInfo, SecurityGroupRule
 from geusemaker.services.discovery import (
     KeyPairDiscoveryService,
     SecurityGroupDiscoveryService,
@@ -53,3 +54,71 @@ def test_security_group_validation_and_keypair_discovery() -> None:
     key_service = KeyPairDiscoveryService(AWSClientFactory(), region="us-east-1")
     keys = key_service.list_key_pairs(use_cache=False)
     assert any(key.key_name == "demo-key" for key in keys)
+
+
+@mock_aws
+def test_security_group_validation_checks_ports_against_merged_ranges() -> None:
+    group = SecurityGroupInfo(
+        security_group_id="sg-1",
+        name="web",
+        description="web",
+        vpc_id="vpc-1",
+        ingress_rules=[
+            SecurityGroupRule(protocol="tcp", from_port=8000, to_port=8080),
+            SecurityGroupRule(protocol="udp", from_port=443, to_port=443),
+            SecurityGroupRule(protocol="tcp", from_port=8081, to_port=8090),
+            SecurityGroupRule(protocol="tcp", from_port=22, to_port=22),
+        ],
+        egress_rules=[],
+    )
+    service = SecurityGroupDiscoveryService(AWSClientFactory(), region="us-east-1")
+
+    assert service.validate_security_group(group, [22, 8000, 8085, 8090]).is_valid is True
+    missing = service.validate_security_group(group, [21, 443, 8091])
+    assert [issue.message.rsplit(" ", 1)[-1] for issue in missing.issues] == ["21", "443", "8091"]
+
+    group.ingress_rules.append(SecurityGroupRule(protocol="-1", from_port=None, to_port=None))
+    assert service.validate_security_group(group, [21, 443, 8091]).is_valid is True
+
+
+@mock_aws
+def test_parse_rules_collects_cidrs_and_first_range_description() -> None:
+    service = SecurityGroupDiscoveryService(AWSClientFactory(), region="us-east-1")
+
+    [rule] = service._parse_rules(
+        [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 443,
+                "ToPort": 443,
+                "IpRanges": [
+                    {"CidrIp": "10.0.0.0/16"},
+                    {"CidrIp": "10.1.0.0/16", "Description": "office"},
+                    {"CidrIp": "10.2.0.0/16", "Description": "vpn"},
+                ],
+                "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+                "UserIdGroupPairs": [{"GroupId": "sg-peer"}],
+            },
+        ],
+    )
+
+    assert rule.cidr_blocks == ["10.0.0.0/16", "10.1.0.0/16", "10.2.0.0/16", "::/0"]
+    assert rule.source_security_groups == ["sg-peer"]
+    assert rule.description == "office"
+
+
+@mock_aws
+def test_list_key_pairs_multi_lists_each_region() -> None:
+    boto3.Session(region_name="us-east-1").client("ec2").create_key_pair(KeyName="east-key")
+    boto3.Session(region_name="us-west-2").client("ec2").create_key_pair(KeyName="west-key")
+
+    pairs = KeyPairDiscoveryService.list_key_pairs_multi(
+        AWSClientFactory(),
+        ["us-east-1", "us-west-2", "us-east-1"],
+        use_cache=False,
+    )
+
+    assert {region: [pair.key_name for pair in region_pairs] for region, region_pairs in pairs.items()} == {
+        "us-east-1": ["east-key"],
+        "us-west-2": ["west-key"],
+    }
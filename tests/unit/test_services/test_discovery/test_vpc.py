@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
+
 import boto3
+import pytest
 from moto import mock_aws
 
 from geusemaker.infra import AWSClientFactory
-from geusemaker.services.discovery import VPCDiscoveryService
+from geusemaker.services.discovery import DiscoveryCache, VPCDiscoveryService
+from geusemaker.services.discovery.vpc import _routes_to_internet_gateway
 
 
 @mock_aws
@@ -46,3 +50,81 @@ def test_vpc_and_subnet_discovery_flags_internet_routing() -> None:
     subnet_validation = service.validate_subnets(subnets)
     assert subnet_validation.is_valid is True
     assert any(issue.level == "warning" for issue in subnet_validation.issues)
+
+
+@mock_aws
+def test_subnet_discovery_overlaps_route_table_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    ec2 = boto3.Session(region_name="us-east-1").client("ec2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    subnet_id = ec2.create_subnet(VpcId=vpc_id, CidrBlock="10.0.1.0/24")["Subnet"]["SubnetId"]
+    service = VPCDiscoveryService(AWSClientFactory(), region="us-east-1")
+    barrier = threading.Barrier(2, timeout=5)
+
+    for operation in ("describe_subnets", "describe_route_tables"):
+        original = getattr(service._ec2, operation)
+
+        def rendezvous(*, _original=original, **kwargs):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN003, ANN202
+            barrier.wait()
+            return _original(**kwargs)
+
+        monkeypatch.setattr(service._ec2, operation, rendezvous)
+
+    subnets = service.list_subnets(vpc_id, use_cache=False)
+
+    assert not barrier.broken
+    assert [subnet.subnet_id for subnet in subnets] == [subnet_id]
+    assert subnets[0].route_table_id is not None
+
+
+@mock_aws
+def test_vpc_discovery_overlaps_internet_gateway_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    ec2 = boto3.Session(region_name="us-east-1").client("ec2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    igw_id = ec2.create_internet_gateway()["InternetGateway"]["InternetGatewayId"]
+    ec2.attach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
+    service = VPCDiscoveryService(AWSClientFactory(), region="us-east-1")
+    barrier = threading.Barrier(2, timeout=5)
+
+    for operation in ("describe_vpcs", "describe_internet_gateways"):
+        original = getattr(service._ec2, operation)
+
+        def rendezvous(*, _original=original, **kwargs):  # type: ignore[no-untyped-def]  # noqa: ANN001, ANN003, ANN202
+            barrier.wait()
+            return _original(**kwargs)
+
+        monkeypatch.setattr(service._ec2, operation, rendezvous)
+
+    vpcs = {vpc.vpc_id: vpc for vpc in service.list_vpcs(use_cache=False)}
+
+    assert not barrier.broken
+    assert vpcs[vpc_id].has_internet_gateway is True
+
+
+@mock_aws
+def test_validate_vpc_reuses_cached_vpc_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    ec2 = boto3.Session(region_name="us-east-1").client("ec2")
+    vpc_id = ec2.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]["VpcId"]
+    service = VPCDiscoveryService(AWSClientFactory(), region="us-east-1", cache=DiscoveryCache())
+    calls: list[dict[str, object]] = []
+    describe_vpcs = service._ec2.describe_vpcs
+
+    def counting(**kwargs: object) -> dict[str, object]:
+        calls.append(kwargs)
+        return describe_vpcs(**kwargs)
+
+    monkeypatch.setattr(service._ec2, "describe_vpcs", counting)
+
+    assert [issue.message for issue in service.validate_vpc(vpc_id).issues] == ["VPC has no internet gateway attached"]
+    assert service.validate_vpc("vpc-missing").is_valid is False
+    assert len(calls) == 1
+
+
+def test_internet_gateway_routes_ignore_blackholes_and_other_targets() -> None:
+    local = {"DestinationCidrBlock": "10.0.0.0/16", "GatewayId": "local", "State": "active"}
+    nat = {"DestinationCidrBlock": "0.0.0.0/0", "NatGatewayId": "nat-1", "State": "active"}
+    blackhole = {"DestinationCidrBlock": "0.0.0.0/0", "GatewayId": "igw-1", "State": "blackhole"}
+    live = {"DestinationCidrBlock": "0.0.0.0/0", "GatewayId": "igw-1", "State": "active"}
+
+    assert _routes_to_internet_gateway([local, nat, blackhole]) is False
+    assert _routes_to_internet_gateway([local, live]) is True
+    assert _routes_to_internet_gateway([]) is False
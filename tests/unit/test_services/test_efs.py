@@ -142,3 +142,48 @@ def test_wait_for_mount_target_deleted_treats_mounttargetnotfound_as_success() -
 
     # Should not raise.
     svc.wait_for_mount_target_deleted("fsmt-does-not-exist", max_attempts=1, delay=0)
+
+
+def test_wait_for_mount_target_deleted_adaptive_polls_fast_then_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Adaptive polling checks every 2s for the first 30s, then every 10s."""
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("time.sleep", fake_sleep)
+    monkeypatch.setattr("time.monotonic", lambda: clock[0])
+
+    class DeletingEFSClient:
+        def __init__(self) -> None:
+            self.polls = 0
+
+        def describe_mount_targets(self, MountTargetId=None, FileSystemId=None):  # noqa: ANN001,N803,ARG002
+            self.polls += 1
+            state = "deleting" if self.polls <= 18 else "deleted"
+            return {"MountTargets": [{"MountTargetId": MountTargetId, "LifeCycleState": state}]}
+
+    svc = EFSService(AWSClientFactory(), region="us-east-1")
+    svc._efs = DeletingEFSClient()  # type: ignore[attr-defined]
+
+    svc.wait_for_mount_target_deleted("fsmt-1", delay=None)
+
+    assert sleeps == [2.0] * 15 + [10.0] * 3
+
+
+def test_wait_for_mount_target_deleted_adaptive_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr("time.sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+    monkeypatch.setattr("time.monotonic", lambda: clock[0])
+
+    class StuckEFSClient:
+        def describe_mount_targets(self, MountTargetId=None, FileSystemId=None):  # noqa: ANN001,N803,ARG002
+            return {"MountTargets": [{"MountTargetId": MountTargetId, "LifeCycleState": "deleting"}]}
+
+    svc = EFSService(AWSClientFactory(), region="us-east-1")
+    svc._efs = StuckEFSClient()  # type: ignore[attr-defined]
+
+    with pytest.raises(RuntimeError, match="did not delete within 60 seconds"):
+        svc.wait_for_mount_target_deleted("fsmt-1", delay=None, timeout_seconds=60)
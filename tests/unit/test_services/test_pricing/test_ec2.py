@@ -88,3 +88,40 @@ def test_spot_price_history_parsed() -> None:
     assert prices[0].availability_zone == "us-east-1a"
     assert prices[0].price_per_hour == Decimal("0.0125")
     assert ec2_client.calls == 1
+
+
+def test_list_prices_outlive_the_spot_price_ttl() -> None:
+    pricing_client = FakePricingClient()
+    ec2_client = FakeEC2Client()
+    factory = FakeFactory(pricing_client, ec2_client)
+    cache = PricingCache(ttl_seconds=0)
+    service = EC2PricingService(factory, cache=cache, pricing_client=pricing_client, ec2_client=ec2_client)
+
+    service.get_on_demand_price("t3.medium", "us-east-1")
+    service.get_on_demand_price("t3.medium", "us-east-1")
+    service.get_spot_prices("t3.medium", "us-east-1")
+    service.get_spot_prices("t3.medium", "us-east-1")
+
+    assert pricing_client.calls == 1
+    assert ec2_client.calls == 2
+
+
+def test_ec2_client_is_resolved_once_per_region() -> None:
+    class CountingFactory(FakeFactory):
+        def __init__(self) -> None:
+            super().__init__(FakePricingClient(), FakeEC2Client())
+            self.ec2_lookups: list[str] = []
+
+        def get_client(self, service_name: str, region: str = "us-east-1") -> object:
+            if service_name == "ec2":
+                self.ec2_lookups.append(region)
+            return super().get_client(service_name, region)
+
+    factory = CountingFactory()
+    service = EC2PricingService(factory, cache=PricingCache(ttl_seconds=0))
+
+    for _ in range(3):
+        service.get_spot_prices("t3.medium", "us-east-1")
+    service.get_spot_prices("t3.medium", "us-west-2")
+
+    assert factory.ec2_lookups == ["us-east-1", "us-west-2"]